@@ -32,8 +32,18 @@ setup(
         "python-dateutil>=2.8.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.9.0",
+        ],
+        "msgpack": [
+            "msgpack>=1.0.0",
+        ],
+        "windows": [
+            "pywin32>=306; sys_platform == 'win32'",
+        ],
         "dev": [
             "pytest>=7.4.0",
+            "pytest-xdist>=3.5.0",
             "black>=23.0.0",
             "ruff>=0.1.0",
             "mypy>=1.7.0",
@@ -75,8 +75,7 @@ def collect(repo, since, until, author, branch, save, include_diffs):
             return
         
         # Enrich commits with parsed metadata
-        for commit in commits:
-            parser.enrich_commit(commit)
+        parser.enrich_commits(commits)
         
         click.echo(f"✅ Found {len(commits)} commits")
         
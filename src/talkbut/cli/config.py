@@ -4,7 +4,7 @@ Config command - จัดการ configuration
 import click
 import os
 from pathlib import Path
-from talkbut.core.config import ConfigManager
+from talkbut.core.config import get_config
 from talkbut.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -23,7 +23,7 @@ def show_config():
         talkbut config show
     """
     try:
-        cfg = ConfigManager()
+        cfg = get_config()
         
         click.echo("⚙️  Current Configuration:")
         click.echo("")
@@ -150,7 +150,7 @@ def check_config():
         click.echo("🔍 Checking configuration...")
         click.echo("")
         
-        cfg = ConfigManager()
+        cfg = get_config()
         issues = []
         
         # Check API key
@@ -3,9 +3,10 @@ Log command - รวม collect และ analyze เป็นคำสั่ง
 """
 import click
 import json
+from operator import attrgetter
 from datetime import datetime
 from pathlib import Path
-from talkbut.collectors.git_collector import GitCollector
+from talkbut.collectors.git_collector import collect_from_repos, merged_commits
 from talkbut.collectors.parser import DataParser
 from talkbut.processors.ai_analyzer import AIAnalyzer
 from talkbut.processors.batch_processor import BatchProcessor
@@ -15,7 +16,9 @@ from talkbut.processors.batch_display import (
     display_batch_summary
 )
 from talkbut.processors.batch_utils import expand_date_range
-from talkbut.core.config import ConfigManager
+from talkbut.cli.repo_display import display_repo_results
+from talkbut.core.config import get_config
+from talkbut.storage.daily_logs import find_daily_log, resolve_format, write_daily_log
 from talkbut.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -74,7 +77,7 @@ def log(repo, since, until, author, branch, include_diffs, unsave, force, batch)
     """เก็บ commits + วิเคราะห์ AI + บันทึก JSON"""
     try:
         # Load config
-        config = ConfigManager()
+        config = get_config()
         
         # Use author from config if not specified via CLI
         if author is None:
@@ -154,52 +157,33 @@ def log(repo, since, until, author, branch, include_diffs, unsave, force, batch)
         if author:
             click.echo(f"   Author: {author}")
         
-        # Collect commits from all repositories
-        all_commits = []
+        # Collect commits from all repositories (one git process per repo,
+        # run concurrently)
         parser = DataParser()
+        results = collect_from_repos(
+            repos_to_process,
+            since=since,
+            until=until,
+            author=author,
+            branch=branch,
+            include_diffs=include_diffs
+        )
         
-        for repo_info in repos_to_process:
-            repo_path = repo_info.get('path', '.')
-            repo_name = repo_info.get('name', repo_path)
-            
-            try:
-                click.echo(f"\n   Processing: {repo_name}...")
-                collector = GitCollector(repo_path)
-                
-                commits = collector.collect_commits(
-                    since=since,
-                    until=until,
-                    author=author,
-                    branch=branch,
-                    include_diffs=include_diffs
-                )
-                
-                if commits:
-                    click.echo(f"   ✓ Found {len(commits)} commits")
-                    # Add repo_name to each commit
-                    for c in commits:
-                        c.repo_name = repo_name
-                    all_commits.extend(commits)
-                else:
-                    click.echo(f"   ⚠ No commits found")
-                    
-            except Exception as e:
-                click.echo(f"   ✗ Error: {e}")
-                logger.warning(f"Failed to collect from {repo_name}: {e}")
+        # Report per repo, in config order
+        display_repo_results(results, spaced=True)
         
         # Use collected commits
-        commits = all_commits
+        commits = merged_commits(results)
         
         if not commits:
             click.echo("\n⚠️  No commits found in the specified range.")
             return
         
         # Sort commits by date (newest first)
-        commits.sort(key=lambda c: c.date, reverse=True)
+        commits.sort(key=attrgetter("date"), reverse=True)
         
         # Enrich commits with parsed metadata
-        for commit in commits:
-            parser.enrich_commit(commit)
+        parser.enrich_commits(commits)
         
         click.echo(f"\n✅ Total: {len(commits)} commits from {len(repos_to_process)} repository(ies)")
         
@@ -216,6 +200,7 @@ def log(repo, since, until, author, branch, include_diffs, unsave, force, batch)
         analyzer = AIAnalyzer()
         output_dir = Path("data/logs")
         output_dir.mkdir(parents=True, exist_ok=True)
+        log_format = resolve_format(config.get("storage.format", "json"))
         
         all_daily_logs = []
         
@@ -241,27 +226,20 @@ def log(repo, since, until, author, branch, include_diffs, unsave, force, batch)
             
             all_daily_logs.append(daily_log)
             
-            # Format JSON (always compact)
-            json_output = json.dumps(daily_log, ensure_ascii=False, separators=(',', ':'))
-            
             # Output
             if unsave:
-                # Display only, do not save
+                # Display only, do not save (JSON, always compact)
+                json_output = json.dumps(daily_log, ensure_ascii=False, separators=(',', ':'))
                 click.echo(f"\n📋 Daily Log ({report_date.isoformat()}):")
                 click.echo(json_output)
             else:
-                # Save to file automatically
-                filename = f"daily_log_{report_date.isoformat()}.json"
-                output_path = output_dir / filename
-                
-                # Remove old file if exists (no prompt)
-                if output_path.exists():
-                    output_path.unlink()
-                    click.echo(f"   🗑️  Removed old file: {output_path}")
+                # Save to file automatically; overwrite old file if exists (no prompt)
+                old_path = find_daily_log(output_dir, report_date)
+                if old_path:
+                    click.echo(f"   🗑️  Replacing old file: {old_path}")
                 
-                # Save new file
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(json_output)
+                # Save new file (atomically, in the configured storage format)
+                output_path = write_daily_log(output_dir, report_date, daily_log, log_format)
                 click.echo(f"   💾 Saved: {output_path}")
         
         # Show summary
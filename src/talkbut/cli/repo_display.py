@@ -0,0 +1,29 @@
+"""
+Per-repository output for commands that collect from several repos.
+"""
+import click
+from typing import Dict
+from talkbut.collectors.git_collector import RepoCommits
+from talkbut.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def display_repo_results(results: Dict[str, RepoCommits], spaced: bool = False):
+    """
+    Display what was collected from each repository, in collection order.
+
+    Args:
+        results: Result of collect_from_repos (repo path -> RepoCommits)
+        spaced: Put a blank line before each repository
+    """
+    prefix = "\n" if spaced else ""
+    for result in results.values():
+        click.echo(f"{prefix}   Processing: {result.name}...")
+        if result.error is not None:
+            click.echo(f"   ✗ Error: {result.error}")
+            logger.warning(f"Failed to collect from {result.name}: {result.error}")
+        elif result.commits:
+            click.echo(f"   ✓ Found {len(result.commits)} commits")
+        else:
+            click.echo(f"   ⚠ No commits found")
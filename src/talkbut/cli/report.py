@@ -3,20 +3,36 @@ Report command - สร้างรายงานสรุปจาก daily lo
 """
 import click
 import json
+import re
+import unicodedata
+from operator import attrgetter
 from datetime import datetime, date, timedelta
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
 import google.generativeai as genai
 
-from talkbut.core.config import ConfigManager
+from talkbut.core.config import get_config
+from talkbut.utils.json_utils import dumps
 from talkbut.utils.logger import get_logger
-from talkbut.collectors.git_collector import GitCollector
+from talkbut.collectors.git_collector import collect_from_repos, merged_commits
+from talkbut.cli.repo_display import display_repo_results
+from talkbut.storage.daily_logs import list_daily_logs, read_daily_log
 
 logger = get_logger(__name__)
 
 MAX_DAYS = 30  # Maximum days allowed for report
 
+# Trailing comma before } or ] - a common defect in AI-generated JSON
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+
+# ASCII characters _safe_name drops (or, for space, rewrites); one C-level
+# str.translate pass instead of a per-character generator
+_FILENAME_TABLE = {
+    i: None for i in range(128) if not (chr(i).isalnum() or chr(i) in "-_")
+}
+_FILENAME_TABLE[ord(" ")] = "_"
+
 
 @click.command()
 @click.option(
@@ -109,7 +125,7 @@ def report(days, start, end, format, unsave, fast):
         
         # Format output
         if format == 'json':
-            content = json.dumps(report_data, ensure_ascii=False, indent=2)
+            content = dumps(report_data, indent=True)
         elif format == 'text':
             content = _format_text(report_data)
         else:  # markdown
@@ -130,10 +146,9 @@ def report(days, start, end, format, unsave, fast):
             
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Remove old file if exists
+            # 'w' truncates in place, so an old file only needs a notice
             if output_path.exists():
-                output_path.unlink()
-                click.echo(f"🗑️  Removed old file: {output_path}")
+                click.echo(f"🗑️  Replacing old file: {output_path}")
             
             with open(output_path, 'w', encoding='utf-8') as f:
                 f.write(content)
@@ -151,7 +166,7 @@ def report(days, start, end, format, unsave, fast):
 
 def _handle_ytd_report(format: str, unsave: bool):
     """Handle Year-to-Date report by analyzing month by month."""
-    config = ConfigManager()
+    config = get_config()
     
     # Calculate YTD range
     today = date.today()
@@ -191,31 +206,20 @@ def _handle_ytd_report(format: str, unsave: bool):
         month_name = current_month_start.strftime("%B %Y")
         click.echo(f"\n📅 Processing: {month_name} ({current_month_start} to {month_end})")
         
-        # Collect commits for this month
-        all_commits = []
-        for repo_info in repos:
-            repo_path = repo_info.get('path', '.')
-            repo_name = repo_info.get('name', repo_path)
-            
-            try:
-                collector = GitCollector(repo_path)
-                commits = collector.collect_commits(
-                    since=current_month_start.isoformat(),
-                    until=month_end.isoformat(),
-                    author=author,
-                    include_diffs=False
-                )
-                
-                if commits:
-                    for c in commits:
-                        c.repo_name = repo_name
-                    all_commits.extend(commits)
-                    
-            except Exception as e:
-                logger.warning(f"Failed to collect from {repo_name}: {e}")
+        # Collect commits for this month from all repos concurrently
+        results = collect_from_repos(
+            repos,
+            since=current_month_start.isoformat(),
+            until=month_end.isoformat(),
+            author=author
+        )
+        for result in results.values():
+            if result.error is not None:
+                logger.warning(f"Failed to collect from {result.name}: {result.error}")
+        all_commits = merged_commits(results)
         
         if all_commits:
-            all_commits.sort(key=lambda c: c.date)
+            all_commits.sort(key=attrgetter("date"))
             click.echo(f"   ✓ Found {len(all_commits)} commits")
             
             # Generate report for this month
@@ -251,7 +255,7 @@ def _handle_ytd_report(format: str, unsave: bool):
     
     # Format output
     if format == 'json':
-        content = json.dumps(ytd_report, ensure_ascii=False, indent=2)
+        content = dumps(ytd_report, indent=True)
     elif format == 'text':
         content = _format_text(ytd_report)
     else:  # markdown
@@ -270,9 +274,9 @@ def _handle_ytd_report(format: str, unsave: bool):
         
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
+        # 'w' truncates in place, so an old file only needs a notice
         if output_path.exists():
-            output_path.unlink()
-            click.echo(f"🗑️  Removed old file: {output_path}")
+            click.echo(f"🗑️  Replacing old file: {output_path}")
         
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(content)
@@ -282,7 +286,7 @@ def _handle_ytd_report(format: str, unsave: bool):
 
 def _handle_fast_report(since: str, format: str, unsave: bool):
     """Handle fast report generation by collecting commits directly."""
-    config = ConfigManager()
+    config = get_config()
     
     click.echo(f"⚡ Fast mode: Generating report for the last {since}")
     click.echo("📝 This will collect commits directly without using daily logs")
@@ -302,40 +306,18 @@ def _handle_fast_report(since: str, format: str, unsave: bool):
     
     # Collect commits from all repositories
     click.echo(f"\n🔍 Collecting commits since {since}...")
-    all_commits = []
+    results = collect_from_repos(repos, since=since, author=author)
     
-    for repo_info in repos:
-        repo_path = repo_info.get('path', '.')
-        repo_name = repo_info.get('name', repo_path)
-        
-        try:
-            click.echo(f"   Processing: {repo_name}...")
-            collector = GitCollector(repo_path)
-            
-            commits = collector.collect_commits(
-                since=since,
-                author=author,
-                include_diffs=False
-            )
-            
-            if commits:
-                click.echo(f"   ✓ Found {len(commits)} commits")
-                for c in commits:
-                    c.repo_name = repo_name
-                all_commits.extend(commits)
-            else:
-                click.echo(f"   ⚠ No commits found")
-                
-        except Exception as e:
-            click.echo(f"   ✗ Error: {e}")
-            logger.warning(f"Failed to collect from {repo_name}: {e}")
+    # Report per repo, in config order
+    display_repo_results(results)
+    all_commits = merged_commits(results)
     
     if not all_commits:
         click.echo("\n⚠️  No commits found in the specified range.")
         return
     
     # Sort commits by date
-    all_commits.sort(key=lambda c: c.date)
+    all_commits.sort(key=attrgetter("date"))
     
     click.echo(f"\n✅ Total: {len(all_commits)} commits")
     
@@ -356,7 +338,7 @@ def _handle_fast_report(since: str, format: str, unsave: bool):
     
     # Format output
     if format == 'json':
-        content = json.dumps(report_data, ensure_ascii=False, indent=2)
+        content = dumps(report_data, indent=True)
     elif format == 'text':
         content = _format_text(report_data)
     else:  # markdown
@@ -370,14 +352,14 @@ def _handle_fast_report(since: str, format: str, unsave: bool):
     else:
         ext_map = {'markdown': 'md', 'json': 'json', 'text': 'txt'}
         ext = ext_map.get(format, 'md')
-        filename = f"report_fast_{since.replace(' ', '_')}_{end_date.isoformat()}.{ext}"
+        filename = f"report_fast_{_safe_name(since)}_{end_date.isoformat()}.{ext}"
         output_path = Path("data/reports") / filename
         
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
+        # 'w' truncates in place, so an old file only needs a notice
         if output_path.exists():
-            output_path.unlink()
-            click.echo(f"🗑️  Removed old file: {output_path}")
+            click.echo(f"🗑️  Replacing old file: {output_path}")
         
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(content)
@@ -387,7 +369,7 @@ def _handle_fast_report(since: str, format: str, unsave: bool):
 
 def _generate_fast_report(commits: List, start_date: date, end_date: date, period: str) -> Optional[Dict]:
     """Generate report from commits using AI (single pass)."""
-    config = ConfigManager()
+    config = get_config()
     api_key = config.ai_api_key
     
     if not api_key:
@@ -532,9 +514,8 @@ Commits (ทั้งหมด {total_commits} commits จัดกลุ่ม
             logger.error(f"JSON parse error: {json_err}")
             logger.error(f"AI response (first 500 chars): {ai_text[:500]}")
             # Try to fix common JSON issues
-            import re
             # Remove trailing commas before } or ]
-            ai_text_fixed = re.sub(r',(\s*[}\]])', r'\1', ai_text)
+            ai_text_fixed = _TRAILING_COMMA_RE.sub(r'\1', ai_text)
             try:
                 return json.loads(ai_text_fixed)
             except:
@@ -776,6 +757,21 @@ def _format_ytd_markdown(ytd_report: Dict, monthly_reports: List[Dict]) -> str:
     return "\n".join(md)
 
 
+def _safe_name(text: str) -> str:
+    """
+    Reduce free-form text (e.g. a --fast period like "2 weeks ago") to a file name part.
+    
+    Spaces become underscores; anything but letters, digits, '-' and '_' is
+    dropped, so values such as "2024/01/01" cannot escape data/reports.
+    """
+    name = text.translate(_FILENAME_TABLE)
+    if name.isascii():
+        return name
+    # Non-ASCII letters, digits and marks (Thai vowel signs) are kept;
+    # other symbols still go
+    return "".join(c for c in name if c in "-_" or unicodedata.category(c)[0] in "LNM")
+
+
 def _parse_date(date_str: str) -> date:
     """Parse date string to date object."""
     date_str = date_str.lower().strip()
@@ -793,24 +789,23 @@ def _parse_date(date_str: str) -> date:
 
 def _load_daily_logs(start_date: date, end_date: date) -> List[Dict[str, Any]]:
     """Load daily logs from files within date range."""
-    logs_dir = Path("data/logs")
+    # One directory listing instead of a stat per date and format
+    available = list_daily_logs(Path("data/logs"))
     daily_logs = []
     
-    if not logs_dir.exists():
+    if not available:
         return []
     
     current_date = start_date
     while current_date <= end_date:
-        filename = f"daily_log_{current_date.isoformat()}.json"
-        filepath = logs_dir / filename
+        # JSON or msgpack, whichever storage.format wrote
+        filepath = available.get(current_date.isoformat())
         
-        if filepath.exists():
+        if filepath is not None:
             try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    log_data = json.load(f)
-                    daily_logs.append(log_data)
+                daily_logs.append(read_daily_log(filepath))
             except Exception as e:
-                logger.warning(f"Failed to load {filename}: {e}")
+                logger.warning(f"Failed to load {filepath.name}: {e}")
         
         current_date += timedelta(days=1)
     
@@ -819,7 +814,7 @@ def _load_daily_logs(start_date: date, end_date: date) -> List[Dict[str, Any]]:
 
 def _generate_report(daily_logs: List[Dict], start_date: date, end_date: date) -> Optional[Dict]:
     """Generate report using AI."""
-    config = ConfigManager()
+    config = get_config()
     api_key = config.ai_api_key
     
     if not api_key:
@@ -4,7 +4,7 @@ TalkBut CLI - Scan command for discovering git repositories
 import click
 from talkbut.utils.logger import get_logger
 from talkbut.collectors.repo_scanner import RepoScanner
-from talkbut.core.config import ConfigManager
+from talkbut.core.config import get_config
 
 logger = get_logger(__name__)
 
@@ -40,7 +40,7 @@ def scan(path, depth, config_paths):
     
     if config_paths:
         # Use paths from config
-        config = ConfigManager()
+        config = get_config()
         scan_paths = config.get("git.scan_paths", [])
         scan_depth = config.get("git.scan_depth", depth)
         
@@ -4,7 +4,7 @@ TalkBut CLI - Schedule commands for automated daily logging
 import click
 from pathlib import Path
 
-from talkbut.core.config import ConfigManager
+from talkbut.core.config import get_config
 from talkbut.scheduling.scheduler_manager import SchedulerManager
 from talkbut.scheduling.status_manager import StatusManager
 from talkbut.scheduling.status_display import display_status
@@ -51,7 +51,7 @@ def enable(time):
         raise click.Abort()
     
     # Load configuration
-    config = ConfigManager()
+    config = get_config()
     schedule_config = config.get_schedule_config()
     
     # Initialize status manager
@@ -106,7 +106,7 @@ def disable():
     Requirements: 2.3
     """
     # Load configuration
-    config = ConfigManager()
+    config = get_config()
     schedule_config = config.get_schedule_config()
     
     # Initialize status manager
@@ -152,7 +152,7 @@ def status():
     Requirements: 2.4, 4.1, 4.2, 4.3, 4.4, 4.5
     """
     # Load configuration
-    config = ConfigManager()
+    config = get_config()
     schedule_config = config.get_schedule_config()
     
     # Initialize status manager
@@ -187,7 +187,7 @@ def update(time):
         raise click.Abort()
     
     # Load configuration
-    config = ConfigManager()
+    config = get_config()
     schedule_config = config.get_schedule_config()
     
     # Initialize status manager
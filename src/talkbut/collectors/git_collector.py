@@ -1,6 +1,10 @@
 import git
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 from pathlib import Path
 from talkbut.models.commit import Commit
 from talkbut.utils.logger import get_logger
@@ -14,6 +18,10 @@ class GitCollector:
             self.repo = git.Repo(self.repo_path)
         except git.InvalidGitRepositoryError:
             raise ValueError(f"Invalid git repository: {self.repo_path}")
+        # git.Repo keeps persistent cat-file processes that must not be
+        # driven from two threads at once, so calls on one collector are
+        # serialised; different repos still run in parallel
+        self._lock = threading.Lock()
 
     def collect_commits(
         self,
@@ -26,12 +34,26 @@ class GitCollector:
         """
         Collect commits using git log command.
         
+        Safe to call from several threads on the same instance.
+        
         Args:
             since: Start date/time (e.g. "1 day ago", "2023-01-01")
             until: End date/time
             author: Filter by author email or name
             branch: Filter by branch (default: current branch)
         """
+        with self._lock:
+            return self._collect_commits(since, until, author, branch, include_diffs)
+
+    def _collect_commits(
+        self,
+        since: Union[str, datetime],
+        until: Union[str, datetime, None],
+        author: Optional[str],
+        branch: Optional[str],
+        include_diffs: bool
+    ) -> List[Commit]:
+        """Collect commits; callers must hold self._lock."""
         commits = []
         
         # Build git log arguments
@@ -84,7 +106,16 @@ class GitCollector:
                 no_merges=True
             )
 
+            # Authors, emails and the branch repeat across every commit of a
+            # repo; interning stores each distinct value once. The branch is
+            # resolved on the first commit instead of re-reading HEAD per commit
+            intern = sys.intern
+            branch_name = None
+            
             for c in commits_iter:
+                if branch_name is None:
+                    branch_name = intern(branch or self.repo.active_branch.name)
+                
                 # Get stats
                 stats = c.stats.total
                 files_changed = list(c.stats.files.keys())
@@ -106,14 +137,14 @@ class GitCollector:
                 
                 commit = Commit(
                     hash=c.hexsha,
-                    author=c.author.name,
-                    email=c.author.email,
+                    author=intern(c.author.name),
+                    email=intern(c.author.email),
                     date=c.committed_datetime,
                     message=c.message.strip(),
                     files_changed=files_changed,
                     insertions=stats.get('insertions', 0),
                     deletions=stats.get('deletions', 0),
-                    branch=branch or self.repo.active_branch.name,
+                    branch=branch_name,
                     file_diffs=file_diffs
                 )
                 commits.append(commit)
@@ -126,3 +157,79 @@ class GitCollector:
 
     def get_current_branch(self) -> str:
         return self.repo.active_branch.name
+
+
+@dataclass
+class RepoCommits:
+    """Outcome of collecting one repository."""
+    name: str
+    commits: List[Commit] = field(default_factory=list)
+    error: Optional[Exception] = None
+
+
+def merged_commits(results: Dict[str, RepoCommits]) -> List[Commit]:
+    """All commits of a collect_from_repos result, in repo order."""
+    return [c for result in results.values() for c in result.commits]
+
+
+def collect_from_repos(
+    repos: List[Dict[str, str]],
+    since: Union[str, datetime],
+    until: Union[str, datetime, None] = None,
+    author: Optional[str] = None,
+    collector_factory: Callable[[str], GitCollector] = GitCollector,
+    max_workers: int = 16,
+    branch: Optional[str] = None,
+    include_diffs: bool = False
+) -> Dict[str, RepoCommits]:
+    """
+    Collect commits from several repositories concurrently.
+    
+    Each repository is an independent git subprocess, so repos are collected
+    in a thread pool. A failing repo does not stop the others; its error is
+    returned instead of raised.
+    
+    Args:
+        repos: Repository dicts with 'path' and optional 'name' keys
+        since: Start date/time passed to collect_commits
+        until: End date/time passed to collect_commits
+        author: Filter by author email or name
+        collector_factory: Callable returning a GitCollector for a repo path
+        max_workers: Upper bound on concurrent git processes
+        branch: Branch to collect from (default: current branch)
+        include_diffs: Whether to include file diffs
+        
+    Returns:
+        Repo path -> RepoCommits, in the order of repos. Results are keyed by
+        path because scanned repos may share a name (e.g. work/api and
+        personal/api); commits are tagged with their repo_name.
+    """
+    def collect_one(repo_path: str) -> RepoCommits:
+        repo_name = names[repo_path]
+        try:
+            commits = collector_factory(repo_path).collect_commits(
+                since=since,
+                until=until,
+                author=author,
+                branch=branch,
+                include_diffs=include_diffs
+            )
+        except Exception as e:
+            return RepoCommits(repo_name, error=e)
+        
+        # Add repo_name to each commit
+        for c in commits:
+            c.repo_name = repo_name
+        return RepoCommits(repo_name, commits)
+    
+    # A repo listed twice is collected once
+    names: Dict[str, str] = {}
+    for repo_info in repos:
+        repo_path = repo_info.get('path', '.')
+        names.setdefault(repo_path, repo_info.get('name', repo_path))
+    if not names:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=min(len(names), max_workers)) as executor:
+        # map() keeps repo order, so the merged list is deterministic
+        return dict(zip(names, executor.map(collect_one, names)))
@@ -2,6 +2,11 @@ import re
 from typing import List, Dict, Any
 from talkbut.models.commit import Commit
 
+# Ticket refs (e.g., JIRA-123, #456) and subject tags (e.g., [FEATURE])
+_TICKET_RE = re.compile(r'([A-Z]+-\d+|#\d+)')
+_TAG_RE = re.compile(r'\[([A-Z_]+)\]')
+
+
 class DataParser:
     def __init__(self):
         pass
@@ -13,10 +18,10 @@ class DataParser:
         body = '\n'.join(lines[1:]).strip() if len(lines) > 1 else ""
 
         # Extract ticket refs (e.g., JIRA-123, #456)
-        ticket_refs = re.findall(r'([A-Z]+-\d+|#\d+)', message)
+        ticket_refs = _TICKET_RE.findall(message)
         
         # Extract tags (e.g., [FEATURE], [BUGFIX])
-        tags = re.findall(r'\[([A-Z_]+)\]', subject)
+        tags = _TAG_RE.findall(subject)
 
         return {
             "subject": subject,
@@ -50,3 +55,24 @@ class DataParser:
         commit.ticket_refs = parsed['ticket_refs']
         commit.tags = parsed['tags']
         return commit
+
+    def enrich_commits(self, commits: List[Commit]) -> List[Commit]:
+        """
+        Enrich many commits in place (same result as enrich_commit on each).
+        
+        Only the ticket refs and tags are extracted, without building the
+        subject/body dict per commit, and the regex methods are bound once.
+        
+        Args:
+            commits: Commits to update
+            
+        Returns:
+            The same list, for chaining
+        """
+        find_tickets = _TICKET_RE.findall
+        find_tags = _TAG_RE.findall
+        for commit in commits:
+            message = commit.message
+            commit.ticket_refs = list(set(find_tickets(message)))
+            commit.tags = list(set(find_tags(message.split('\n', 1)[0])))
+        return commits
@@ -2,8 +2,13 @@
 Repository Scanner - Automatically discover git repositories under specified paths.
 """
 import os
-from pathlib import Path
-from typing import List, Dict, Optional, Set
+import stat
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Dict, Optional, Set, FrozenSet
+from talkbut.utils.file_utils import atomic_write_bytes
+from talkbut.utils.json_utils import dumps_bytes, loads
 from talkbut.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -12,18 +17,23 @@ logger = get_logger(__name__)
 class RepoScanner:
     """Scan directories to find git repositories."""
     
-    def __init__(self, max_depth: int = 3):
+    def __init__(self, max_depth: int = 3, cache_file: Optional[str] = None):
         """
         Initialize RepoScanner.
         
         Args:
             max_depth: Maximum directory depth to search (default: 3)
+            cache_file: JSON file to persist scan results in (default: no cache)
         """
         self.max_depth = max_depth
-        self._exclude_dirs: Set[str] = {
+        self.cache_file = cache_file
+        self._cache: Optional[Dict[str, Any]] = None
+        self._cache_dirty = False
+        self._cache_lock = threading.Lock()
+        self._exclude_dirs: FrozenSet[str] = frozenset({
             'node_modules', 'venv', '.venv', '__pycache__', 
             'dist', 'build', '.git', 'vendor', 'target'
-        }
+        })
     
     def scan(self, base_path: str, max_depth: Optional[int] = None) -> List[Dict[str, str]]:
         """
@@ -36,72 +46,113 @@ class RepoScanner:
         Returns:
             List of dicts with 'path' and 'name' keys for each found repo
         """
-        base = Path(base_path).expanduser().resolve()
+        repos = self._scan_root(base_path, max_depth)
+        self._save_cache()
+        return repos
+    
+    def _scan_root(self, base_path: str, max_depth: Optional[int]) -> List[Dict[str, str]]:
+        """Scan one base path, reusing a cached result when it is still valid."""
+        base = os.path.realpath(os.path.expanduser(base_path))
         
-        if not base.exists():
+        if not os.path.exists(base):
             logger.warning(f"Scan path does not exist: {base_path}")
             return []
         
-        if not base.is_dir():
+        if not os.path.isdir(base):
             logger.warning(f"Scan path is not a directory: {base_path}")
             return []
         
         depth = max_depth if max_depth is not None else self.max_depth
-        repos = []
         
-        self._scan_recursive(base, repos, current_depth=0, max_depth=depth)
+        cached = self._get_cached(base, depth)
+        if cached is not None:
+            logger.debug(f"Using cached scan result for {base_path}")
+            return cached
+        
+        repos: List[Dict[str, str]] = []
+        mtimes: Optional[Dict[str, int]] = {} if self.cache_file else None
+        self._scan_tree(base, repos, max_depth=depth, mtimes=mtimes)
+        self._put_cached(base, depth, repos, mtimes)
         
         logger.info(f"Found {len(repos)} git repositories under {base_path}")
         return repos
     
-    def _scan_recursive(
+    def _scan_tree(
         self, 
-        path: Path, 
+        base: str, 
         repos: List[Dict[str, str]], 
-        current_depth: int,
-        max_depth: int
-    ) -> bool:
+        max_depth: int,
+        mtimes: Optional[Dict[str, int]] = None
+    ) -> None:
         """
-        Recursively scan for git repositories.
+        Walk the tree under base breadth-first and collect git repositories.
+        
+        Uses an explicit queue instead of recursion, so deep trees cannot hit
+        the recursion limit and no Python frame is pushed per directory.
         
         Args:
-            path: Current directory path
+            base: Directory path to start from (plain string)
             repos: List to append found repos
-            current_depth: Current recursion depth
             max_depth: Maximum depth to search
-            
-        Returns:
-            True if this path is a git repo (to stop deeper scanning)
+            mtimes: If given, filled with the st_mtime_ns of every directory
+                    that was searched (but is not itself a repo)
         """
-        if current_depth > max_depth:
-            return False
-        
-        # Check if this directory is a git repository
-        git_dir = path / '.git'
-        if git_dir.exists() and git_dir.is_dir():
-            repo_info = {
-                'path': str(path),
-                'name': path.name
-            }
-            repos.append(repo_info)
-            logger.debug(f"Found git repository: {path.name}")
-            # Don't scan inside git repos (nested repos are rare and usually submodules)
-            return True
+        exclude = self._exclude_dirs
+        queue = deque([(base, 0)])
         
-        # Scan subdirectories
-        try:
-            for entry in path.iterdir():
-                if entry.is_dir() and entry.name not in self._exclude_dirs:
-                    # Skip hidden directories except we already checked .git
-                    if entry.name.startswith('.'):
-                        continue
-                    self._scan_recursive(entry, repos, current_depth + 1, max_depth)
-        except PermissionError:
-            logger.debug(f"Permission denied: {path}")
-        except OSError as e:
-            logger.debug(f"Error scanning {path}: {e}")
-        
-        return False
+        while queue:
+            path, depth = queue.popleft()
+            
+            # Check if this directory is a git repository with a single lstat,
+            # before paying for a listing of what may be a large working tree.
+            # A .git *file* (worktree or submodule checkout, containing a
+            # "gitdir:" pointer) marks a repository just like a .git directory.
+            try:
+                mode = os.lstat(path + os.sep + '.git').st_mode
+                is_repo = stat.S_ISDIR(mode) or stat.S_ISREG(mode)
+            except OSError:
+                is_repo = False
+            
+            if is_repo:
+                name = os.path.basename(path)
+                repos.append({
+                    'path': path,
+                    'name': name
+                })
+                logger.debug(f"Found git repository: {name}")
+                # Don't scan inside git repos (nested repos are rare and usually submodules)
+                continue
+            
+            # Record the mtime before listing, so an entry created while the
+            # listing runs still invalidates the cached result
+            if mtimes is not None:
+                try:
+                    mtimes[path] = os.stat(path).st_mtime_ns
+                except OSError:
+                    pass
+            
+            if depth >= max_depth:
+                continue
+            
+            # Queue subdirectories; DirEntry caches the file type from readdir,
+            # so filtering needs no extra stat calls
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        name = entry.name
+                        # Skip hidden directories (we already checked .git) and excluded names
+                        if not name or name[0] == '.' or name in exclude:
+                            continue
+                        try:
+                            if not entry.is_dir(follow_symlinks=False):
+                                continue
+                        except OSError:
+                            continue
+                        queue.append((entry.path, depth + 1))
+            except PermissionError:
+                logger.debug(f"Permission denied: {path}")
+            except OSError as e:
+                logger.debug(f"Error scanning {path}: {e}")
     
     def scan_multiple(self, paths: List[str], max_depth: Optional[int] = None) -> List[Dict[str, str]]:
         """
@@ -117,11 +168,106 @@ class RepoScanner:
         seen_paths: Set[str] = set()
         all_repos: List[Dict[str, str]] = []
         
-        for base_path in paths:
-            repos = self.scan(base_path, max_depth)
+        if not paths:
+            return all_repos
+        
+        # Scanning is syscall-bound, so independent roots can be walked in
+        # parallel threads. map() keeps results in input order so that
+        # deduplication below stays deterministic.
+        max_workers = min(len(paths), (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(lambda p: self._scan_root(p, max_depth), paths))
+        self._save_cache()
+        
+        for repos in results:
             for repo in repos:
                 if repo['path'] not in seen_paths:
                     seen_paths.add(repo['path'])
                     all_repos.append(repo)
         
         return all_repos
+
+    # ------------------------------------------------------------------
+    # Persistent scan cache
+    #
+    # Each entry is keyed by (base path, depth) and stores the st_mtime_ns of
+    # every directory the scan searched, i.e. every non-repo directory within
+    # the depth limit. Creating or removing an entry changes its parent's
+    # mtime, so a repo cloned or deleted anywhere in the scanned tree (or a
+    # `git init` in a searched directory) invalidates the entry with one stat
+    # per directory instead of a listing and a .git probe per directory.
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def _cache_key(base: str, depth: int) -> str:
+        return f"{base}|{depth}"
+    
+    def _load_cache(self) -> Dict[str, Any]:
+        """Load the cache file once; a missing or corrupt file is an empty cache."""
+        if self._cache is None:
+            cache: Dict[str, Any] = {}
+            if self.cache_file:
+                try:
+                    with open(self.cache_file, "rb") as f:
+                        data = loads(f.read())
+                    if isinstance(data, dict):
+                        cache = data
+                except (OSError, ValueError) as e:
+                    if not isinstance(e, FileNotFoundError):
+                        logger.debug(f"Ignoring unreadable scan cache {self.cache_file}: {e}")
+            self._cache = cache
+        return self._cache
+    
+    def _get_cached(self, base: str, depth: int) -> Optional[List[Dict[str, str]]]:
+        """Return cached repos for base if none of the recorded mtimes changed."""
+        if not self.cache_file:
+            return None
+        with self._cache_lock:
+            entry = self._load_cache().get(self._cache_key(base, depth))
+        if not entry:
+            return None
+        try:
+            for path, mtime in entry["mtimes"].items():
+                if os.stat(path).st_mtime_ns != mtime:
+                    return None
+            return [dict(repo) for repo in entry["repos"]]
+        except (OSError, KeyError, TypeError, AttributeError):
+            return None
+    
+    def _put_cached(
+        self,
+        base: str,
+        depth: int,
+        repos: List[Dict[str, str]],
+        mtimes: Optional[Dict[str, int]]
+    ) -> None:
+        """Record a fresh scan result together with the mtimes _scan_tree saw."""
+        if not self.cache_file or mtimes is None:
+            return
+        if base not in mtimes:
+            # The base is itself a repo; removing its .git still changes it
+            try:
+                mtimes[base] = os.stat(base).st_mtime_ns
+            except OSError:
+                return
+        with self._cache_lock:
+            self._load_cache()[self._cache_key(base, depth)] = {
+                'mtimes': mtimes,
+                'repos': [dict(repo) for repo in repos],
+            }
+            self._cache_dirty = True
+    
+    def _save_cache(self) -> None:
+        """Write the cache file atomically if any entry changed."""
+        if not self.cache_file or not self._cache_dirty:
+            return
+        with self._cache_lock:
+            data = dumps_bytes(self._cache)
+            self._cache_dirty = False
+        try:
+            cache_dir = os.path.dirname(self.cache_file)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            atomic_write_bytes(self.cache_file, data)
+        except OSError as e:
+            logger.warning(f"Failed to write scan cache {self.cache_file}: {e}")
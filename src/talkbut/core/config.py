@@ -1,8 +1,20 @@
+import copy
 import os
+import re
 import yaml
+from functools import cached_property
+from itertools import chain
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+# KEY=VALUE lines in a .env file; the value may be double- or single-quoted
+_ENV_LINE_RE = re.compile(
+    r"""^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*"""
+    r"""(?:"([^"\n]*)"|'([^'\n]*)'|(.*?))[ \t]*\r?$""",
+    re.MULTILINE,
+)
+
+
 class ConfigManager:
     _instance = None
     _config: Dict[str, Any] = {}
@@ -10,9 +22,10 @@ class ConfigManager:
 
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(ConfigManager, cls).__new__(cls)
-            cls._instance._load_env_file()
-            cls._instance._load_config()
+            instance = super(ConfigManager, cls).__new__(cls)
+            instance._load_env_file()
+            instance._load_config()
+            cls._instance = instance
         return cls._instance
     
     @property
@@ -25,66 +38,26 @@ class ConfigManager:
         env_path = Path(".env")
         if env_path.exists():
             try:
-                with open(env_path, "r", encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        # Skip comments and empty lines
-                        if not line or line.startswith("#"):
-                            continue
-                        # Parse KEY=VALUE
-                        if "=" in line:
-                            key, value = line.split("=", 1)
-                            key = key.strip()
-                            value = value.strip()
-                            # Remove quotes if present
-                            if value.startswith('"') and value.endswith('"'):
-                                value = value[1:-1]
-                            elif value.startswith("'") and value.endswith("'"):
-                                value = value[1:-1]
-                            # Set environment variable if not already set
-                            if key and not os.getenv(key):
-                                os.environ[key] = value
+                text = env_path.read_text(encoding="utf-8")
+                # One regex pass over the file; comments and blank lines never
+                # match because they don't start with a valid key
+                for match in _ENV_LINE_RE.finditer(text):
+                    key = match.group(1)
+                    value = next(
+                        (g for g in match.group(2, 3, 4) if g is not None), ""
+                    )
+                    # Set environment variable if not already set
+                    if not os.getenv(key):
+                        os.environ[key] = value
             except Exception as e:
                 print(f"Warning: Failed to load .env file: {e}")
 
     def _load_config(self) -> None:
         """Load configuration from file and environment variables."""
-        # Default configuration
-        self._config = {
-            "git": {
-                "repositories": [],
-                "scan_paths": [],  # Paths to scan for git repos
-                "scan_depth": 2,   # Max depth for scanning
-                "default_branch": "main",
-                "author": "",  # Filter commits by author (email or name)
-            },
-            "ai": {
-                "provider": "gemini",
-                "api_key_env": "GEMINI_API_KEY",
-                "model": "gemini-2.0-flash-exp",
-                "temperature": 0.3,
-                "top_p": 0.95,
-                "top_k": 40,
-                "max_output_tokens": 8192,
-            },
-            "report": {
-                "default_format": "markdown",
-                "include_stats": True,
-                "include_file_list": False,
-                "sort_order": "asc",  # asc = chronological
-                "group_by": "category",
-            },
-            "storage": {
-                "log_dir": "./data/logs",
-                "retention_days": 90,
-            },
-            "schedule": {
-                "enabled": False,
-                "time": "18:00",  # HH:MM format (24-hour)
-                "status_file": "./data/schedule_status.json",
-                "error_log": "./data/schedule_errors.log",
-            }
-        }
+        from talkbut.core.config_defaults import DEFAULT_CONFIG
+
+        # Default configuration (deep-copied so merges never touch the module)
+        self._config = copy.deepcopy(DEFAULT_CONFIG)
 
         # Load from file
         config_path = os.getenv("TALKBUT_CONFIG_PATH", "config/config.yaml")
@@ -100,6 +73,8 @@ class ConfigManager:
             except Exception as e:
                 print(f"Warning: Failed to load config file: {e}")
 
+        self._discard_cached()
+
     def _merge_config(self, base: Dict, update: Dict) -> None:
         """Recursively merge configuration dictionaries."""
         for key, value in update.items():
@@ -108,6 +83,11 @@ class ConfigManager:
             else:
                 base[key] = value
 
+    def _discard_cached(self) -> None:
+        """Forget values derived from the configuration after it changes."""
+        # Repository list depends on git.* settings; recompute on next access
+        self.__dict__.pop("git_repos", None)
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value using dot notation (e.g., 'ai.model')."""
         keys = key.split(".")
@@ -119,11 +99,15 @@ class ConfigManager:
                 return default
         return value
 
-    @property
+    @cached_property
     def git_repos(self) -> List[Dict[str, str]]:
         """
         Get all git repositories from both explicit list and scanned paths.
         
+        The result is computed once per instance (scanning can walk large
+        trees) and discarded whenever the configuration is reloaded or
+        updated.
+        
         Returns:
             Combined list of repositories (deduplicated by path)
         """
@@ -139,23 +123,20 @@ class ConfigManager:
         
         # Scan for repositories
         from talkbut.collectors.repo_scanner import RepoScanner
-        scanner = RepoScanner(max_depth=scan_depth)
+        scanner = RepoScanner(
+            max_depth=scan_depth,
+            cache_file=self.get("git.scan_cache") or None,
+        )
         scanned_repos = scanner.scan_multiple(scan_paths, scan_depth)
         
         # Merge and deduplicate (explicit repos take priority)
         seen_paths = set()
         merged_repos = []
         
-        # Add explicit repos first (they have priority)
-        for repo in explicit_repos:
-            path = str(Path(repo.get('path', '')).expanduser().resolve())
-            if path not in seen_paths:
-                seen_paths.add(path)
-                merged_repos.append(repo)
-        
-        # Add scanned repos that aren't already in the list
-        for repo in scanned_repos:
-            path = str(Path(repo.get('path', '')).expanduser().resolve())
+        # Explicit repos come first so they win over scanned duplicates;
+        # each path is normalised exactly once
+        for repo in chain(explicit_repos, scanned_repos):
+            path = os.path.realpath(os.path.expanduser(repo.get('path', '')))
             if path not in seen_paths:
                 seen_paths.add(path)
                 merged_repos.append(repo)
@@ -217,6 +198,8 @@ class ConfigManager:
             if key in ["enabled", "time", "status_file", "error_log"]:
                 self._config["schedule"][key] = value
 
+        self._discard_cached()
+
     def save_schedule_config(self, config_path: Optional[str] = None) -> None:
         """
         Save current configuration to file.
@@ -239,3 +222,14 @@ class ConfigManager:
                 yaml.dump(self._config, f, default_flow_style=False, sort_keys=False)
         except Exception as e:
             raise IOError(f"Failed to save config file: {e}")
+
+
+def get_config() -> ConfigManager:
+    """
+    Return the shared ConfigManager, loading it on first use.
+    
+    Cheaper than calling ConfigManager() on hot paths: an existing instance
+    is returned with a single attribute read. Resetting
+    ConfigManager._instance still forces a reload on the next call.
+    """
+    return ConfigManager._instance or ConfigManager()
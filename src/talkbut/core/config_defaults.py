@@ -0,0 +1,49 @@
+"""
+Default configuration values for ConfigManager.
+
+Kept in a separate module so config.py stays small; ConfigManager imports
+it when the configuration is first loaded.
+"""
+from typing import Any, Dict
+
+DEFAULT_CONFIG: Dict[str, Any] = {
+    "git": {
+        "repositories": [],
+        "scan_paths": [],  # Paths to scan for git repos
+        "scan_depth": 2,   # Max depth for scanning
+        "scan_cache": "./data/repo_cache.json",  # Scan result cache ("" to disable)
+        "default_branch": "main",
+        "author": "",  # Filter commits by author (email or name)
+    },
+    "ai": {
+        "provider": "gemini",
+        "api_key_env": "GEMINI_API_KEY",
+        "model": "gemini-2.0-flash-exp",
+        "temperature": 0.3,
+        "top_p": 0.95,
+        "top_k": 40,
+        "max_output_tokens": 8192,
+        "max_concurrency": 4,  # AI requests in flight at once in batch mode
+    },
+    "report": {
+        "default_format": "markdown",
+        "include_stats": True,
+        "include_file_list": False,
+        "sort_order": "asc",  # asc = chronological
+        "group_by": "category",
+    },
+    "batch": {
+        "days_per_request": 7,  # Dates analyzed together in one AI request
+    },
+    "storage": {
+        "log_dir": "./data/logs",
+        "format": "json",  # Daily log file format: json or msgpack
+        "retention_days": 90,
+    },
+    "schedule": {
+        "enabled": False,
+        "time": "18:00",  # HH:MM format (24-hour)
+        "status_file": "./data/schedule_status.json",
+        "error_log": "./data/schedule_errors.log",
+    }
+}
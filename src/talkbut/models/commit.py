@@ -1,8 +1,13 @@
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional
 
-@dataclass
+# Slotted dataclasses drop the per-instance __dict__ (smaller, faster attribute
+# access); dataclass(slots=True) is only available on Python 3.10+.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**DATACLASS_SLOTS)
 class Commit:
     hash: str
     author: str
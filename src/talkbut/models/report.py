@@ -1,10 +1,10 @@
 from dataclasses import dataclass, field
 from datetime import date
 from typing import List, Dict, Any
-import json
-from .commit import Commit
+from talkbut.utils.json_utils import dumps
+from .commit import Commit, DATACLASS_SLOTS
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DailyReport:
     date: date
     total_commits: int
@@ -30,4 +30,4 @@ class DailyReport:
         }
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+        return dumps(self.to_dict(), indent=True)
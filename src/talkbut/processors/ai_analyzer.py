@@ -1,78 +1,111 @@
 import google.generativeai as genai
-import json
+import functools
 import os
-from typing import List, Dict, Any, Optional
+import re
+from itertools import chain
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import date
 from pathlib import Path
 
 from talkbut.models.commit import Commit
 from talkbut.models.report import DailyReport
-from talkbut.core.config import ConfigManager
+from talkbut.core.config import get_config
+from talkbut.utils.json_utils import loads
 from talkbut.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+PROMPT_TEMPLATE_PATH = "config/prompts/analysis_prompt.txt"
+BATCH_PROMPT_TEMPLATE_PATH = "config/prompts/batch_analysis_prompt.txt"
+
+# Matches a response wrapped in a markdown code fence, e.g. ```json ... ```
+_FENCE_RE = re.compile(r'^\s*```(?:json|JSON)?\s*(.*?)\s*```\s*$', re.DOTALL)
+
+# Raised while reading an answer that is not the JSON shape we asked for
+# (as opposed to API, quota or network errors from the request itself)
+_ANSWER_ERRORS = (ValueError, KeyError, TypeError, AttributeError)
+
+FALLBACK_PROMPT_TEMPLATE = """
+            Analyze these commits for {date}:
+            {commits_text}
+            
+            Return JSON with summary, categories, highlights, and timeline.
+            """
+
+FALLBACK_BATCH_PROMPT_TEMPLATE = """
+            Analyze these commits, grouped by day ({total_days} days):
+            {days_text}
+            
+            Return JSON {{"days": [...]}} with one entry per day containing
+            date, summary, categories and tasks.
+            """
+
+
+@functools.lru_cache(maxsize=4)
+def _read_prompt_template(path: str, fallback: str = FALLBACK_PROMPT_TEMPLATE) -> str:
+    """Read a prompt template once per process (keyed by absolute path)."""
+    prompt_path = Path(path)
+    if prompt_path.exists():
+        with open(prompt_path, "r", encoding="utf-8") as f:
+            return f.read()
+    return fallback
+
+
+@functools.lru_cache(maxsize=4)
+def _get_model(api_key: str, model_name: str):
+    """Configure the Gemini SDK and build a model once per (key, model) pair."""
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model_name=model_name)
+
+
 class AIAnalyzer:
     def __init__(self):
-        self.config = ConfigManager()
+        self.config = get_config()
         self._setup_api()
         self._load_prompt_template()
 
     def _setup_api(self):
+        # Snapshot AI settings once so request paths never go back to config
+        get = self.config.get
+        self._model_name = get("ai.model", "gemini-1.5-flash")
+        self.generation_config = {
+            "temperature": get("ai.temperature", 0.3),
+            "top_p": get("ai.top_p", 0.95),
+            "top_k": get("ai.top_k", 40),
+            "max_output_tokens": get("ai.max_output_tokens", 8192),
+        }
+
         api_key = self.config.ai_api_key
         if not api_key:
             logger.warning("No API key found. AI features will be disabled.")
             self.model = None
             return
 
-        genai.configure(api_key=api_key)
-        model_name = self.config.get("ai.model", "gemini-1.5-flash")
-        
-        # Generation config
-        self.generation_config = {
-            "temperature": self.config.get("ai.temperature", 0.3),
-            "top_p": self.config.get("ai.top_p", 0.95),
-            "top_k": self.config.get("ai.top_k", 40),
-            "max_output_tokens": self.config.get("ai.max_output_tokens", 8192),
-        }
-        
-        self.model = genai.GenerativeModel(model_name=model_name)
+        self.model = _get_model(api_key, self._model_name)
 
     def _load_prompt_template(self):
-        prompt_path = Path("config/prompts/analysis_prompt.txt")
-        if prompt_path.exists():
-            with open(prompt_path, "r", encoding="utf-8") as f:
-                self.prompt_template = f.read()
-        else:
-            # Fallback template
-            self.prompt_template = """
-            Analyze these commits for {date}:
-            {commits_text}
-            
-            Return JSON with summary, categories, highlights, and timeline.
-            """
+        self.prompt_template = _read_prompt_template(os.path.abspath(PROMPT_TEMPLATE_PATH))
+        self.batch_prompt_template = _read_prompt_template(
+            os.path.abspath(BATCH_PROMPT_TEMPLATE_PATH), FALLBACK_BATCH_PROMPT_TEMPLATE
+        )
 
-    def analyze_commits(self, commits: List[Commit], report_date: date) -> DailyReport:
-        """Analyze commits and generate a daily report."""
-        
-        # Basic stats calculation
-        total_commits = len(commits)
-        files_changed_set = set()
-        insertions = 0
-        deletions = 0
+    def _prepare_report_data(self, commits: List[Commit], report_date: date) -> Tuple[Dict, str]:
+        """Compute basic stats and the prompt text for one day's commits."""
+        # Aggregates run in C via sum()/set() rather than per-commit bytecode
+        files_changed_set = set(chain.from_iterable(c.files_changed for c in commits))
+        insertions = sum(c.insertions for c in commits)
+        deletions = sum(c.deletions for c in commits)
         
-        commits_text = ""
-        for c in commits:
-            files_changed_set.update(c.files_changed)
-            insertions += c.insertions
-            deletions += c.deletions
-            repo_label = f"[{c.repo_name}] " if c.repo_name else ""
-            commits_text += f"- [{c.date.strftime('%H:%M')}] {repo_label}{c.message} (Hash: {c.short_hash})\n"
-
-        # Prepare default/fallback report data
+        commits_text = "".join([
+            f"- [{c.date:%H:%M}] {f'[{c.repo_name}] ' if c.repo_name else ''}"
+            f"{c.message} (Hash: {c.hash[:7]})\n"
+            for c in commits
+        ])
+
+        # Default/fallback report data
         report_data = {
             "date": report_date,
-            "total_commits": total_commits,
+            "total_commits": len(commits),
             "files_changed": len(files_changed_set),
             "insertions": insertions,
             "deletions": deletions,
@@ -81,33 +114,65 @@ class AIAnalyzer:
             "categories": {},
             "tasks": []
         }
+        return report_data, commits_text
+
+    def _decode_response(self, response: Any) -> Any:
+        """Decode the JSON answer from a model response."""
+        ai_text = response.text
+        
+        # Remove markdown code blocks if present
+        match = _FENCE_RE.match(ai_text)
+        if match:
+            ai_text = match.group(1)
+        
+        return loads(ai_text.strip())
+
+    def _generate_json(self, prompt: str) -> Any:
+        """Send a prompt to the model and decode its JSON answer."""
+        response = self.model.generate_content(
+            prompt,
+            generation_config=self.generation_config
+        )
+        return self._decode_response(response)
+
+    def _build_prompt(self, report_data: Dict, commits_text: str) -> str:
+        """Fill the single-day prompt template."""
+        return self.prompt_template.format(
+            date=report_data["date"].isoformat(),
+            total_commits=report_data["total_commits"],
+            files_changed_count=report_data["files_changed"],
+            commits_text=commits_text
+        )
+
+    def _analyze_day(self, report_data: Dict, commits_text: str) -> DailyReport:
+        """
+        Request the analysis of one day, letting API errors propagate.
+        
+        An unreadable answer is recorded in the summary instead, since asking
+        again would not help.
+        """
+        response = self.model.generate_content(
+            self._build_prompt(report_data, commits_text),
+            generation_config=self.generation_config
+        )
+        try:
+            self._merge_ai_data(report_data, self._decode_response(response))
+        except _ANSWER_ERRORS as e:
+            logger.error(f"AI Analysis failed for {report_data['date']}: {e}")
+            report_data["ai_summary"] = f"AI Analysis failed: {str(e)}"
+        return DailyReport(**report_data)
+
+    def analyze_commits(self, commits: List[Commit], report_date: date) -> DailyReport:
+        """Analyze commits and generate a daily report."""
+        report_data, commits_text = self._prepare_report_data(commits, report_date)
 
         if not self.model or not commits:
             return DailyReport(**report_data)
 
         # Call AI API
         try:
-            prompt = self.prompt_template.format(
-                date=report_date.isoformat(),
-                total_commits=total_commits,
-                files_changed_count=len(files_changed_set),
-                commits_text=commits_text
-            )
-            
-            response = self.model.generate_content(
-                prompt,
-                generation_config=self.generation_config
-            )
-            
-            ai_text = response.text.strip()
-            
-            # Remove markdown code blocks if present
-            if ai_text.startswith("```"):
-                lines = ai_text.split("\n")
-                ai_text = "\n".join(lines[1:-1]) if len(lines) > 2 else ai_text
-                ai_text = ai_text.replace("```json", "").replace("```", "").strip()
-            
-            ai_data = json.loads(ai_text)
+            prompt = self._build_prompt(report_data, commits_text)
+            ai_data = self._generate_json(prompt)
             self._merge_ai_data(report_data, ai_data)
             
         except Exception as e:
@@ -116,6 +181,78 @@ class AIAnalyzer:
 
         return DailyReport(**report_data)
 
+    def analyze_commits_batch(
+        self,
+        batches: List[Tuple[date, List[Commit]]]
+    ) -> List[DailyReport]:
+        """
+        Analyze several days of commits with a single AI request.
+        
+        If the answer cannot be read, or leaves days out, those days are
+        requested one at a time. API errors (quota, rate limit, network) are
+        raised instead, since per-day retries would only add requests against
+        the limit that just failed.
+        
+        Args:
+            batches: List of (report_date, commits) pairs
+            
+        Returns:
+            One DailyReport per input pair, in the same order
+            
+        Raises:
+            Exception: Whatever the model API raised for a request
+        """
+        prepared = [self._prepare_report_data(commits, d) for d, commits in batches]
+        active = [(data, text) for data, text in prepared if data["total_commits"]]
+
+        if not self.model or not active:
+            return [DailyReport(**data) for data, _ in prepared]
+        
+        # A single day gains nothing from the multi-day prompt
+        if len(active) == 1:
+            return [
+                self._analyze_day(data, text) if data["total_commits"]
+                else DailyReport(**data)
+                for data, text in prepared
+            ]
+
+        days_text = "\n".join(
+            f"### {data['date'].isoformat()} "
+            f"({data['total_commits']} commits, {data['files_changed']} files changed)\n{text}"
+            for data, text in active
+        )
+        prompt = self.batch_prompt_template.format(
+            total_days=len(active),
+            days_text=days_text
+        )
+        response = self.model.generate_content(
+            prompt,
+            generation_config=self.generation_config
+        )
+        try:
+            by_date = {
+                str(day.get("date")): day
+                for day in self._decode_response(response).get("days", [])
+                if isinstance(day, dict)
+            }
+        except _ANSWER_ERRORS as e:
+            logger.warning(f"Unreadable batch AI answer, falling back to per-day requests: {e}")
+            by_date = {}
+
+        reports = []
+        for data, text in prepared:
+            if not data["total_commits"]:
+                reports.append(DailyReport(**data))
+                continue
+            day_data = by_date.get(data["date"].isoformat())
+            if day_data is None:
+                # Missing from the batch answer - ask for this day on its own
+                reports.append(self._analyze_day(data, text))
+                continue
+            self._merge_ai_data(data, day_data)
+            reports.append(DailyReport(**data))
+        return reports
+
     def _merge_ai_data(self, report_data: Dict, ai_data: Dict):
         """Merge AI response into report data."""
         if "summary" in ai_data:
@@ -20,10 +20,12 @@ def display_batch_start(total_dates: int, since: str, until: str = None):
         
     Requirements: 7.1
     """
-    click.echo(f"\n📦 Batch Processing")
-    click.echo(f"   Total dates: {total_dates}")
-    click.echo(f"   Range: {since}" + (f" to {until}" if until else " to today"))
-    click.echo()
+    click.echo("\n".join([
+        "\n📦 Batch Processing",
+        f"   Total dates: {total_dates}",
+        f"   Range: {since}" + (f" to {until}" if until else " to today"),
+        "",
+    ]))
 
 
 def display_progress(
@@ -69,28 +71,32 @@ def display_batch_summary(result: BatchResult):
         
     Requirements: 7.5
     """
-    click.echo(f"\n{'='*60}")
-    click.echo("📊 Batch Processing Summary")
-    click.echo(f"{'='*60}")
-    
-    # Statistics
-    click.echo(f"Total dates:     {result.total_dates}")
-    click.echo(f"✅ Processed:    {len(result.processed)}")
-    click.echo(f"⏭️  Skipped:      {len(result.skipped)}")
-    click.echo(f"❌ Failed:       {len(result.failed)}")
-    click.echo(f"⏱️  Duration:     {result.duration:.2f}s")
+    lines = [
+        f"\n{'='*60}",
+        "📊 Batch Processing Summary",
+        f"{'='*60}",
+        # Statistics
+        f"Total dates:     {result.total_dates}",
+        f"✅ Processed:    {len(result.processed)}",
+        f"⏭️  Skipped:      {len(result.skipped)}",
+        f"❌ Failed:       {len(result.failed)}",
+        f"⏱️  Duration:     {result.duration:.2f}s",
+    ]
     
     # Show failed dates with errors if any
     if result.failed:
-        click.echo(f"\n❌ Failed Dates:")
+        lines.append(f"\n❌ Failed Dates:")
         for failed_date, error in result.failed:
-            click.echo(f"   • {failed_date.isoformat()}: {error}")
+            lines.append(f"   • {failed_date.isoformat()}: {error}")
     
     # Success message
     if len(result.processed) > 0:
-        click.echo(f"\n✨ Successfully processed {len(result.processed)} date(s)")
+        lines.append(f"\n✨ Successfully processed {len(result.processed)} date(s)")
+    
+    lines.append(f"{'='*60}\n")
     
-    click.echo(f"{'='*60}\n")
+    # One write (and flush) for the whole block instead of one per line
+    click.echo("\n".join(lines))
 
 
 def create_progress_callback():
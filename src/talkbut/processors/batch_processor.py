@@ -3,17 +3,23 @@ Batch processor for handling multiple dates in a single operation.
 
 Requirements: 3.2, 3.3, 3.4, 3.5
 """
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+import threading
 from talkbut.core.config import ConfigManager
-from talkbut.collectors.git_collector import GitCollector
+from talkbut.collectors.git_collector import GitCollector, collect_from_repos, merged_commits
 from talkbut.collectors.parser import DataParser
+from talkbut.models.commit import Commit
+from talkbut.models.report import DailyReport
 from talkbut.processors.ai_analyzer import AIAnalyzer
-from talkbut.processors.batch_utils import expand_date_range, log_exists
+from talkbut.processors.batch_utils import expand_date_range, existing_log_dates
+from talkbut.storage.daily_logs import resolve_format, write_daily_log
 from talkbut.utils.logger import get_logger
-import json
 
 logger = get_logger(__name__)
 
@@ -55,6 +61,40 @@ class BatchProcessor:
         self.config = config
         self.log_dir = Path(config.get("storage.log_dir", "./data/logs"))
         self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.log_format = resolve_format(config.get("storage.format", "json"))
+        # One GitCollector per repo path, shared by every date in the batch
+        self._collectors: Dict[str, GitCollector] = {}
+        self._collectors_lock = threading.Lock()
+        # Parser and analyzer hold no per-call state, so one of each is
+        # shared by all worker threads; the analyzer is built on first use
+        self._parser = DataParser()
+        self._analyzer: Optional[AIAnalyzer] = None
+        self._analyzer_lock = threading.Lock()
+    
+    def _get_collector(self, repo_path: str) -> GitCollector:
+        """
+        Return the cached GitCollector for repo_path, creating it on first use.
+        
+        Invalid repositories raise ValueError and are not cached, so the
+        error is reported for every date as before.
+        """
+        with self._collectors_lock:
+            collector = self._collectors.get(repo_path)
+        if collector is not None:
+            return collector
+        
+        # Open the repo outside the lock so a slow open never blocks lookups
+        # of other repos; if two threads race, the first one stored wins
+        collector = GitCollector(repo_path)
+        with self._collectors_lock:
+            return self._collectors.setdefault(repo_path, collector)
+    
+    def _get_analyzer(self) -> AIAnalyzer:
+        """Return the batch's shared AIAnalyzer, creating it on first use."""
+        with self._analyzer_lock:
+            if self._analyzer is None:
+                self._analyzer = AIAnalyzer()
+            return self._analyzer
     
     def process_date_range(
         self,
@@ -62,7 +102,9 @@ class BatchProcessor:
         until: Optional[str] = None,
         force: bool = False,
         author: Optional[str] = None,
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        max_workers: Optional[int] = None,
+        days_per_request: Optional[int] = None
     ) -> BatchResult:
         """
         Process logs for a date range.
@@ -74,6 +116,11 @@ class BatchProcessor:
             author: Filter by author
             progress_callback: Optional callback for progress updates
                               Called with (current_date, index, total, result)
+                              from the calling thread, in completion order
+            max_workers: AI requests in flight at once
+                         (default: ai.max_concurrency from config)
+            days_per_request: Dates analyzed together in one AI request
+                              (default: batch.days_per_request from config)
             
         Returns:
             BatchResult with summary of processed dates
@@ -86,26 +133,82 @@ class BatchProcessor:
         dates = expand_date_range(since, until)
         
         result = BatchResult(total_dates=len(dates))
+        total = len(dates)
+        date_results = {}
+        idx = 0
         
-        # Process each date
-        for idx, process_date in enumerate(dates, 1):
-            date_result = self._process_single_date(
-                process_date,
-                author=author,
-                force=force
-            )
+        def record(process_date: date, date_result: ProcessResult) -> None:
+            nonlocal idx
+            idx += 1
+            date_results[process_date] = date_result
+            # Call progress callback if provided
+            if progress_callback:
+                progress_callback(process_date, idx, total, date_result)
+        
+        # Dates that already have a log are skipped up front; one directory
+        # listing answers the question for every date
+        existing = set() if force else existing_log_dates(self.log_dir)
+        pending = []
+        for process_date in dates:
+            if process_date.isoformat() in existing:
+                record(process_date, self._skipped_result(process_date))
+            else:
+                pending.append(process_date)
+        
+        if pending:
+            # One git log per repo for the whole window instead of one per date
+            try:
+                commits_by_date = self._collect_range(pending[0], pending[-1], author)
+            except Exception as e:
+                logger.error(f"Failed to collect commits for {since}..{until}: {e}", exc_info=True)
+                for process_date in pending:
+                    record(process_date, self._failed_result(process_date, str(e)))
+                pending = []
+        
+        # Dates without commits are done already (no log is written); the
+        # rest are grouped so several days share one AI request
+        work = []
+        for process_date in pending:
+            commits = commits_by_date.get(process_date)
+            if commits:
+                work.append((process_date, commits))
+            else:
+                record(process_date, self._empty_result(process_date))
+        
+        if work:
+            if days_per_request is None:
+                days_per_request = self.config.get("batch.days_per_request", 7)
+            days_per_request = max(1, int(days_per_request))
+            chunks = [
+                work[i:i + days_per_request]
+                for i in range(0, len(work), days_per_request)
+            ]
             
-            # Collect results
+            # Each chunk is dominated by its AI request, so chunks are
+            # processed in a thread pool to overlap the waiting
+            if max_workers is None:
+                max_workers = self.config.get("ai.max_concurrency", 4)
+            max_workers = max(1, min(int(max_workers), len(chunks)))
+            
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(self._process_dates_with_commits, chunk)
+                    for chunk in chunks
+                ]
+                
+                for future in as_completed(futures):
+                    for date_result in future.result():
+                        record(date_result.date, date_result)
+        
+        # Collect results in date order regardless of completion order
+        for process_date in dates:
+            date_result = date_results[process_date]
             if date_result.skipped:
                 result.skipped.append(process_date)
             elif date_result.success:
                 result.processed.append(process_date)
             else:
                 result.failed.append((process_date, date_result.error or "Unknown error"))
-            
-            # Call progress callback if provided
-            if progress_callback:
-                progress_callback(process_date, idx, len(dates), date_result)
         
         # Calculate duration
         end_time = datetime.now()
@@ -113,99 +216,140 @@ class BatchProcessor:
         
         return result
     
-    def _process_single_date(
+    @staticmethod
+    def _skipped_result(process_date: date) -> ProcessResult:
+        return ProcessResult(
+            date=process_date,
+            success=False,
+            skipped=True,
+            error=None,
+            commits_count=0
+        )
+    
+    @staticmethod
+    def _empty_result(process_date: date) -> ProcessResult:
+        # No commits: nothing to analyze and no log file, but not a failure
+        return ProcessResult(
+            date=process_date,
+            success=True,
+            skipped=False,
+            error=None,
+            commits_count=0
+        )
+    
+    @staticmethod
+    def _failed_result(process_date: date, error: str) -> ProcessResult:
+        return ProcessResult(
+            date=process_date,
+            success=False,
+            skipped=False,
+            error=error,
+            commits_count=0
+        )
+    
+    def _collect_range(
         self,
-        process_date: date,
-        author: Optional[str] = None,
-        force: bool = False
-    ) -> ProcessResult:
+        since_date: date,
+        until_date: date,
+        author: Optional[str] = None
+    ) -> Dict[date, List[Commit]]:
         """
-        Process log for a single date.
+        Collect commits for an inclusive date range and bucket them by day.
+        
+        Issues one git log per repository for the whole window. Days are
+        taken in local time, matching how git interprets --since/--until.
         
         Args:
-            process_date: Date to process
-            author: Filter by author
-            force: Force regeneration if log exists
+            since_date: First date of the range
+            until_date: Last date of the range (inclusive)
+            author: Filter by author (default: git.author from config)
             
         Returns:
-            ProcessResult with outcome
-            
-        Requirements: 3.2, 3.3, 3.5
+            Dict mapping each date to its commits (dates without commits
+            are absent)
         """
-        # Check if log already exists
-        if not force and log_exists(process_date, self.log_dir):
-            return ProcessResult(
-                date=process_date,
-                success=False,
-                skipped=True,
-                error=None,
-                commits_count=0
-            )
+        # Get repositories from config
+        repos = self.config.git_repos
+        if not repos:
+            repos = [{'path': '.', 'name': 'Current Directory'}]
         
-        try:
-            # Get repositories from config
-            repos = self.config.git_repos
-            if not repos:
-                repos = [{'path': '.', 'name': 'Current Directory'}]
-            
-            # Use author from config if not specified
-            if author is None:
-                author = self.config.get("git.author")
-            
-            # Collect commits from all repositories for this date
-            all_commits = []
-            parser = DataParser()
-            
-            # Calculate since/until for this specific date
-            since_str = process_date.isoformat()
-            # Until is the end of the day (next day at 00:00)
-            next_day = process_date + timedelta(days=1)
-            until_str = next_day.isoformat()
-            
-            for repo_info in repos:
-                repo_path = repo_info.get('path', '.')
-                repo_name = repo_info.get('name', repo_path)
-                
-                try:
-                    collector = GitCollector(repo_path)
-                    commits = collector.collect_commits(
-                        since=since_str,
-                        until=until_str,
-                        author=author,
-                        branch=None,
-                        include_diffs=False
-                    )
-                    
-                    # Add repo_name to each commit
-                    for c in commits:
-                        c.repo_name = repo_name
-                    
-                    all_commits.extend(commits)
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to collect from {repo_name} for {process_date}: {e}")
-            
-            # If no commits found, don't create log file but mark as successful
-            if not all_commits:
-                return ProcessResult(
-                    date=process_date,
-                    success=True,
-                    skipped=False,
-                    error=None,
-                    commits_count=0
+        # Use author from config if not specified
+        if author is None:
+            author = self.config.get("git.author")
+        
+        # Until is the end of the last day (next day at 00:00)
+        results = collect_from_repos(
+            repos,
+            since=since_date.isoformat(),
+            until=(until_date + timedelta(days=1)).isoformat(),
+            author=author,
+            collector_factory=self._get_collector
+        )
+        for result in results.values():
+            if result.error is not None:
+                logger.warning(
+                    f"Failed to collect from {result.name} for {since_date}..{until_date}: "
+                    f"{result.error}"
                 )
+        
+        commits_by_date: Dict[date, List[Commit]] = defaultdict(list)
+        for commit in merged_commits(results):
+            commits_by_date[commit.date.astimezone().date()].append(commit)
+        return commits_by_date
+    
+    def _process_dates_with_commits(
+        self,
+        batch: List[Tuple[date, List[Commit]]]
+    ) -> List[ProcessResult]:
+        """
+        Analyze several dates in one AI request and save a log for each.
+        
+        Args:
+            batch: (date, commits) pairs; every date has at least one commit
             
-            # Sort commits by date
-            all_commits.sort(key=lambda c: c.date, reverse=True)
-            
-            # Enrich commits with parsed metadata
-            for commit in all_commits:
-                parser.enrich_commit(commit)
+        Returns:
+            One ProcessResult per pair, in the same order
+        """
+        try:
+            for _, commits in batch:
+                # Sort commits by date
+                commits.sort(key=attrgetter("date"), reverse=True)
+                
+                # Enrich commits with parsed metadata
+                self._parser.enrich_commits(commits)
             
-            # Analyze commits
-            analyzer = AIAnalyzer()
-            report = analyzer.analyze_commits(all_commits, process_date)
+            # Analyze commits (a single day falls back to a plain request)
+            reports = self._get_analyzer().analyze_commits_batch(batch)
+        except Exception as e:
+            logger.error(
+                f"Failed to process {', '.join(d.isoformat() for d, _ in batch)}: {e}",
+                exc_info=True
+            )
+            return [self._failed_result(d, str(e)) for d, _ in batch]
+        
+        return [
+            self._save_daily_log(process_date, report, len(commits))
+            for (process_date, commits), report in zip(batch, reports)
+        ]
+    
+    def _save_daily_log(
+        self,
+        process_date: date,
+        report: DailyReport,
+        commits_count: int
+    ) -> ProcessResult:
+        """
+        Write the daily log file for an analyzed date.
+        
+        Args:
+            process_date: Date of the log
+            report: AI report for that date
+            commits_count: Number of commits the report covers
             
+        Returns:
+            ProcessResult with outcome
+        """
+        try:
             # Build daily log
             daily_log = {
                 "date": process_date.isoformat(),
@@ -220,31 +364,17 @@ class BatchProcessor:
                 "tasks": report.tasks if hasattr(report, 'tasks') and report.tasks else []
             }
             
-            # Save to file
-            filename = f"daily_log_{process_date.isoformat()}.json"
-            output_path = self.log_dir / filename
-            
-            # Remove old file if exists
-            if output_path.exists():
-                output_path.unlink()
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(daily_log, f, ensure_ascii=False, separators=(',', ':'))
+            # Save to file (atomically, in the configured storage format)
+            write_daily_log(self.log_dir, process_date, daily_log, self.log_format)
             
             return ProcessResult(
                 date=process_date,
                 success=True,
                 skipped=False,
                 error=None,
-                commits_count=len(all_commits)
+                commits_count=commits_count
             )
             
         except Exception as e:
             logger.error(f"Failed to process {process_date}: {e}", exc_info=True)
-            return ProcessResult(
-                date=process_date,
-                success=False,
-                skipped=False,
-                error=str(e),
-                commits_count=0
-            )
+            return self._failed_result(process_date, str(e))
@@ -5,12 +5,17 @@ Requirements: 3.1, 3.2
 """
 from datetime import datetime, date, timedelta
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import List, Optional, Set, Union
 import re
+from talkbut.storage.daily_logs import find_daily_log, list_daily_logs
 from talkbut.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Relative date forms accepted by _parse_date ("3 days ago", "1 week ago")
+_DAYS_AGO_RE = re.compile(r'^(\d+)\s+days?\s+ago$')
+_WEEKS_AGO_RE = re.compile(r'^(\d+)\s+weeks?\s+ago$')
+
 
 def expand_date_range(since: str, until: Optional[str] = None) -> List[date]:
     """
@@ -42,14 +47,8 @@ def expand_date_range(since: str, until: Optional[str] = None) -> List[date]:
     if since_date > until_date:
         since_date, until_date = until_date, since_date
     
-    # Generate all dates in range (inclusive)
-    dates = []
-    current = since_date
-    while current <= until_date:
-        dates.append(current)
-        current += timedelta(days=1)
-    
-    return dates
+    # Generate all dates in range (inclusive) from their day ordinals
+    return list(map(date.fromordinal, range(since_date.toordinal(), until_date.toordinal() + 1)))
 
 
 def _parse_date(date_str: str) -> date:
@@ -81,13 +80,13 @@ def _parse_date(date_str: str) -> date:
         return today - timedelta(days=1)
     
     # Handle "N days ago"
-    days_ago_match = re.match(r'^(\d+)\s+days?\s+ago$', date_str)
+    days_ago_match = _DAYS_AGO_RE.match(date_str)
     if days_ago_match:
         days = int(days_ago_match.group(1))
         return today - timedelta(days=days)
     
     # Handle "N weeks ago"
-    weeks_ago_match = re.match(r'^(\d+)\s+weeks?\s+ago$', date_str)
+    weeks_ago_match = _WEEKS_AGO_RE.match(date_str)
     if weeks_ago_match:
         weeks = int(weeks_ago_match.group(1))
         return today - timedelta(weeks=weeks)
@@ -110,7 +109,8 @@ def log_exists(log_date: date, log_dir: Union[str, Path]) -> bool:
     """
     Check if log file exists for a given date.
     
-    Uses standard naming convention: daily_log_YYYY-MM-DD.json
+    Uses standard naming convention: daily_log_YYYY-MM-DD.json (or .msgpack
+    when storage.format is msgpack)
     
     Args:
         log_date: Date to check
@@ -121,7 +121,21 @@ def log_exists(log_date: date, log_dir: Union[str, Path]) -> bool:
         
     Requirements: 3.2
     """
-    log_dir_path = Path(log_dir)
-    filename = f"daily_log_{log_date.isoformat()}.json"
-    log_path = log_dir_path / filename
-    return log_path.exists()
+    return find_daily_log(log_dir, log_date) is not None
+
+
+def existing_log_dates(log_dir: Union[str, Path]) -> Set[str]:
+    """
+    List the dates that have a daily log (see list_daily_logs).
+    
+    Lets callers check many dates with set membership instead of one
+    stat per date (see log_exists).
+    
+    Args:
+        log_dir: Directory containing log files
+        
+    Returns:
+        Set of ISO dates (YYYY-MM-DD) with a log in any storage format
+        (empty if the directory does not exist)
+    """
+    return set(list_daily_logs(log_dir))
@@ -1,58 +1,66 @@
 from typing import Dict, Any
+import io
 import json
 from talkbut.models.report import DailyReport
 
+
+def _task_name(task: Any) -> str:
+    """Display name of a report task (dict from the AI, or a plain string)."""
+    return task.get("task", "") if isinstance(task, dict) else str(task)
+
+
 class ReportFormatter:
     def __init__(self):
         pass
 
     def format_markdown(self, report: DailyReport) -> str:
         """Format report as Markdown."""
-        md = []
-        md.append(f"# Daily Report: {report.date.strftime('%Y-%m-%d')}")
-        md.append("")
+        buf = io.StringIO()
+        w = buf.write
+        w(f"# Daily Report: {report.date.strftime('%Y-%m-%d')}\n\n")
         
         # Summary
-        md.append("## 📝 Summary")
-        md.append(report.ai_summary)
-        md.append("")
+        w(f"## 📝 Summary\n{report.ai_summary}\n\n")
         
         # Stats
-        md.append("## 📊 Statistics")
-        md.append(f"- **Total Commits**: {report.total_commits}")
-        md.append(f"- **Files Changed**: {report.files_changed}")
-        md.append(f"- **Changes**: +{report.insertions} / -{report.deletions}")
-        md.append("")
+        w(
+            "## 📊 Statistics\n"
+            f"- **Total Commits**: {report.total_commits}\n"
+            f"- **Files Changed**: {report.files_changed}\n"
+            f"- **Changes**: +{report.insertions} / -{report.deletions}\n\n"
+        )
         
         # Categories
         if report.categories:
-            md.append("## 🏷️ Work Breakdown")
-            for cat, count in report.categories.items():
-                md.append(f"- **{cat}**: {count}")
-            md.append("")
+            w("## 🏷️ Work Breakdown\n")
+            w("".join(f"- **{cat}**: {count}\n" for cat, count in report.categories.items()))
+            w("\n")
 
         # Tasks
         if report.tasks:
-            md.append("## ✅ Tasks")
-            for task in report.tasks:
-                task_name = task.get("task", "") if isinstance(task, dict) else str(task)
-                md.append(f"- {task_name}")
-            md.append("")
+            w("## ✅ Tasks\n")
+            w("".join(f"- {_task_name(task)}\n" for task in report.tasks))
+            w("\n")
             
         # Detailed Commits
-        md.append("## 💻 Detailed Commits")
+        w("## 💻 Detailed Commits\n")
         for commit in report.commits:
-            md.append(f"### {commit.short_hash} - {commit.message.splitlines()[0]}")
-            md.append(f"- **Time**: {commit.date.strftime('%H:%M')}")
-            md.append(f"- **Author**: {commit.author}")
-            if len(commit.message.splitlines()) > 1:
-                md.append(f"- **Details**:")
-                for line in commit.message.splitlines()[1:]:
-                    if line.strip():
-                        md.append(f"  > {line.strip()}")
-            md.append("")
-            
-        return "\n".join(md)
+            # Split each message once and reuse it for title and details
+            lines = commit.message.splitlines()
+            w(f"### {commit.short_hash} - {lines[0]}\n")
+            w(f"- **Time**: {commit.date.strftime('%H:%M')}\n")
+            w(f"- **Author**: {commit.author}\n")
+            if len(lines) > 1:
+                w("- **Details**:\n")
+                w("".join(
+                    f"  > {stripped}\n"
+                    for stripped in (line.strip() for line in lines[1:])
+                    if stripped
+                ))
+            w("\n")
+        
+        # Every line above ends in a newline; the report itself does not
+        return buf.getvalue()[:-1]
 
     def format_json(self, report: DailyReport) -> str:
         """Format report as JSON."""
@@ -71,8 +79,6 @@ class ReportFormatter:
         if report.tasks:
             lines.append("")
             lines.append("Tasks:")
-            for task in report.tasks:
-                task_name = task.get("task", "") if isinstance(task, dict) else str(task)
-                lines.append(f"- {task_name}")
+            lines.extend(f"- {_task_name(task)}" for task in report.tasks)
             
         return "\n".join(lines)
@@ -1,6 +1,6 @@
 """Scheduling infrastructure for automated daily logging."""
 
-from .platform_detector import detect_platform, SchedulerType
+from .platform_detector import detect_platform, Scheduler, SchedulerType
 from .cron_scheduler import CronScheduler
 from .task_scheduler import TaskScheduler
 from .scheduler_manager import SchedulerManager
@@ -11,6 +11,7 @@ from .models import ScheduleStatus, ErrorRecord
 
 __all__ = [
     'detect_platform',
+    'Scheduler',
     'SchedulerType',
     'CronScheduler',
     'TaskScheduler',
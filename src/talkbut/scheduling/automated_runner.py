@@ -8,22 +8,48 @@ and retry logic with exponential backoff.
 Requirements: 1.2, 1.3, 1.4, 1.5
 """
 
+import os
+import random
+import re
 import sys
 import time
 import traceback
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 from typing import Optional, Tuple
 
 # Add parent directory to path to allow imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from talkbut.core.config import ConfigManager
+from talkbut.core.config import get_config
 from talkbut.scheduling.status_manager import StatusManager
 from talkbut.scheduling.error_logger import log_error
-from talkbut.collectors.git_collector import GitCollector
+from talkbut.collectors.git_collector import GitCollector, collect_from_repos, merged_commits
 from talkbut.collectors.parser import DataParser
 from talkbut.processors.ai_analyzer import AIAnalyzer
+from talkbut.storage.daily_logs import resolve_format, write_daily_log
+
+
+try:
+    from google.api_core import exceptions as _google_exceptions
+except ImportError:  # pragma: no cover - installed with google-generativeai
+    _google_exceptions = None
+
+# Transient failures worth retrying, recognised by type
+_RETRYABLE_EXCEPTIONS = (TimeoutError, ConnectionError)
+if _google_exceptions is not None:
+    _RETRYABLE_EXCEPTIONS += (
+        _google_exceptions.TooManyRequests,  # includes ResourceExhausted (quota)
+        _google_exceptions.ServiceUnavailable,
+        _google_exceptions.DeadlineExceeded,
+        _google_exceptions.InternalServerError,
+    )
+
+# Fallback for errors only recognisable by their message
+_API_ERROR_RE = re.compile(r'\bapi|rate limit|quota|network|timeout|connection', re.IGNORECASE)
+
+# Upper bound on a single retry wait, in seconds, whatever max_retries is
+MAX_BACKOFF_SECONDS = 30
 
 
 class APIError(Exception):
@@ -69,11 +95,10 @@ class AutomatedRunner:
         try:
             # Set config path if provided
             if self.config_path:
-                import os
                 os.environ["TALKBUT_CONFIG_PATH"] = self.config_path
             
             # Load config
-            self.config = ConfigManager()
+            self.config = get_config()
             
             # Initialize status manager
             schedule_config = self.config.get_schedule_config()
@@ -106,39 +131,26 @@ class AutomatedRunner:
             # Get author filter from config
             author = self.config.get("git.author")
             
-            # Collect commits from all repositories
-            all_commits = []
+            # Collect commits from all repositories (concurrently)
             parser = DataParser()
-            
-            for repo_info in repos:
-                repo_path = repo_info.get('path', '.')
-                repo_name = repo_info.get('name', repo_path)
-                
-                try:
-                    collector = GitCollector(repo_path)
-                    
-                    # Collect commits for the specific date
-                    commits = collector.collect_commits(
-                        since=f"{date_str} 00:00:00",
-                        until=f"{date_str} 23:59:59",
-                        author=author,
-                        branch=None,
-                        include_diffs=False
-                    )
-                    
-                    if commits:
-                        # Add repo_name to each commit
-                        for c in commits:
-                            c.repo_name = repo_name
-                        all_commits.extend(commits)
-                        
-                except Exception as e:
+            results = collect_from_repos(
+                repos,
+                since=f"{date_str} 00:00:00",
+                until=f"{date_str} 23:59:59",
+                author=author,
+                collector_factory=GitCollector
+            )
+            for result in results.values():
+                if result.error is not None:
                     # Log warning but continue with other repos
-                    print(f"Warning: Failed to collect from {repo_name}: {e}", file=sys.stderr)
+                    print(
+                        f"Warning: Failed to collect from {result.name}: {result.error}",
+                        file=sys.stderr
+                    )
+            all_commits = merged_commits(results)
             
             # Enrich commits with parsed metadata
-            for commit in all_commits:
-                parser.enrich_commit(commit)
+            parser.enrich_commits(all_commits)
             
             return True, all_commits, None
             
@@ -159,15 +171,14 @@ class AutomatedRunner:
         Requirements: 1.2, 1.4
         """
         try:
-            import json
-            from datetime import date
-            
             # Parse date
             report_date = date.fromisoformat(date_str)
             
-            # Analyze commits
+            # Analyze commits; unlike analyze_commits, the batch entry point
+            # lets API errors (rate limit, quota, network) through so they
+            # can be retried below instead of being saved as the summary
             analyzer = AIAnalyzer()
-            report = analyzer.analyze_commits(commits, report_date)
+            report = analyzer.analyze_commits_batch([(report_date, commits)])[0]
             
             # Build daily log
             daily_log = {
@@ -187,20 +198,20 @@ class AutomatedRunner:
             log_dir = Path(self.config.get("storage.log_dir", "./data/logs"))
             log_dir.mkdir(parents=True, exist_ok=True)
             
-            filename = f"daily_log_{date_str}.json"
-            output_path = log_dir / filename
-            
-            # Write JSON file
-            json_output = json.dumps(daily_log, ensure_ascii=False, separators=(',', ':'))
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(json_output)
+            # Write atomically in the configured storage format
+            write_daily_log(
+                log_dir,
+                report_date,
+                daily_log,
+                resolve_format(self.config.get("storage.format", "json"))
+            )
             
             return True, None
             
         except Exception as e:
-            # Check if this is an API error (should trigger retry)
-            error_str = str(e).lower()
-            if any(keyword in error_str for keyword in ['api', 'rate limit', 'quota', 'network', 'timeout', 'connection']):
+            # Check if this is an API error (should trigger retry): known
+            # transient exception types first, message keywords as fallback
+            if isinstance(e, _RETRYABLE_EXCEPTIONS) or _API_ERROR_RE.search(str(e)):
                 raise APIError(f"API failure: {e}")
             
             return False, f"Failed to analyze and save: {e}"
@@ -257,10 +268,16 @@ class AutomatedRunner:
                 last_error = str(e)
                 
                 if attempt < max_retries - 1:
-                    # Calculate backoff time (2^attempt seconds)
-                    backoff_time = 2 ** attempt
+                    # Calculate backoff time (2^attempt seconds plus up to 50%
+                    # random jitter, so runners on many machines that failed
+                    # together don't retry in lockstep), capped so a large
+                    # max_retries never means an unbounded wait
+                    backoff_time = min(
+                        2 ** attempt * (1 + random.random() * 0.5),
+                        MAX_BACKOFF_SECONDS
+                    )
                     print(f"API error on attempt {attempt + 1}/{max_retries}: {e}", file=sys.stderr)
-                    print(f"Retrying in {backoff_time} seconds...", file=sys.stderr)
+                    print(f"Retrying in {backoff_time:.1f} seconds...", file=sys.stderr)
                     time.sleep(backoff_time)
                 else:
                     # Final attempt failed
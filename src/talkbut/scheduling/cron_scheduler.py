@@ -1,18 +1,228 @@
 """CronScheduler implementation for Unix-like systems (macOS, Linux)."""
 
+import io
+import os
+import re
+import shutil
 import subprocess
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Optional
+from pathlib import Path
+from time import monotonic
+from typing import Iterator, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows uses TaskScheduler instead
+    fcntl = None
+
+# Leading "minute hour " fields of a cron line (matched from the line start)
+_CRON_TIME_RE = re.compile(rb"[ \t]*(\d{1,2})[ \t]+(\d{1,2})[ \t]")
+
+
+def _find_crontab() -> Optional[str]:
+    """Full path of the crontab binary, or None if it is not installed."""
+    return shutil.which("crontab")
 
 
 class CronScheduler:
     """Scheduler implementation using cron for Unix-like systems."""
     
     TALKBUT_MARKER = "# TalkBut automated daily logging"
+    # The crontab is handled as raw bytes; it is never decoded
+    MARKER_BYTES = TALKBUT_MARKER.encode()
+    
+    # How long a `crontab -l` result is reused, in seconds
+    CACHE_TTL = 0.5
+    
+    # Serializes crontab read-modify-write cycles between processes
+    LOCK_FILE = Path.home() / ".talkbut" / "cron.lock"
+    
+    def __init__(self, lock_path: Optional[Path] = None):
+        """
+        Initialize CronScheduler.
+        
+        Args:
+            lock_path: Lock file guarding crontab updates (default: LOCK_FILE)
+        """
+        self._lock_path = Path(lock_path) if lock_path else self.LOCK_FILE
+        # Resolved once: without cron installed every operation fails fast
+        # instead of paying a failed fork/exec per call
+        self._crontab = _find_crontab()
+        # (monotonic timestamp, crontab bytes or None if there is no crontab)
+        self._cache: Optional[Tuple[float, Optional[bytes]]] = None
+        # (hour, minute) of the TalkBut job in the cached crontab, if any
+        self._parsed: Optional[Tuple[int, int]] = None
+    
+    @contextmanager
+    def _lock(self) -> Iterator[None]:
+        """
+        Hold an exclusive lock on the crontab for a read-modify-write.
+        
+        Without it, two concurrent enables (or an enable racing a disable)
+        can interleave their `crontab -l` / `crontab -` calls so one silently
+        overwrites the other's change. If the lock file cannot be created the
+        update goes ahead unlocked, as it did before locking existed.
+        """
+        if fcntl is None:
+            yield
+            return
+        
+        try:
+            self._lock_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self._lock_path, os.O_CREAT | os.O_RDWR, 0o600)
+        except OSError:
+            yield
+            return
+        
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
     
-    def __init__(self):
-        """Initialize CronScheduler."""
-        pass
+    def _load_crontab(self, use_cache: bool = True) -> Optional[bytes]:
+        """
+        Read the current user's crontab, reusing a recent result.
+        
+        One status query calls several of the methods below; caching the
+        output for CACHE_TTL seconds turns their separate `crontab -l` runs
+        into one. create_job and remove_job refresh the cache with what they
+        wrote.
+        
+        Args:
+            use_cache: False to always run `crontab -l` (for read-modify-write
+                       under the lock, where another process may have just
+                       changed the crontab)
+        
+        Returns:
+            Raw crontab contents, or None if the user has no crontab
+            
+        Raises:
+            FileNotFoundError: If the crontab binary is not available
+            subprocess.SubprocessError: If crontab cannot be run
+        """
+        now = monotonic()
+        if use_cache and self._cache is not None and now - self._cache[0] < self.CACHE_TTL:
+            return self._cache[1]
+        
+        # Kept as bytes: the marker search and schedule parsing work on the
+        # raw output, so the whole crontab is never decoded
+        result = subprocess.run(
+            [self._crontab, "-l"],
+            capture_output=True,
+            check=False
+        )
+        data = result.stdout if result.returncode == 0 else None
+        self._set_cache(now, data)
+        return data
+    
+    def _remember_crontab(self, data: Optional[bytes], written: bool) -> None:
+        """Cache a crontab we just wrote, or drop the cache if the write failed."""
+        if written:
+            self._set_cache(monotonic(), data)
+        else:
+            self._cache = None
+    
+    def _write_crontab(self, data: bytes) -> bool:
+        """
+        Install data as the user's crontab.
+        
+        crontab's output is discarded rather than captured, which saves the
+        pipes and reader threads communicate() would need.
+        
+        Args:
+            data: Complete crontab contents
+            
+        Returns:
+            True if crontab accepted it, False otherwise
+            
+        Raises:
+            FileNotFoundError: If the crontab binary is not available
+            subprocess.SubprocessError: If crontab cannot be run
+        """
+        written = subprocess.run(
+            [self._crontab, "-"],
+            input=data,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False
+        ).returncode == 0
+        self._remember_crontab(data, written)
+        return written
+    
+    def _without_talkbut_job(self, data: bytes) -> bytes:
+        """
+        Drop the TalkBut job line(s) from a crontab in a single pass.
+        
+        Other lines are kept as they are; blank lines at the start and end
+        are dropped.
+        
+        Args:
+            data: Crontab contents
+            
+        Returns:
+            Remaining crontab ending in a newline, or b"" if nothing is left
+        """
+        buf = io.BytesIO()
+        for line in data.splitlines():
+            if self.MARKER_BYTES not in line and (buf.tell() or line.strip()):
+                buf.write(line)
+                buf.write(b"\n")
+        
+        kept = buf.getvalue().rstrip()
+        return kept + b"\n" if kept else b""
+    
+    def _set_cache(self, timestamp: float, data: Optional[bytes]) -> None:
+        """Store a crontab and parse the TalkBut schedule out of it once."""
+        self._cache = (timestamp, data)
+        self._parsed = self._parse_schedule(data) if data else None
+    
+    def _parse_schedule(self, data: bytes) -> Optional[Tuple[int, int]]:
+        """
+        Find the TalkBut job in a crontab.
+        
+        Only the line holding the marker is looked at; the rest of the
+        crontab is not split into lines.
+        
+        Args:
+            data: Crontab contents
+            
+        Returns:
+            (hour, minute) of the job, or None if there is no parseable job
+        """
+        marker = data.find(self.MARKER_BYTES)
+        if marker < 0:
+            return None
+        start = data.rfind(b"\n", 0, marker) + 1
+        
+        # Cron expression: minute hour * * * command
+        match = _CRON_TIME_RE.match(data, start, marker)
+        if match is None:
+            return None
+        return int(match.group(2)), int(match.group(1))
+    
+    @staticmethod
+    def _compute_next(hour: int, minute: int, now: datetime) -> datetime:
+        """
+        Next occurrence of a daily hour:minute schedule after now.
+        
+        Args:
+            hour: Scheduled hour (0-23)
+            minute: Scheduled minute (0-59)
+            now: Reference time
+            
+        Returns:
+            Today's run time if it is still ahead, otherwise tomorrow's
+        """
+        next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        
+        # If the time has passed today, schedule for tomorrow
+        if next_run <= now:
+            next_run += timedelta(days=1)
+        
+        return next_run
     
     def create_job(self, time: str, command: str) -> bool:
         """
@@ -35,42 +245,24 @@ class CronScheduler:
             if not (0 <= hour <= 23 and 0 <= minute <= 59):
                 return False
             
-            # Generate cron expression: minute hour * * * command
-            cron_line = f"{minute} {hour} * * * {command} {self.TALKBUT_MARKER}\n"
-            
-            # Get current crontab
-            try:
-                result = subprocess.run(
-                    ["crontab", "-l"],
-                    capture_output=True,
-                    text=True,
-                    check=False
-                )
-                current_crontab = result.stdout if result.returncode == 0 else ""
-            except FileNotFoundError:
+            if self._crontab is None:
                 return False
             
-            # Remove existing TalkBut job if present
-            lines = current_crontab.split("\n")
-            filtered_lines = [line for line in lines if self.TALKBUT_MARKER not in line]
-            
-            # Add new job
-            new_crontab = "\n".join(filtered_lines).strip()
-            if new_crontab:
-                new_crontab += "\n"
-            new_crontab += cron_line
-            
-            # Write new crontab
-            process = subprocess.Popen(
-                ["crontab", "-"],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            stdout, stderr = process.communicate(input=new_crontab)
+            # Generate cron expression: minute hour * * * command
+            cron_line = os.fsencode(f"{minute} {hour} * * * {command} {self.TALKBUT_MARKER}\n")
             
-            return process.returncode == 0
+            with self._lock():
+                # Get current crontab
+                try:
+                    current_crontab = self._load_crontab(use_cache=False) or b""
+                except FileNotFoundError:
+                    return False
+                
+                # Remove existing TalkBut job if present, then add the new one
+                new_crontab = self._without_talkbut_job(current_crontab) + cron_line
+                
+                # Write new crontab
+                return self._write_crontab(new_crontab)
             
         except (ValueError, subprocess.SubprocessError):
             return False
@@ -82,46 +274,33 @@ class CronScheduler:
         Returns:
             True if successful, False otherwise
         """
+        if self._crontab is None:
+            return False
+        
         try:
-            # Get current crontab
-            result = subprocess.run(
-                ["crontab", "-l"],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            
-            if result.returncode != 0:
-                # No crontab exists, nothing to remove
-                return True
-            
-            current_crontab = result.stdout
-            
-            # Remove TalkBut job
-            lines = current_crontab.split("\n")
-            filtered_lines = [line for line in lines if self.TALKBUT_MARKER not in line]
-            new_crontab = "\n".join(filtered_lines).strip()
-            
-            # Write new crontab (or remove if empty)
-            if new_crontab:
-                new_crontab += "\n"
-                process = subprocess.Popen(
-                    ["crontab", "-"],
-                    stdin=subprocess.PIPE,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
-                stdout, stderr = process.communicate(input=new_crontab)
-                return process.returncode == 0
-            else:
-                # Remove crontab entirely if empty
-                result = subprocess.run(
-                    ["crontab", "-r"],
-                    capture_output=True,
-                    check=False
-                )
-                return True  # Success even if no crontab existed
+            with self._lock():
+                # Get current crontab
+                current_crontab = self._load_crontab(use_cache=False)
+                
+                if current_crontab is None:
+                    # No crontab exists, nothing to remove
+                    return True
+                
+                # Remove TalkBut job
+                new_crontab = self._without_talkbut_job(current_crontab)
+                
+                # Write new crontab (or remove if empty)
+                if new_crontab:
+                    return self._write_crontab(new_crontab)
+                else:
+                    # Remove crontab entirely if empty
+                    result = subprocess.run(
+                        [self._crontab, "-r"],
+                        capture_output=True,
+                        check=False
+                    )
+                    self._remember_crontab(None, True)
+                    return True  # Success even if no crontab existed
                 
         except (subprocess.SubprocessError, FileNotFoundError):
             return False
@@ -133,22 +312,48 @@ class CronScheduler:
         Returns:
             True if job exists, False otherwise
         """
+        if self._crontab is None:
+            return False
+        
         try:
-            result = subprocess.run(
-                ["crontab", "-l"],
-                capture_output=True,
-                text=True,
-                check=False
-            )
+            current_crontab = self._load_crontab()
             
-            if result.returncode != 0:
+            if current_crontab is None:
                 return False
             
-            return self.TALKBUT_MARKER in result.stdout
+            return self.MARKER_BYTES in current_crontab
             
         except (subprocess.SubprocessError, FileNotFoundError):
             return False
     
+    def describe(self) -> Tuple[bool, Optional[datetime], Optional[str]]:
+        """
+        Report the job's state from a single crontab read.
+        
+        Returns:
+            (job exists, next run or None, schedule time as HH:MM or None)
+        """
+        if self._crontab is None:
+            return False, None, None
+        
+        try:
+            current_crontab = self._load_crontab()
+        except (subprocess.SubprocessError, FileNotFoundError):
+            return False, None, None
+        
+        if current_crontab is None or self.MARKER_BYTES not in current_crontab:
+            return False, None, None
+        if self._parsed is None:
+            return True, None, None
+        
+        hour, minute = self._parsed
+        try:
+            next_run = self._compute_next(hour, minute, datetime.now())
+        except ValueError:
+            # Out-of-range hour/minute in a hand-edited crontab
+            return True, None, None
+        return True, next_run, f"{hour:02d}:{minute:02d}"
+    
     def get_next_run(self) -> Optional[datetime]:
         """
         Calculate the next run time from the cron expression.
@@ -156,41 +361,21 @@ class CronScheduler:
         Returns:
             Next run datetime, or None if no job exists
         """
-        try:
-            # Get current crontab
-            result = subprocess.run(
-                ["crontab", "-l"],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            
-            if result.returncode != 0:
-                return None
-            
-            # Find TalkBut job line
-            for line in result.stdout.split("\n"):
-                if self.TALKBUT_MARKER in line:
-                    # Parse cron expression: minute hour * * * command
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        try:
-                            minute = int(parts[0])
-                            hour = int(parts[1])
-                            
-                            # Calculate next run time
-                            now = datetime.now()
-                            next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                            
-                            # If the time has passed today, schedule for tomorrow
-                            if next_run <= now:
-                                next_run += timedelta(days=1)
-                            
-                            return next_run
-                        except (ValueError, IndexError):
-                            return None
-            
+        if self._crontab is None:
             return None
-            
+        
+        try:
+            # Refreshes self._parsed when the cached crontab has expired
+            self._load_crontab()
         except (subprocess.SubprocessError, FileNotFoundError):
             return None
+        
+        if self._parsed is None:
+            return None
+        
+        hour, minute = self._parsed
+        try:
+            return self._compute_next(hour, minute, datetime.now())
+        except ValueError:
+            # Out-of-range hour/minute in a hand-edited crontab
+            return None
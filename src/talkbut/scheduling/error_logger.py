@@ -1,8 +1,25 @@
 """Error logging functionality for automated daily logging."""
 
-from datetime import datetime
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set
+
+# Log directories already created by this process, so repeated errors skip
+# the mkdir (a stat, or a failed create, per call)
+_KNOWN_DIRS: Set[Path] = set()
+
+
+def _timestamp() -> str:
+    """
+    Current local time as YYYY-MM-DDTHH:MM:SS.ffffff.
+    
+    Same text as datetime.now().isoformat(timespec="microseconds"), built
+    straight from the clock without constructing a datetime. Unlike plain
+    isoformat(), the microseconds are never omitted.
+    """
+    ns = time.time_ns()
+    seconds, remainder = divmod(ns, 1_000_000_000)
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(seconds)) + f".{remainder // 1000:06d}"
 
 
 def log_error(error_log_path: Path, error_message: str, date_attempted: Optional[str] = None) -> None:
@@ -21,10 +38,13 @@ def log_error(error_log_path: Path, error_message: str, date_attempted: Optional
     """
     # Ensure parent directory exists
     error_log_path = Path(error_log_path)
-    error_log_path.parent.mkdir(parents=True, exist_ok=True)
+    parent = error_log_path.parent
+    if parent not in _KNOWN_DIRS:
+        parent.mkdir(parents=True, exist_ok=True)
+        _KNOWN_DIRS.add(parent)
     
     # Format log entry
-    timestamp = datetime.now().isoformat()
+    timestamp = _timestamp()
     log_entry = f"[{timestamp}] {error_message}"
     
     if date_attempted:
@@ -33,5 +53,11 @@ def log_error(error_log_path: Path, error_message: str, date_attempted: Optional
     log_entry += "\n"
     
     # Append to log file (don't overwrite)
-    with open(error_log_path, 'a', encoding='utf-8') as f:
+    try:
+        f = open(error_log_path, 'a', encoding='utf-8')
+    except FileNotFoundError:
+        # The directory was removed after we created it
+        parent.mkdir(parents=True, exist_ok=True)
+        f = open(error_log_path, 'a', encoding='utf-8')
+    with f:
         f.write(log_entry)
@@ -1,7 +1,9 @@
 """Platform detection utility for selecting appropriate scheduler."""
 
 import platform
+from datetime import datetime
 from enum import Enum
+from typing import Optional, Protocol, Tuple
 
 
 class SchedulerType(Enum):
@@ -11,6 +13,30 @@ class SchedulerType(Enum):
     UNSUPPORTED = "unsupported"
 
 
+class Scheduler(Protocol):
+    """Operations SchedulerManager needs from a platform scheduler."""
+    
+    def create_job(self, time: str, command: str) -> bool:
+        """Create or replace the daily job at time (HH:MM)."""
+        ...
+    
+    def remove_job(self) -> bool:
+        """Remove the job; succeeds if there was none."""
+        ...
+    
+    def job_exists(self) -> bool:
+        """Check whether the job is installed."""
+        ...
+    
+    def get_next_run(self) -> Optional[datetime]:
+        """Next scheduled run, or None if there is no job."""
+        ...
+    
+    def describe(self) -> Tuple[bool, Optional[datetime], Optional[str]]:
+        """(job exists, next run, schedule time as HH:MM) in one query."""
+        ...
+
+
 def detect_platform() -> SchedulerType:
     """
     Detect the operating system and return appropriate scheduler type.
@@ -20,6 +46,10 @@ def detect_platform() -> SchedulerType:
                       TASK_SCHEDULER for Windows,
                       UNSUPPORTED for other platforms
     """
+    # platform.system() reads platform.uname(), which the standard library
+    # computes once per process and caches, so repeated calls are cheap and
+    # this function needs no cache of its own (one would also pin the
+    # result, defeating tests that patch platform.system)
     system = platform.system()
     
     if system in ("Darwin", "Linux"):
@@ -1,15 +1,39 @@
 """SchedulerManager for managing automated daily logging across platforms."""
 
+import shlex
+import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from .platform_detector import detect_platform, SchedulerType
+from .platform_detector import detect_platform, Scheduler, SchedulerType
 from .cron_scheduler import CronScheduler
 from .task_scheduler import TaskScheduler
 from .models import ScheduleStatus, ErrorRecord
 
 
+@lru_cache(maxsize=64)
+def _validate_time_format(time: str) -> bool:
+    """
+    Validate time format (HH:MM).
+    
+    Memoized: enable/update are called with the same few times (usually the
+    configured one) over and over.
+    
+    Args:
+        time: Time string to validate
+        
+    Returns:
+        True if valid, False otherwise
+    """
+    try:
+        hour, minute = time.split(":")
+        return 0 <= int(hour) <= 23 and 0 <= int(minute) <= 59
+    except (ValueError, AttributeError):
+        return False
+
+
 class SchedulerManager:
     """
     Manager for automated logging schedules across different platforms.
@@ -31,12 +55,23 @@ class SchedulerManager:
         self.platform_type = detect_platform()
         
         # Initialize platform-specific scheduler
+        self.scheduler: Optional[Scheduler]
         if self.platform_type == SchedulerType.CRON:
             self.scheduler = CronScheduler()
         elif self.platform_type == SchedulerType.TASK_SCHEDULER:
             self.scheduler = TaskScheduler()
         else:
             self.scheduler = None
+        
+        # Commands run through /bin/sh under cron and through the Windows
+        # command-line parser under Task Scheduler, which quote differently
+        if self.platform_type == SchedulerType.TASK_SCHEDULER:
+            self._quote = lambda arg: subprocess.list2cmdline([arg])
+        else:
+            self._quote = shlex.quote
+        self._base_command = (
+            f"{self._quote(sys.executable)} -m talkbut.scheduling.automated_runner"
+        )
     
     def enable(self, time: str, config_path: Optional[str] = None) -> bool:
         """
@@ -53,7 +88,7 @@ class SchedulerManager:
             return False
         
         # Validate time format
-        if not self._validate_time_format(time):
+        if not _validate_time_format(time):
             return False
         
         # Build command to execute (includes config_path in the command string)
@@ -72,7 +107,7 @@ class SchedulerManager:
         if self.scheduler is None:
             return False
         
-        return self.scheduler.remove_job() if hasattr(self.scheduler, 'remove_job') else self.scheduler.remove_task()
+        return self.scheduler.remove_job()
     
     def update(self, time: str, config_path: Optional[str] = None) -> bool:
         """
@@ -89,7 +124,7 @@ class SchedulerManager:
             return False
         
         # Validate time format
-        if not self._validate_time_format(time):
+        if not _validate_time_format(time):
             return False
         
         # Build command with config path (includes config_path in the command string)
@@ -98,10 +133,15 @@ class SchedulerManager:
         # Update is essentially remove + create
         return self.scheduler.create_job(time, command)
     
-    def get_status(self) -> ScheduleStatus:
+    def get_status(self, include_history: bool = True) -> ScheduleStatus:
         """
         Get current schedule status.
         
+        Args:
+            include_history: Also fill last_run and recent_errors from the
+                             status manager (False for callers that read
+                             the history themselves)
+        
         Returns:
             ScheduleStatus object with current state
         """
@@ -112,22 +152,17 @@ class SchedulerManager:
         elif self.platform_type == SchedulerType.TASK_SCHEDULER:
             platform_str = "task_scheduler"
         
-        # Check if enabled
-        enabled = self.is_enabled()
-        
-        # Get schedule time and next run
-        schedule_time = None
-        next_run = None
-        if enabled and self.scheduler:
-            next_run = self.scheduler.get_next_run()
-            if next_run:
-                schedule_time = f"{next_run.hour:02d}:{next_run.minute:02d}"
+        # Check if enabled, and get schedule time and next run, in one query
+        if self.scheduler is None:
+            enabled, next_run, schedule_time = False, None, None
+        else:
+            enabled, next_run, schedule_time = self.scheduler.describe()
         
         # Get last run and errors from status manager (if available)
         last_run = None
         recent_errors = []
         
-        if self.status_manager:
+        if include_history and self.status_manager:
             last_run = self.status_manager.get_last_run()
             recent_errors = self.status_manager.get_recent_errors()
         
@@ -150,34 +185,7 @@ class SchedulerManager:
         if self.scheduler is None:
             return False
         
-        if hasattr(self.scheduler, 'job_exists'):
-            return self.scheduler.job_exists()
-        elif hasattr(self.scheduler, 'task_exists'):
-            return self.scheduler.task_exists()
-        
-        return False
-    
-    def _validate_time_format(self, time: str) -> bool:
-        """
-        Validate time format (HH:MM).
-        
-        Args:
-            time: Time string to validate
-            
-        Returns:
-            True if valid, False otherwise
-        """
-        try:
-            parts = time.split(":")
-            if len(parts) != 2:
-                return False
-            
-            hour = int(parts[0])
-            minute = int(parts[1])
-            
-            return 0 <= hour <= 23 and 0 <= minute <= 59
-        except (ValueError, AttributeError):
-            return False
+        return self.scheduler.job_exists()
     
     def _build_command(self, config_path: Optional[str] = None) -> str:
         """
@@ -189,6 +197,9 @@ class SchedulerManager:
         - Status tracking
         - Retry logic with exponential backoff
         
+        The interpreter path and config path are quoted, so paths containing
+        spaces survive the scheduler's command-line parsing.
+        
         Args:
             config_path: Optional path to config file
             
@@ -197,15 +208,8 @@ class SchedulerManager:
             
         Requirements: 1.2, 1.3, 1.4, 1.5
         """
-        # Get Python executable path
-        python_exe = sys.executable
-        
-        # Build command to run automated_runner
-        # Use -m to run as module
-        command_parts = [python_exe, "-m", "talkbut.scheduling.automated_runner"]
-        
-        # Add config path if provided
-        if config_path:
-            command_parts.append(config_path)
-        
-        return " ".join(command_parts)
+        # The interpreter part (python -m talkbut.scheduling.automated_runner)
+        # is built once in __init__
+        if not config_path:
+            return self._base_command
+        return f"{self._base_command} {self._quote(config_path)}"
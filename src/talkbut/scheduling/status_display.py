@@ -5,7 +5,9 @@ from pathlib import Path
 
 from .scheduler_manager import SchedulerManager
 from .status_manager import StatusManager
-from .models import ScheduleStatus
+from .models import ScheduleStatus, ErrorRecord
+
+_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
 
 
 def format_status_display(
@@ -31,8 +33,10 @@ def format_status_display(
         
     Requirements: 2.4, 4.1, 4.2, 4.3, 4.4, 4.5
     """
-    # Get current status from scheduler (queries actual system state)
-    status = scheduler_manager.get_status()
+    # Get current status from scheduler (queries actual system state).
+    # With a status manager of our own, the history is read once below
+    # rather than also inside get_status.
+    status = scheduler_manager.get_status(include_history=status_manager is None)
     
     # Get additional info from status manager if available
     if status_manager:
@@ -43,55 +47,46 @@ def format_status_display(
         status.last_run = last_run
         status.recent_errors = recent_errors
     
-    # Build status display
-    lines = []
-    lines.append("=== Automated Daily Logging Status ===")
-    lines.append("")
-    
-    # Platform
-    lines.append(f"Platform: {status.platform}")
-    
-    # Enabled/Disabled
-    if status.enabled:
-        lines.append("Status: ENABLED ✓")
-    else:
-        lines.append("Status: DISABLED")
-    
-    # Schedule time
-    if status.schedule_time:
-        lines.append(f"Schedule Time: {status.schedule_time}")
-    else:
-        lines.append("Schedule Time: Not configured")
-    
-    # Last run
+    # Last and next run
     if status.last_run:
-        lines.append(f"Last Run: {status.last_run.strftime('%Y-%m-%d %H:%M:%S')}")
+        last_run = status.last_run.strftime(_TIME_FORMAT)
     else:
-        lines.append("Last Run: Never")
+        last_run = "Never"
     
-    # Next run
     if status.next_run:
-        lines.append(f"Next Run: {status.next_run.strftime('%Y-%m-%d %H:%M:%S')}")
+        next_run = status.next_run.strftime(_TIME_FORMAT)
+    elif status.enabled:
+        next_run = "Unable to determine"
     else:
-        if status.enabled:
-            lines.append("Next Run: Unable to determine")
-        else:
-            lines.append("Next Run: N/A (disabled)")
+        next_run = "N/A (disabled)"
     
     # Recent errors
     if status.recent_errors:
-        lines.append("")
-        lines.append("Recent Errors:")
-        for i, error in enumerate(status.recent_errors, 1):
-            timestamp_str = error.timestamp.strftime('%Y-%m-%d %H:%M:%S')
-            lines.append(f"  {i}. [{timestamp_str}] {error.error_message}")
-            if error.date_attempted:
-                lines.append(f"     Date attempted: {error.date_attempted}")
+        errors = "Recent Errors:\n" + "\n".join(
+            _format_error(i, error) for i, error in enumerate(status.recent_errors, 1)
+        )
     else:
-        lines.append("")
-        lines.append("Recent Errors: None")
+        errors = "Recent Errors: None"
     
-    return "\n".join(lines)
+    return "\n".join((
+        "=== Automated Daily Logging Status ===",
+        "",
+        f"Platform: {status.platform}",
+        "Status: ENABLED ✓" if status.enabled else "Status: DISABLED",
+        f"Schedule Time: {status.schedule_time or 'Not configured'}",
+        f"Last Run: {last_run}",
+        f"Next Run: {next_run}",
+        "",
+        errors,
+    ))
+
+
+def _format_error(index: int, error: ErrorRecord) -> str:
+    """Format one entry of the Recent Errors section."""
+    line = f"  {index}. [{error.timestamp.strftime(_TIME_FORMAT)}] {error.error_message}"
+    if error.date_attempted:
+        line += f"\n     Date attempted: {error.date_attempted}"
+    return line
 
 
 def display_status(
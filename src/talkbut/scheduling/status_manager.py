@@ -1,9 +1,13 @@
 """StatusManager for tracking automated logging status and errors."""
 
-import json
+import os
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
+
+from talkbut.utils.file_utils import atomic_open
+from talkbut.utils.json_utils import dump, loads
 
 from .models import ErrorRecord
 
@@ -28,8 +32,16 @@ class StatusManager:
         """
         self.status_file = Path(status_file)
         self.max_errors = max_errors
+        # Last status read or written, and the file identity it came from
+        self._cache: Optional[Dict[str, Any]] = None
+        self._cache_key: Optional[Tuple[int, int, int]] = None
         self._ensure_status_file()
     
+    def _file_key(self) -> Tuple[int, int, int]:
+        """(mtime_ns, size, inode) of the status file; changes whenever it is rewritten."""
+        st = os.stat(self.status_file)
+        return st.st_mtime_ns, st.st_size, st.st_ino
+    
     def _ensure_status_file(self) -> None:
         """Ensure status file exists with valid structure."""
         if not self.status_file.exists():
@@ -47,23 +59,35 @@ class StatusManager:
         """
         Read status from file.
         
+        The parsed status is kept in memory and reused while the file's
+        mtime, size and inode are unchanged, so repeated queries cost a
+        stat() instead of a JSON parse. A write by another process changes
+        the key and forces a re-read.
+        
         Returns:
             Status dictionary
         """
         try:
-            with open(self.status_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            key = self._file_key()
+            if self._cache is not None and key == self._cache_key:
+                return self._cache
+            
+            with open(self.status_file, 'rb') as f:
+                data = loads(f.read())
                 # Ensure required keys exist
                 if "last_run" not in data:
                     data["last_run"] = None
-                if "errors" not in data:
-                    data["errors"] = []
+                # Bounded history: appending past max_errors drops the oldest
+                data["errors"] = deque(data.get("errors") or [], maxlen=self.max_errors)
+                self._cache = data
+                self._cache_key = key
                 return data
-        except (json.JSONDecodeError, FileNotFoundError):
-            # Return default structure if file is corrupted or missing
+        except (ValueError, FileNotFoundError):
+            # Return default structure if file is corrupted (ValueError from
+            # either JSON backend) or missing
             return {
                 "last_run": None,
-                "errors": []
+                "errors": deque(maxlen=self.max_errors)
             }
     
     def _write_status(self, data: Dict[str, Any]) -> None:
@@ -73,8 +97,17 @@ class StatusManager:
         Args:
             data: Status dictionary to write
         """
-        with open(self.status_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, default=str)
+        # Callers modify the cached dict in place before writing it, so drop
+        # the cache until the new contents are safely on disk
+        self._cache = None
+        if not isinstance(data["errors"], deque):
+            data["errors"] = deque(data["errors"], maxlen=self.max_errors)
+        # Replace the file atomically: a crash or a concurrent reader never
+        # sees a truncated file, which would read back as empty status
+        with atomic_open(self.status_file) as f:
+            dump({**data, "errors": list(data["errors"])}, f, indent=True)
+        self._cache = data
+        self._cache_key = self._file_key()
     
     def record_run(self, success: bool, error: Optional[str] = None, date_attempted: Optional[str] = None) -> None:
         """
@@ -99,12 +132,9 @@ class StatusManager:
                 "error_message": error or "Unknown error",
                 "date_attempted": date_attempted
             }
+            # errors is a deque(maxlen=max_errors), so the oldest record is
+            # dropped once the history is full
             data["errors"].append(error_record)
-            
-            # Maintain bounded error history
-            if len(data["errors"]) > self.max_errors:
-                # Keep only the most recent errors
-                data["errors"] = data["errors"][-self.max_errors:]
         
         self._write_status(data)
     
@@ -141,23 +171,26 @@ class StatusManager:
         Requirements: 6.4
         """
         data = self._read_status()
-        errors = data.get("errors", [])
         
-        # Get most recent errors (up to limit)
-        recent = errors[-limit:] if len(errors) > limit else errors
-        
-        # Convert to ErrorRecord objects and reverse (most recent first)
         error_records = []
-        for err in reversed(recent):
+        if limit <= 0:
+            return error_records
+        
+        # Walk back from the most recent error, stopping as soon as limit
+        # valid records are found; older entries are never parsed
+        fromisoformat = datetime.fromisoformat
+        for err in reversed(data["errors"]):
             try:
                 error_records.append(ErrorRecord(
-                    timestamp=datetime.fromisoformat(err["timestamp"]),
+                    timestamp=fromisoformat(err["timestamp"]),
                     error_message=err["error_message"],
                     date_attempted=err.get("date_attempted")
                 ))
             except (ValueError, KeyError, TypeError):
                 # Skip malformed error records
                 continue
+            if len(error_records) >= limit:
+                break
         
         return error_records
     
@@ -168,5 +201,5 @@ class StatusManager:
         Requirements: 6.4
         """
         data = self._read_status()
-        data["errors"] = []
+        data["errors"].clear()
         self._write_status(data)
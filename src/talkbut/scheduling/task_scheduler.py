@@ -3,7 +3,86 @@
 import subprocess
 import re
 from datetime import datetime, timedelta
-from typing import Optional
+from time import monotonic
+from typing import Any, Optional, Tuple
+
+try:
+    import pywintypes
+    import win32com.client
+except ImportError:  # pragma: no cover - pywin32 is optional and Windows-only
+    pywintypes = None
+    win32com = None
+
+# "Next Run Time" values schtasks prints: 12/4/2025 6:00:00 PM (US),
+# 04/12/2025 18:00:00 (day first, 24-hour) or 2025-12-04 18:00:00
+_NEXT_RUN_RE = re.compile(
+    r"^\s*(?:(?P<a>\d{1,2})/(?P<b>\d{1,2})/(?P<y>\d{4})|(?P<y2>\d{4})-(?P<m2>\d{2})-(?P<d2>\d{2}))"
+    r"\s+(?P<H>\d{1,2}):(?P<M>\d{2})(?::(?P<S>\d{2}))?\s*(?P<ap>AM|PM)?\s*$",
+    re.IGNORECASE
+)
+
+# "Start Time" value (HH:MM or HH:MM:SS), the fallback when no next run is shown
+_START_TIME_RE = re.compile(r"(\d{1,2}):(\d{2})")
+
+
+def _match_next_run(time_str: str) -> Optional[datetime]:
+    """
+    Parse a schtasks "Next Run Time" value with _NEXT_RUN_RE.
+    
+    Slash dates with AM/PM are read month first, slash dates without it
+    day first, matching the strptime formats this replaces.
+    
+    Args:
+        time_str: Value after "Next Run Time:"
+        
+    Returns:
+        Parsed datetime, or None if the value is not in a known format
+    """
+    match = _NEXT_RUN_RE.match(time_str)
+    if match is None:
+        return None
+    
+    hour = int(match["H"])
+    ampm = match["ap"]
+    if match["y"]:
+        year = int(match["y"])
+        if ampm:
+            month, day = int(match["a"]), int(match["b"])
+        else:
+            day, month = int(match["a"]), int(match["b"])
+    else:
+        if ampm:
+            return None
+        year, month, day = int(match["y2"]), int(match["m2"]), int(match["d2"])
+    
+    if ampm:
+        if not 1 <= hour <= 12:
+            return None
+        hour = hour % 12 + (12 if ampm.upper() == "PM" else 0)
+    
+    try:
+        return datetime(year, month, day, hour, int(match["M"]), int(match["S"] or 0))
+    except ValueError:
+        return None
+
+
+def _from_com_date(value: Any) -> Optional[datetime]:
+    """
+    Convert a Task Scheduler COM date (RegisteredTask.NextRunTime) to a datetime.
+    
+    COM dates carry no time zone; Task Scheduler reports local wall-clock
+    time, so the result is naive like the one parsed from schtasks output.
+    
+    Args:
+        value: Date returned by pywin32
+        
+    Returns:
+        Next run datetime, or None if the task has no next run (COM date 0,
+        i.e. 1899-12-30)
+    """
+    if value is None or value.year < 1900:
+        return None
+    return datetime(value.year, value.month, value.day, value.hour, value.minute, value.second)
 
 
 class TaskScheduler:
@@ -11,9 +90,16 @@ class TaskScheduler:
     
     TASK_NAME = "TalkButDailyLog"
     
+    # How long a task lookup result is reused, in seconds
+    CACHE_TTL = 1.0
+    
     def __init__(self):
         """Initialize TaskScheduler."""
-        pass
+        # (monotonic timestamp, (exists, next run)) of the last lookup
+        self._cache: Optional[Tuple[float, Tuple[bool, Optional[datetime]]]] = None
+        # Root folder of the Task Scheduler COM API; connected on first use
+        self._folder: Any = None
+        self._com_ready: Optional[bool] = None
     
     def create_task(self, time: str, command: str) -> bool:
         """
@@ -59,6 +145,7 @@ class TaskScheduler:
                 text=True,
                 check=False
             )
+            self._cache = None
             
             return result.returncode == 0
             
@@ -79,6 +166,7 @@ class TaskScheduler:
                 text=True,
                 check=False
             )
+            self._cache = None
             
             # Success if task was deleted or didn't exist
             return result.returncode == 0 or "cannot find" in result.stderr.lower()
@@ -86,6 +174,18 @@ class TaskScheduler:
         except (subprocess.SubprocessError, FileNotFoundError):
             return False
     
+    def create_job(self, time: str, command: str) -> bool:
+        """Scheduler interface name for create_task."""
+        return self.create_task(time, command)
+    
+    def remove_job(self) -> bool:
+        """Scheduler interface name for remove_task."""
+        return self.remove_task()
+    
+    def job_exists(self) -> bool:
+        """Scheduler interface name for task_exists."""
+        return self.task_exists()
+    
     def task_exists(self) -> bool:
         """
         Check if the TalkBut scheduled task exists.
@@ -94,18 +194,32 @@ class TaskScheduler:
             True if task exists, False otherwise
         """
         try:
-            result = subprocess.run(
-                ["schtasks", "/Query", "/TN", self.TASK_NAME],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            
-            return result.returncode == 0
+            # The lookup also serves a following get_next_run
+            exists, _ = self._lookup()
+            return exists
             
         except (subprocess.SubprocessError, FileNotFoundError):
             return False
     
+    def describe(self) -> Tuple[bool, Optional[datetime], Optional[str]]:
+        """
+        Report the task's state from a single lookup.
+        
+        Returns:
+            (task exists, next run or None, schedule time as HH:MM or None)
+        """
+        try:
+            exists, next_run = self._lookup()
+        except (subprocess.SubprocessError, FileNotFoundError):
+            return False, None, None
+        
+        if not exists:
+            return False, None, None
+        
+        if next_run is None:
+            return True, None, None
+        return True, next_run, f"{next_run.hour:02d}:{next_run.minute:02d}"
+    
     def get_next_run(self) -> Optional[datetime]:
         """
         Get the next run time from the scheduled task.
@@ -114,60 +228,157 @@ class TaskScheduler:
             Next run datetime, or None if no task exists
         """
         try:
-            # Query task with verbose output to get next run time
-            result = subprocess.run(
-                ["schtasks", "/Query", "/TN", self.TASK_NAME, "/V", "/FO", "LIST"],
-                capture_output=True,
-                text=True,
-                check=False
-            )
+            _, next_run = self._lookup()
+            return next_run
             
-            if result.returncode != 0:
-                return None
+        except (subprocess.SubprocessError, FileNotFoundError):
+            return None
+    
+    def _lookup(self) -> Tuple[bool, Optional[datetime]]:
+        """
+        Find out whether the task exists and when it runs next.
+        
+        Uses the Task Scheduler COM API in-process when pywin32 is installed
+        (``pip install talkbut[windows]``), otherwise one verbose schtasks
+        query. The answer is reused for CACHE_TTL seconds, so task_exists
+        followed by get_next_run costs a single lookup; create_task and
+        remove_task invalidate it.
+        
+        Returns:
+            (task exists, next run or None)
             
-            # Parse output to find "Next Run Time"
-            for line in result.stdout.split("\n"):
-                if "Next Run Time:" in line:
-                    # Extract datetime string
-                    time_str = line.split(":", 1)[1].strip()
-                    
-                    # Handle various datetime formats
-                    # Common format: "12/4/2025 6:00:00 PM"
-                    try:
-                        # Try parsing with different formats
-                        for fmt in [
-                            "%m/%d/%Y %I:%M:%S %p",  # 12/4/2025 6:00:00 PM
-                            "%d/%m/%Y %H:%M:%S",      # 04/12/2025 18:00:00
-                            "%Y-%m-%d %H:%M:%S",      # 2025-12-04 18:00:00
-                        ]:
-                            try:
-                                return datetime.strptime(time_str, fmt)
-                            except ValueError:
-                                continue
-                    except Exception:
-                        pass
+        Raises:
+            FileNotFoundError: If schtasks is needed but not available
+            subprocess.SubprocessError: If schtasks cannot be run
+        """
+        now = monotonic()
+        if self._cache is not None and now - self._cache[0] < self.CACHE_TTL:
+            return self._cache[1]
+        
+        state = self._lookup_com()
+        if state is None:
+            returncode, output = self._query_task()
+            state = (True, self._parse_next_run(output)) if returncode == 0 else (False, None)
+        
+        self._cache = (now, state)
+        return state
+    
+    def _lookup_com(self) -> Optional[Tuple[bool, Optional[datetime]]]:
+        """
+        Look the task up through the Task Scheduler COM API.
+        
+        Returns:
+            (task exists, next run or None), or None if the COM API is not
+            available and schtasks has to be used instead
+        """
+        folder = self._task_folder()
+        if folder is None:
+            return None
+        
+        try:
+            task = folder.GetTask(self.TASK_NAME)
+        except pywintypes.com_error:
+            # GetTask fails when no task is registered under the name
+            return False, None
+        return True, _from_com_date(task.NextRunTime)
+    
+    def _task_folder(self) -> Any:
+        """
+        Connect to the Task Scheduler service once and return its root folder.
+        
+        Returns:
+            The root ITaskFolder, or None without pywin32 or when the service
+            cannot be reached
+        """
+        if self._com_ready is None:
+            self._com_ready = False
+            if win32com is not None:
+                try:
+                    service = win32com.client.Dispatch("Schedule.Service")
+                    service.Connect()
+                    self._folder = service.GetFolder("\\")
+                    self._com_ready = True
+                except pywintypes.com_error:
+                    pass
+        return self._folder if self._com_ready else None
+    
+    def _query_task(self) -> Tuple[int, str]:
+        """
+        Run a verbose schtasks query for the TalkBut task.
+        
+        The query fails exactly when the task does not exist, and its output
+        holds the next run time, so it answers both task_exists and
+        get_next_run.
+        
+        Returns:
+            (returncode, stdout) of the query
             
-            # Fallback: calculate next run from task schedule
-            # Look for "Start Time:" in the output
-            for line in result.stdout.split("\n"):
-                if "Start Time:" in line:
-                    time_str = line.split(":", 1)[1].strip()
-                    # Parse time (format: HH:MM:SS or HH:MM)
-                    match = re.match(r"(\d{1,2}):(\d{2})", time_str)
-                    if match:
-                        hour = int(match.group(1))
-                        minute = int(match.group(2))
-                        
-                        now = datetime.now()
-                        next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                        
-                        # If time has passed today, schedule for tomorrow
-                        if next_run <= now:
-                            next_run += timedelta(days=1)
-                        
-                        return next_run
+        Raises:
+            FileNotFoundError: If schtasks is not available
+            subprocess.SubprocessError: If schtasks cannot be run
+        """
+        result = subprocess.run(
+            ["schtasks", "/Query", "/TN", self.TASK_NAME, "/V", "/FO", "LIST"],
+            capture_output=True,
+            text=True,
+            check=False
+        )
+        return result.returncode, result.stdout
+    
+    def _parse_next_run(self, output: str) -> Optional[datetime]:
+        """
+        Extract the next run time from verbose schtasks output.
+        
+        Args:
+            output: Output of _query_task
             
-            return None
+        Returns:
+            Next run datetime, or None if it cannot be determined
+        """
+        # One pass collects both fields; "Start Time" is only the fallback
+        next_run_str = start_time_str = None
+        for line in output.splitlines():
+            if next_run_str is None and "Next Run Time:" in line:
+                next_run_str = line.split(":", 1)[1].strip()
+            elif start_time_str is None and "Start Time:" in line:
+                start_time_str = line.split(":", 1)[1].strip()
+            if next_run_str is not None and start_time_str is not None:
+                break
+        
+        if next_run_str is not None:
+            # Fast path for the formats schtasks is known to print
+            next_run = _match_next_run(next_run_str)
+            if next_run is not None:
+                return next_run
             
-        except (subprocess.SubprocessError, FileNotFoundError):
-            return None
+            # Otherwise let strptime try the one format the value can be in:
+            # the date separator and an AM/PM suffix tell them apart
+            if "-" in next_run_str:
+                fmt = "%Y-%m-%d %H:%M:%S"      # 2025-12-04 18:00:00
+            elif next_run_str[-2:].upper() in ("AM", "PM"):
+                fmt = "%m/%d/%Y %I:%M:%S %p"  # 12/4/2025 6:00:00 PM
+            else:
+                fmt = "%d/%m/%Y %H:%M:%S"      # 04/12/2025 18:00:00
+            try:
+                return datetime.strptime(next_run_str, fmt)
+            except ValueError:
+                pass
+        
+        # Fallback: calculate next run from task schedule
+        if start_time_str is not None:
+            # Parse time (format: HH:MM:SS or HH:MM)
+            match = _START_TIME_RE.match(start_time_str)
+            if match:
+                hour = int(match.group(1))
+                minute = int(match.group(2))
+                
+                now = datetime.now()
+                next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+                
+                # If time has passed today, schedule for tomorrow
+                if next_run <= now:
+                    next_run += timedelta(days=1)
+                
+                return next_run
+        
+        return None
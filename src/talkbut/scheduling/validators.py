@@ -3,6 +3,8 @@
 import re
 from typing import Tuple
 
+_TIME_RE = re.compile(r'^([0-9]{2}):([0-9]{2})$')
+
 
 def validate_time_format(time_str: str) -> Tuple[bool, str]:
     """
@@ -21,9 +23,19 @@ def validate_time_format(time_str: str) -> Tuple[bool, str]:
     if not time_str:
         return False, "Time string cannot be empty"
     
+    # Fast path for well-formed input: five ASCII characters, digits around
+    # a colon, checked without the regex engine or int(). Anything else
+    # falls through to the checks below, which produce the error message.
+    if len(time_str) == 5 and time_str[2] == ":":
+        digits = time_str[:2] + time_str[3:]
+        if digits.isascii() and digits.isdigit():
+            hours = (ord(digits[0]) - 48) * 10 + ord(digits[1]) - 48
+            minutes = (ord(digits[2]) - 48) * 10 + ord(digits[3]) - 48
+            if hours <= 23 and minutes <= 59:
+                return True, ""
+    
     # Check format with regex
-    pattern = r'^([0-9]{2}):([0-9]{2})$'
-    match = re.match(pattern, time_str)
+    match = _TIME_RE.match(time_str)
     
     if not match:
         return False, "Time must be in HH:MM format (e.g., 09:30, 18:00)"
@@ -0,0 +1,173 @@
+"""
+Daily log files: naming, reading and writing.
+
+Logs are stored as daily_log_YYYY-MM-DD.json by default. Setting
+``storage.format: msgpack`` writes daily_log_YYYY-MM-DD.msgpack instead,
+which is smaller and faster to encode/decode; it needs the optional msgpack
+package (``pip install talkbut[msgpack]``). Readers accept either format, so
+switching formats never hides existing logs.
+"""
+import os
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from talkbut.utils.file_utils import atomic_open
+from talkbut.utils.json_utils import dump, loads
+from talkbut.utils.logger import get_logger
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - depends on the environment
+    msgpack = None
+
+logger = get_logger(__name__)
+
+LOG_PREFIX = "daily_log_"
+
+# Storage format -> file extension; lookups try them in this order
+LOG_EXTENSIONS = {
+    "json": ".json",
+    "msgpack": ".msgpack",
+}
+
+# File extension -> lookup priority (lower wins when a date has both)
+_EXTENSION_RANK = {ext: rank for rank, ext in enumerate(LOG_EXTENSIONS.values())}
+
+
+def resolve_format(fmt: Optional[str]) -> str:
+    """
+    Normalise a configured storage format.
+
+    Unknown formats, and msgpack without the msgpack package, fall back to
+    JSON with a warning rather than failing the run.
+
+    Args:
+        fmt: Value of storage.format (None means JSON)
+
+    Returns:
+        "json" or "msgpack"
+    """
+    fmt = (fmt or "json").lower()
+    if fmt not in LOG_EXTENSIONS:
+        logger.warning(f"Unknown storage.format '{fmt}', using json")
+        return "json"
+    if fmt == "msgpack" and msgpack is None:
+        logger.warning("storage.format is msgpack but msgpack is not installed, using json")
+        return "json"
+    return fmt
+
+
+def log_filename(log_date: date, fmt: str = "json") -> str:
+    """File name of the daily log for log_date in the given format."""
+    return f"{LOG_PREFIX}{log_date.isoformat()}{LOG_EXTENSIONS[fmt]}"
+
+
+def find_daily_log(log_dir: Union[str, Path], log_date: date) -> Optional[Path]:
+    """
+    Locate the daily log for a date in any supported format.
+
+    Args:
+        log_dir: Directory containing log files
+        log_date: Date to look up
+
+    Returns:
+        Path of the log file, or None if there is none
+    """
+    log_dir = Path(log_dir)
+    for fmt in LOG_EXTENSIONS:
+        path = log_dir / log_filename(log_date, fmt)
+        if path.exists():
+            return path
+    return None
+
+
+def list_daily_logs(log_dir: Union[str, Path]) -> Dict[str, Path]:
+    """
+    Map every date that has a daily log to its file, with a single readdir.
+
+    Equivalent to calling find_daily_log for each date, but costs one
+    directory listing instead of a stat per date and format.
+
+    Args:
+        log_dir: Directory containing log files
+
+    Returns:
+        ISO date (YYYY-MM-DD) -> log path (empty if the directory does not exist)
+    """
+    log_dir = Path(log_dir)
+    try:
+        names = os.listdir(log_dir)
+    except FileNotFoundError:
+        return {}
+    logs: Dict[str, Path] = {}
+    for name in names:
+        stem, ext = os.path.splitext(name)
+        rank = _EXTENSION_RANK.get(ext)
+        if rank is None or not stem.startswith(LOG_PREFIX):
+            continue
+        day = stem[len(LOG_PREFIX):]
+        current = logs.get(day)
+        if current is None or rank < _EXTENSION_RANK[current.suffix]:
+            logs[day] = log_dir / name
+    return logs
+
+
+def write_daily_log(
+    log_dir: Union[str, Path],
+    log_date: date,
+    daily_log: Dict[str, Any],
+    fmt: str = "json"
+) -> Path:
+    """
+    Atomically write a daily log, replacing any copy in another format.
+
+    Args:
+        log_dir: Directory containing log files
+        log_date: Date of the log
+        daily_log: Log contents
+        fmt: "json" or "msgpack" (see resolve_format)
+
+    Returns:
+        Path of the written file
+    """
+    log_dir = Path(log_dir)
+    output_path = log_dir / log_filename(log_date, fmt)
+
+    # Stream into a temp file and rename over the target, so a concurrent
+    # run or a crash never leaves a torn log behind
+    with atomic_open(output_path) as f:
+        if fmt == "msgpack":
+            f.write(msgpack.packb(daily_log, use_bin_type=True))
+        else:
+            dump(daily_log, f)
+
+    # A stale log in the other format would otherwise shadow or duplicate it
+    for other in LOG_EXTENSIONS:
+        if other != fmt:
+            (log_dir / log_filename(log_date, other)).unlink(missing_ok=True)
+
+    return output_path
+
+
+def read_daily_log(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Read a daily log file written by write_daily_log.
+
+    Args:
+        path: Log file (.json or .msgpack)
+
+    Returns:
+        Log contents
+
+    Raises:
+        ValueError: If the file is not a valid log, or is msgpack and the
+                    msgpack package is not installed
+    """
+    path = Path(path)
+    data = path.read_bytes()
+    if path.suffix == LOG_EXTENSIONS["msgpack"]:
+        if msgpack is None:
+            raise ValueError(f"Cannot read {path.name}: msgpack is not installed")
+        return msgpack.unpackb(data, raw=False)
+    return loads(data)
@@ -0,0 +1,56 @@
+"""
+File helpers shared by the writers of logs and caches.
+"""
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Iterator, Union
+
+
+@contextmanager
+def atomic_open(path: Union[str, Path]) -> Iterator[BinaryIO]:
+    """
+    Open path for binary writing so readers never see a partial file.
+
+    Writes go to a temporary file next to the target, which is renamed over
+    it with os.replace (atomic on POSIX and Windows) when the block exits
+    cleanly. The temporary name includes the process id, so concurrent runs
+    (e.g. cron and a manual invocation) never share one. If the block or the
+    rename fails, the temporary file is removed and the target is untouched.
+
+    Args:
+        path: Destination file
+
+    Yields:
+        Binary file object to write the complete contents to
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_bytes(path: Union[str, Path], data: bytes) -> None:
+    """
+    Write data to path atomically (see atomic_open).
+
+    Args:
+        path: Destination file
+        data: Complete file contents
+
+    Raises:
+        OSError: If the file cannot be written; the temporary file is removed
+    """
+    with atomic_open(path) as f:
+        f.write(data)
@@ -0,0 +1,71 @@
+"""
+JSON helpers that use orjson when it is installed.
+
+orjson is an optional speedup (``pip install talkbut[fast]``); without it the
+standard library json module is used and the output is identical.
+"""
+import json
+from typing import Any, BinaryIO, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize obj to UTF-8 encoded JSON.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation (default: compact)
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode("utf-8")
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize obj to a JSON string (see dumps_bytes)."""
+    return dumps_bytes(obj, indent=indent).decode("utf-8")
+
+
+def dump(obj: Any, fp: BinaryIO, indent: bool = False) -> None:
+    """
+    Serialize obj as UTF-8 JSON into a binary file (same output as dumps_bytes).
+    
+    orjson encodes in one native call; the stdlib fallback streams encoder
+    chunks into the file instead of building the whole document first.
+    
+    Args:
+        obj: Object to serialize
+        fp: File opened in binary write mode
+        indent: Pretty-print with 2-space indentation (default: compact)
+    """
+    if orjson is not None:
+        fp.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0))
+        return
+    if indent:
+        encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+    else:
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+    fp.writelines(chunk.encode("utf-8") for chunk in encoder.iterencode(obj))
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document.
+
+    Raises:
+        ValueError: If data is not valid JSON (json.JSONDecodeError and
+                    orjson.JSONDecodeError are both ValueError subclasses)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -3,6 +3,21 @@ import pytest
 import os
 from datetime import datetime
 from talkbut.models.commit import Commit
+from talkbut.scheduling.cron_scheduler import CronScheduler
+
+
+@pytest.fixture(autouse=True, scope="session")
+def cron_environment(tmp_path_factory):
+    """
+    Isolate CronScheduler from the machine running the tests.
+    
+    The lock file goes to a temp directory instead of the real home, and
+    crontab is treated as installed (tests mock the subprocess calls).
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(CronScheduler, "LOCK_FILE", tmp_path_factory.mktemp("cron") / "cron.lock")
+        mp.setattr("talkbut.scheduling.cron_scheduler._find_crontab", lambda: "crontab")
+        yield
 
 
 @pytest.fixture
@@ -2,11 +2,39 @@
 import pytest
 from unittest.mock import MagicMock, patch
 from datetime import date, datetime
-from talkbut.processors.ai_analyzer import AIAnalyzer
+from talkbut.processors.ai_analyzer import AIAnalyzer, _get_model, _read_prompt_template
 from talkbut.models.commit import Commit
 from talkbut.models.report import DailyReport
 
 
+# Generation settings for tests that talk to a (mocked) model
+AI_SETTINGS = {
+    "ai.model": "gemini-1.5-flash",
+    "ai.temperature": 0.3,
+    "ai.top_p": 0.95,
+    "ai.top_k": 40,
+    "ai.max_output_tokens": 8192,
+}
+
+
+def _mock_config(api_key=None, settings=None):
+    """Fake Config whose get() answers from settings, else the caller's default."""
+    config = MagicMock()
+    config.ai_api_key = api_key
+    config.get.side_effect = (settings or {}).get
+    return config
+
+
+@pytest.fixture(autouse=True)
+def clear_analyzer_caches():
+    """Clear module-level caches so each test sees its own genai mock."""
+    _get_model.cache_clear()
+    _read_prompt_template.cache_clear()
+    yield
+    _get_model.cache_clear()
+    _read_prompt_template.cache_clear()
+
+
 class TestAIAnalyzer:
     """Tests for AIAnalyzer."""
 
@@ -37,32 +65,20 @@ class TestAIAnalyzer:
         ]
 
     @patch('talkbut.processors.ai_analyzer.genai')
-    @patch('talkbut.processors.ai_analyzer.ConfigManager')
+    @patch('talkbut.processors.ai_analyzer.get_config')
     def test_analyzer_no_api_key(self, mock_config_cls, mock_genai):
         """Test analyzer without API key."""
-        mock_config = MagicMock()
-        mock_config.ai_api_key = None
-        mock_config.get.return_value = None
-        mock_config_cls.return_value = mock_config
+        mock_config_cls.return_value = _mock_config()
         
         analyzer = AIAnalyzer()
         
         assert analyzer.model is None
 
     @patch('talkbut.processors.ai_analyzer.genai')
-    @patch('talkbut.processors.ai_analyzer.ConfigManager')
+    @patch('talkbut.processors.ai_analyzer.get_config')
     def test_analyzer_with_api_key(self, mock_config_cls, mock_genai):
         """Test analyzer initializes with API key."""
-        mock_config = MagicMock()
-        mock_config.ai_api_key = "test_api_key"
-        mock_config.get.side_effect = lambda key, default=None: {
-            "ai.model": "gemini-1.5-flash",
-            "ai.temperature": 0.3,
-            "ai.top_p": 0.95,
-            "ai.top_k": 40,
-            "ai.max_output_tokens": 8192,
-        }.get(key, default)
-        mock_config_cls.return_value = mock_config
+        mock_config_cls.return_value = _mock_config("test_api_key", AI_SETTINGS)
         
         mock_model = MagicMock()
         mock_genai.GenerativeModel.return_value = mock_model
@@ -73,13 +89,10 @@ class TestAIAnalyzer:
         assert analyzer.model is not None
 
     @patch('talkbut.processors.ai_analyzer.genai')
-    @patch('talkbut.processors.ai_analyzer.ConfigManager')
+    @patch('talkbut.processors.ai_analyzer.get_config')
     def test_analyze_commits_no_model(self, mock_config_cls, mock_genai, sample_commits):
         """Test analyzing commits without AI model returns basic report."""
-        mock_config = MagicMock()
-        mock_config.ai_api_key = None
-        mock_config.get.return_value = None
-        mock_config_cls.return_value = mock_config
+        mock_config_cls.return_value = _mock_config()
         
         analyzer = AIAnalyzer()
         report = analyzer.analyze_commits(sample_commits, date(2023, 1, 1))
@@ -91,13 +104,10 @@ class TestAIAnalyzer:
         assert "pending" in report.ai_summary.lower() or "auto-generated" in report.ai_summary.lower()
 
     @patch('talkbut.processors.ai_analyzer.genai')
-    @patch('talkbut.processors.ai_analyzer.ConfigManager')
+    @patch('talkbut.processors.ai_analyzer.get_config')
     def test_analyze_commits_empty(self, mock_config_cls, mock_genai):
         """Test analyzing empty commits list."""
-        mock_config = MagicMock()
-        mock_config.ai_api_key = None
-        mock_config.get.return_value = None
-        mock_config_cls.return_value = mock_config
+        mock_config_cls.return_value = _mock_config()
         
         analyzer = AIAnalyzer()
         report = analyzer.analyze_commits([], date(2023, 1, 1))
@@ -107,19 +117,10 @@ class TestAIAnalyzer:
         assert report.deletions == 0
 
     @patch('talkbut.processors.ai_analyzer.genai')
-    @patch('talkbut.processors.ai_analyzer.ConfigManager')
+    @patch('talkbut.processors.ai_analyzer.get_config')
     def test_analyze_commits_with_ai(self, mock_config_cls, mock_genai, sample_commits):
         """Test analyzing commits with AI response."""
-        mock_config = MagicMock()
-        mock_config.ai_api_key = "test_key"
-        mock_config.get.side_effect = lambda key, default=None: {
-            "ai.model": "gemini-1.5-flash",
-            "ai.temperature": 0.3,
-            "ai.top_p": 0.95,
-            "ai.top_k": 40,
-            "ai.max_output_tokens": 8192,
-        }.get(key, default)
-        mock_config_cls.return_value = mock_config
+        mock_config_cls.return_value = _mock_config("test_key", AI_SETTINGS)
         
         # Mock AI response
         mock_response = MagicMock()
@@ -137,19 +138,10 @@ class TestAIAnalyzer:
         assert report.tasks == [{"task": "Login"}]
 
     @patch('talkbut.processors.ai_analyzer.genai')
-    @patch('talkbut.processors.ai_analyzer.ConfigManager')
+    @patch('talkbut.processors.ai_analyzer.get_config')
     def test_analyze_commits_ai_error(self, mock_config_cls, mock_genai, sample_commits):
         """Test handling AI API errors gracefully."""
-        mock_config = MagicMock()
-        mock_config.ai_api_key = "test_key"
-        mock_config.get.side_effect = lambda key, default=None: {
-            "ai.model": "gemini-1.5-flash",
-            "ai.temperature": 0.3,
-            "ai.top_p": 0.95,
-            "ai.top_k": 40,
-            "ai.max_output_tokens": 8192,
-        }.get(key, default)
-        mock_config_cls.return_value = mock_config
+        mock_config_cls.return_value = _mock_config("test_key", AI_SETTINGS)
         
         mock_model = MagicMock()
         mock_model.generate_content.side_effect = Exception("API Error")
@@ -163,19 +155,10 @@ class TestAIAnalyzer:
         assert "failed" in report.ai_summary.lower()
 
     @patch('talkbut.processors.ai_analyzer.genai')
-    @patch('talkbut.processors.ai_analyzer.ConfigManager')
+    @patch('talkbut.processors.ai_analyzer.get_config')
     def test_analyze_commits_json_in_code_block(self, mock_config_cls, mock_genai, sample_commits):
         """Test parsing AI response wrapped in code blocks."""
-        mock_config = MagicMock()
-        mock_config.ai_api_key = "test_key"
-        mock_config.get.side_effect = lambda key, default=None: {
-            "ai.model": "gemini-1.5-flash",
-            "ai.temperature": 0.3,
-            "ai.top_p": 0.95,
-            "ai.top_k": 40,
-            "ai.max_output_tokens": 8192,
-        }.get(key, default)
-        mock_config_cls.return_value = mock_config
+        mock_config_cls.return_value = _mock_config("test_key", AI_SETTINGS)
         
         # Mock AI response with code block
         mock_response = MagicMock()
@@ -189,3 +172,152 @@ class TestAIAnalyzer:
         report = analyzer.analyze_commits(sample_commits, date(2023, 1, 1))
         
         assert report.ai_summary == "Test summary"
+
+    @pytest.mark.parametrize("text", [
+        '```json\n{"summary": "Fenced"}\n```',
+        '```\n{"summary": "Fenced"}\n```\n',
+        '  ```JSON{"summary": "Fenced"}```',
+        '{"summary": "Fenced"}',
+    ])
+    @patch('talkbut.processors.ai_analyzer.genai')
+    @patch('talkbut.processors.ai_analyzer.get_config')
+    def test_decode_response_fence_variants(self, mock_config_cls, mock_genai, text):
+        """Test code fences are stripped regardless of language tag or spacing."""
+        mock_config_cls.return_value = _mock_config()
+        
+        response = MagicMock()
+        response.text = text
+        
+        assert AIAnalyzer()._decode_response(response) == {"summary": "Fenced"}
+
+    @patch('talkbut.processors.ai_analyzer.genai')
+    @patch('talkbut.processors.ai_analyzer.get_config')
+    def test_model_reused_across_instances(self, mock_config_cls, mock_genai):
+        """Test the model is built once and shared between analyzers."""
+        mock_config_cls.return_value = _mock_config("test_key", {"ai.model": "gemini-1.5-flash"})
+        
+        first = AIAnalyzer()
+        second = AIAnalyzer()
+        
+        assert first.model is second.model
+        mock_genai.GenerativeModel.assert_called_once_with(model_name="gemini-1.5-flash")
+
+    @patch('talkbut.processors.ai_analyzer.genai')
+    @patch('talkbut.processors.ai_analyzer.get_config')
+    def test_analyze_commits_batch_single_request(self, mock_config_cls, mock_genai, sample_commits):
+        """Test several days are analyzed with one AI request."""
+        mock_config_cls.return_value = _mock_config("test_key")
+        
+        mock_response = MagicMock()
+        mock_response.text = (
+            '{"days": ['
+            '{"date": "2023-01-02", "summary": "Day two", "categories": {}, "tasks": []},'
+            '{"date": "2023-01-01", "summary": "Day one", "categories": {"feature": 1}, "tasks": []}'
+            ']}'
+        )
+        mock_model = MagicMock()
+        mock_model.generate_content.return_value = mock_response
+        mock_genai.GenerativeModel.return_value = mock_model
+        
+        analyzer = AIAnalyzer()
+        reports = analyzer.analyze_commits_batch([
+            (date(2023, 1, 1), sample_commits[:1]),
+            (date(2023, 1, 2), sample_commits[1:]),
+            (date(2023, 1, 3), []),
+        ])
+        
+        assert mock_model.generate_content.call_count == 1
+        assert [r.date for r in reports] == [date(2023, 1, 1), date(2023, 1, 2), date(2023, 1, 3)]
+        assert reports[0].ai_summary == "Day one"
+        assert reports[0].categories == {"feature": 1}
+        assert reports[0].insertions == 50
+        assert reports[1].ai_summary == "Day two"
+        assert reports[2].total_commits == 0
+
+    @patch('talkbut.processors.ai_analyzer.genai')
+    @patch('talkbut.processors.ai_analyzer.get_config')
+    def test_analyze_commits_batch_missing_day_falls_back(self, mock_config_cls, mock_genai, sample_commits):
+        """Test a day missing from the batch answer is analyzed on its own."""
+        mock_config_cls.return_value = _mock_config("test_key")
+        
+        batch_response = MagicMock()
+        batch_response.text = '{"days": [{"date": "2023-01-01", "summary": "Day one"}]}'
+        single_response = MagicMock()
+        single_response.text = '{"summary": "Day two alone"}'
+        mock_model = MagicMock()
+        mock_model.generate_content.side_effect = [batch_response, single_response]
+        mock_genai.GenerativeModel.return_value = mock_model
+        
+        analyzer = AIAnalyzer()
+        reports = analyzer.analyze_commits_batch([
+            (date(2023, 1, 1), sample_commits[:1]),
+            (date(2023, 1, 2), sample_commits[1:]),
+        ])
+        
+        assert mock_model.generate_content.call_count == 2
+        assert reports[0].ai_summary == "Day one"
+        assert reports[1].ai_summary == "Day two alone"
+
+    @patch('talkbut.processors.ai_analyzer.genai')
+    @patch('talkbut.processors.ai_analyzer.get_config')
+    def test_analyze_commits_batch_unreadable_answer_falls_back(self, mock_config_cls, mock_genai, sample_commits):
+        """Test an answer that is not JSON is retried one day at a time."""
+        mock_config_cls.return_value = _mock_config("test_key")
+        
+        batch_response = MagicMock()
+        batch_response.text = "Sorry, I cannot help with that."
+        single_response = MagicMock()
+        single_response.text = '{"summary": "Alone"}'
+        mock_model = MagicMock()
+        mock_model.generate_content.side_effect = [batch_response, single_response, single_response]
+        mock_genai.GenerativeModel.return_value = mock_model
+        
+        analyzer = AIAnalyzer()
+        reports = analyzer.analyze_commits_batch([
+            (date(2023, 1, 1), sample_commits[:1]),
+            (date(2023, 1, 2), sample_commits[1:]),
+        ])
+        
+        assert mock_model.generate_content.call_count == 3
+        assert [r.ai_summary for r in reports] == ["Alone", "Alone"]
+
+    @patch('talkbut.processors.ai_analyzer.genai')
+    @patch('talkbut.processors.ai_analyzer.get_config')
+    def test_analyze_commits_batch_api_error_not_multiplied(self, mock_config_cls, mock_genai, sample_commits):
+        """Test a quota error is raised after one request, without per-day retries."""
+        mock_config_cls.return_value = _mock_config("test_key")
+        
+        mock_model = MagicMock()
+        mock_model.generate_content.side_effect = RuntimeError("429 Resource exhausted")
+        mock_genai.GenerativeModel.return_value = mock_model
+        
+        analyzer = AIAnalyzer()
+        with pytest.raises(RuntimeError, match="429"):
+            analyzer.analyze_commits_batch([
+                (date(2023, 1, 1), sample_commits[:1]),
+                (date(2023, 1, 2), sample_commits[1:]),
+            ])
+        
+        mock_model.generate_content.assert_called_once()
+
+    @patch('talkbut.processors.ai_analyzer.genai')
+    @patch('talkbut.processors.ai_analyzer.get_config')
+    def test_generation_config_applied(self, mock_config_cls, mock_genai, sample_commits):
+        """Test configured generation settings are sent with each request."""
+        mock_config = _mock_config("test_key", {"ai.temperature": 0.7, "ai.max_output_tokens": 1024})
+        mock_config_cls.return_value = mock_config
+        
+        mock_response = MagicMock()
+        mock_response.text = '{"summary": "ok"}'
+        mock_model = MagicMock()
+        mock_model.generate_content.return_value = mock_response
+        mock_genai.GenerativeModel.return_value = mock_model
+        
+        analyzer = AIAnalyzer()
+        mock_config.get.reset_mock()
+        analyzer.analyze_commits(sample_commits, date(2023, 1, 1))
+        
+        generation_config = mock_model.generate_content.call_args.kwargs["generation_config"]
+        assert generation_config["temperature"] == 0.7
+        assert generation_config["max_output_tokens"] == 1024
+        mock_config.get.assert_not_called()
@@ -1,18 +1,66 @@
 """Tests for automated runner functionality."""
 
 import pytest
-import tempfile
-import json
-from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, Mock, patch
 from datetime import datetime, date
 
+from talkbut.core.config import ConfigManager
+from talkbut.models.commit import Commit
+from talkbut.models.report import DailyReport
+from talkbut.scheduling import automated_runner
 from talkbut.scheduling.automated_runner import AutomatedRunner, APIError
 
 
+def _commit():
+    """A real Commit; cheaper than a Mock and only has the model's attributes."""
+    return Commit(
+        hash="abc1234",
+        author="Test User",
+        email="test@example.com",
+        date=datetime(2025, 12, 7, 10, 0),
+        message="feat: test commit",
+    )
+
+
+def _make_config(git_repos=None, get=None, schedule=None):
+    """Fake ConfigManager answering the three things the runner reads."""
+    config = Mock(spec=ConfigManager)
+    config.git_repos = git_repos or []
+    config.get.return_value = get
+    config.get_schedule_config.return_value = schedule or {}
+    return config
+
+
 class TestAutomatedRunner:
     """Tests for AutomatedRunner class."""
     
+    @pytest.fixture(autouse=True)
+    def mocks(self):
+        """
+        Patch the runner's collaborators for every test in one place.
+        
+        Tests configure the mocks through the returned dict (keyed by the
+        patched name) instead of stacking @patch decorators.
+        """
+        with patch.multiple(
+            'talkbut.scheduling.automated_runner',
+            get_config=DEFAULT,
+            StatusManager=DEFAULT,
+            GitCollector=DEFAULT,
+            DataParser=DEFAULT,
+            AIAnalyzer=DEFAULT,
+            log_error=DEFAULT,
+        ) as mocks:
+            yield mocks
+    
+    @pytest.fixture(autouse=True)
+    def sleeps(self, monkeypatch):
+        """Record retry backoff delays instead of sleeping."""
+        calls = []
+        monkeypatch.setattr(automated_runner, "time", SimpleNamespace(sleep=calls.append))
+        return calls
+    
     def test_runner_initialization(self):
         """Test that runner can be initialized."""
         runner = AutomatedRunner()
@@ -25,16 +73,14 @@ class TestAutomatedRunner:
         runner = AutomatedRunner(config_path="/tmp/test_config.yaml")
         assert runner.config_path == "/tmp/test_config.yaml"
     
-    @patch('talkbut.scheduling.automated_runner.ConfigManager')
-    @patch('talkbut.scheduling.automated_runner.StatusManager')
-    def test_load_configuration_success(self, mock_status_manager, mock_config_manager):
+    def test_load_configuration_success(self, mocks):
         """Test successful configuration loading."""
         # Setup mocks
         mock_config = Mock()
         mock_config.get_schedule_config.return_value = {
             'status_file': './data/schedule_status.json'
         }
-        mock_config_manager.return_value = mock_config
+        mocks['get_config'].return_value = mock_config
         
         # Create runner and load config
         runner = AutomatedRunner()
@@ -45,11 +91,10 @@ class TestAutomatedRunner:
         assert runner.config is not None
         assert runner.status_manager is not None
     
-    @patch('talkbut.scheduling.automated_runner.ConfigManager')
-    def test_load_configuration_failure(self, mock_config_manager):
+    def test_load_configuration_failure(self, mocks):
         """Test configuration loading failure."""
         # Setup mock to raise exception
-        mock_config_manager.side_effect = Exception("Config error")
+        mocks['get_config'].side_effect = Exception("Config error")
         
         # Create runner and try to load config
         runner = AutomatedRunner()
@@ -59,26 +104,21 @@ class TestAutomatedRunner:
         assert result is False
         assert runner.config is None
     
-    @patch('talkbut.scheduling.automated_runner.GitCollector')
-    @patch('talkbut.scheduling.automated_runner.DataParser')
-    def test_collect_commits_success(self, mock_parser, mock_collector_class):
+    def test_collect_commits_success(self, mocks):
         """Test successful commit collection."""
         # Setup mocks
-        mock_commit = Mock()
-        mock_commit.repo_name = None
-        
         mock_collector = Mock()
-        mock_collector.collect_commits.return_value = [mock_commit]
-        mock_collector_class.return_value = mock_collector
+        mock_collector.collect_commits.return_value = [_commit()]
+        mocks['GitCollector'].return_value = mock_collector
         
         mock_parser_instance = Mock()
-        mock_parser.return_value = mock_parser_instance
+        mocks['DataParser'].return_value = mock_parser_instance
         
         # Create runner with mock config
         runner = AutomatedRunner()
-        runner.config = Mock()
-        runner.config.git_repos = [{'name': 'test_repo', 'path': '/tmp/test'}]
-        runner.config.get.return_value = 'test@example.com'
+        runner.config = _make_config(
+            git_repos=[{'name': 'test_repo', 'path': '/tmp/test'}], get='test@example.com'
+        )
         
         # Collect commits
         success, commits, error = runner._collect_commits('2025-12-07')
@@ -90,13 +130,11 @@ class TestAutomatedRunner:
         assert error is None
         assert commits[0].repo_name == 'test_repo'
     
-    @patch('talkbut.scheduling.automated_runner.GitCollector')
-    def test_collect_commits_no_repos(self, mock_collector_class):
+    def test_collect_commits_no_repos(self):
         """Test commit collection with no repositories configured."""
         # Create runner with mock config (no repos)
         runner = AutomatedRunner()
-        runner.config = Mock()
-        runner.config.git_repos = []
+        runner.config = _make_config()
         
         # Collect commits
         success, commits, error = runner._collect_commits('2025-12-07')
@@ -106,181 +144,195 @@ class TestAutomatedRunner:
         assert commits is None
         assert error == "No repositories configured"
     
-    @patch('talkbut.scheduling.automated_runner.AIAnalyzer')
-    def test_analyze_and_save_success(self, mock_analyzer_class):
+    def test_analyze_and_save_success(self, mocks, tmp_path, monkeypatch):
         """Test successful analysis and save."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Setup mocks
-            mock_report = Mock()
-            mock_report.ai_summary = "Test summary"
-            mock_report.total_commits = 5
-            mock_report.files_changed = 10
-            mock_report.insertions = 100
-            mock_report.deletions = 50
-            mock_report.categories = ["feature", "bugfix"]
-            mock_report.tasks = []
-            
-            mock_analyzer = Mock()
-            mock_analyzer.analyze_commits.return_value = mock_report
-            mock_analyzer_class.return_value = mock_analyzer
-            
-            # Create runner with mock config
-            runner = AutomatedRunner()
-            runner.config = Mock()
-            runner.config.get.return_value = tmpdir
-            
-            # Create mock commits
-            mock_commits = [Mock()]
-            
-            # Analyze and save
-            success, error = runner._analyze_and_save(mock_commits, '2025-12-07')
-            
-            # Verify
-            assert success is True
-            assert error is None
-            
-            # Check that file was created
-            log_file = Path(tmpdir) / 'daily_log_2025-12-07.json'
-            assert log_file.exists()
-            
-            # Verify content
-            with open(log_file, 'r') as f:
-                data = json.load(f)
-                assert data['date'] == '2025-12-07'
-                assert data['summary'] == "Test summary"
-                assert data['stats']['commits'] == 5
+        # Setup mocks
+        report = DailyReport(
+            date=date(2025, 12, 7),
+            total_commits=5,
+            files_changed=10,
+            insertions=100,
+            deletions=50,
+            commits=[],
+            ai_summary="Test summary",
+            categories={"feature": 1, "bugfix": 1},
+        )
+        
+        mock_analyzer = Mock()
+        mock_analyzer.analyze_commits_batch.return_value = [report]
+        mocks['AIAnalyzer'].return_value = mock_analyzer
+        
+        # Capture the daily log instead of writing and re-reading it
+        written = []
+        monkeypatch.setattr(
+            automated_runner, "write_daily_log", lambda *args: written.extend(args)
+        )
+        
+        # Create runner with mock config
+        runner = AutomatedRunner()
+        runner.config = _make_config(get=str(tmp_path))
+        
+        # Create commits
+        commits = [_commit()]
+        
+        # Analyze and save
+        success, error = runner._analyze_and_save(commits, '2025-12-07')
+        
+        # Verify
+        assert success is True
+        assert error is None
+        
+        # Check the log handed to storage (file I/O is covered by test_daily_logs)
+        log_dir, log_date, data, fmt = written
+        assert log_dir == tmp_path
+        assert log_date == date(2025, 12, 7)
+        assert fmt == 'json'
+        assert data['date'] == '2025-12-07'
+        assert data['summary'] == "Test summary"
+        assert data['stats']['commits'] == 5
     
-    @patch('talkbut.scheduling.automated_runner.AIAnalyzer')
-    def test_analyze_and_save_api_error(self, mock_analyzer_class):
+    def test_analyze_and_save_api_error(self, mocks):
         """Test that API errors are raised as APIError."""
         # Setup mock to raise API error
         mock_analyzer = Mock()
-        mock_analyzer.analyze_commits.side_effect = Exception("API rate limit exceeded")
-        mock_analyzer_class.return_value = mock_analyzer
+        mock_analyzer.analyze_commits_batch.side_effect = Exception("API rate limit exceeded")
+        mocks['AIAnalyzer'].return_value = mock_analyzer
         
         # Create runner with mock config
         runner = AutomatedRunner()
-        runner.config = Mock()
-        runner.config.get.return_value = '/tmp'
+        runner.config = _make_config(get='/tmp')
         
-        # Create mock commits
-        mock_commits = [Mock()]
+        # Create commits
+        commits = [_commit()]
         
         # Analyze and save should raise APIError
         with pytest.raises(APIError):
-            runner._analyze_and_save(mock_commits, '2025-12-07')
+            runner._analyze_and_save(commits, '2025-12-07')
     
-    @patch('talkbut.scheduling.automated_runner.time.sleep')
-    def test_run_with_retry_success_first_attempt(self, mock_sleep):
-        """Test successful run on first attempt."""
+    @pytest.mark.parametrize("error", [
+        TimeoutError("read timed out"),
+        ConnectionResetError("peer reset"),
+        Exception("Quota exceeded for model"),
+    ])
+    def test_analyze_and_save_retryable_errors(self, mocks, error):
+        """Test transient error types and API messages are raised as APIError."""
+        mocks['AIAnalyzer'].return_value.analyze_commits_batch.side_effect = error
         runner = AutomatedRunner()
+        runner.config = _make_config(get='/tmp')
         
-        # Mock all dependencies
-        runner._load_configuration = Mock(return_value=True)
-        runner._collect_commits = Mock(return_value=(True, [Mock()], None))
-        runner._analyze_and_save = Mock(return_value=(True, None))
-        runner.status_manager = Mock()
+        with pytest.raises(APIError):
+            runner._analyze_and_save([_commit()], '2025-12-07')
+    
+    def test_analyze_and_save_non_api_error(self, mocks):
+        """Test unrelated errors are reported, not retried."""
+        mocks['AIAnalyzer'].return_value.analyze_commits_batch.side_effect = ValueError("rapid parse failure")
+        runner = AutomatedRunner()
+        runner.config = _make_config(get='/tmp')
         
-        # Run with retry
-        exit_code = runner.run_with_retry()
+        success, error = runner._analyze_and_save([_commit()], '2025-12-07')
         
-        # Verify
-        assert exit_code == 0
-        runner.status_manager.record_run.assert_called_once_with(success=True)
-        mock_sleep.assert_not_called()  # No retries needed
+        assert success is False
+        assert "rapid parse failure" in error
     
-    @patch('talkbut.scheduling.automated_runner.time.sleep')
-    def test_run_with_retry_api_error_then_success(self, mock_sleep):
-        """Test retry logic with API error then success."""
-        runner = AutomatedRunner()
+    def test_rate_limited_analysis_retried_not_saved(self, mocks, sleeps, tmp_path):
+        """Test a 429 from the real analyzer is retried and never saved as a log."""
+        google_exceptions = pytest.importorskip("google.api_core.exceptions")
+        from talkbut.processors import ai_analyzer
+        
+        ai_config = Mock()
+        ai_config.ai_api_key = "rate-limited-key"
+        ai_config.get.side_effect = lambda key, default=None: default
+        mocks['AIAnalyzer'].side_effect = ai_analyzer.AIAnalyzer
         
-        # Mock configuration and status manager
+        runner = AutomatedRunner()
         runner._load_configuration = Mock(return_value=True)
         runner.status_manager = Mock()
-        runner.config = Mock()
-        runner.config.get_schedule_config.return_value = {
-            'error_log': '/tmp/test_error.log'
-        }
-        
-        # Mock collect commits to succeed
-        runner._collect_commits = Mock(return_value=(True, [Mock()], None))
-        
-        # Mock analyze to fail once with API error, then succeed
-        runner._analyze_and_save = Mock(side_effect=[
-            APIError("API timeout"),
-            (True, None)
-        ])
+        runner.config = _make_config(get=str(tmp_path / 'logs'))
+        runner._collect_commits = Mock(return_value=(True, [_commit()], None))
         
-        # Run with retry
-        exit_code = runner.run_with_retry()
+        ai_analyzer._get_model.cache_clear()
+        try:
+            with patch.object(ai_analyzer, 'get_config', return_value=ai_config), \
+                    patch.object(ai_analyzer, 'genai') as mock_genai:
+                model = mock_genai.GenerativeModel.return_value
+                model.generate_content.side_effect = google_exceptions.TooManyRequests("quota")
+                
+                exit_code = runner.run_with_retry(max_retries=3)
+        finally:
+            ai_analyzer._get_model.cache_clear()
         
-        # Verify
-        assert exit_code == 0
-        runner.status_manager.record_run.assert_called_once_with(success=True)
-        mock_sleep.assert_called_once_with(1)  # 2^0 = 1 second backoff
-    
-    @patch('talkbut.scheduling.automated_runner.time.sleep')
-    @patch('talkbut.scheduling.automated_runner.log_error')
-    def test_run_with_retry_all_attempts_fail(self, mock_log_error, mock_sleep):
-        """Test that all retry attempts are exhausted."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            runner = AutomatedRunner()
-            
-            # Mock configuration and status manager
-            runner._load_configuration = Mock(return_value=True)
-            runner.status_manager = Mock()
-            runner.config = Mock()
-            runner.config.get_schedule_config.return_value = {
-                'error_log': f'{tmpdir}/test_error.log'
-            }
-            
-            # Mock collect commits to succeed
-            runner._collect_commits = Mock(return_value=(True, [Mock()], None))
-            
-            # Mock analyze to always fail with API error
-            runner._analyze_and_save = Mock(side_effect=APIError("API error"))
-            
-            # Run with retry
-            exit_code = runner.run_with_retry(max_retries=3)
-            
-            # Verify
-            assert exit_code == 1
-            runner.status_manager.record_run.assert_called_once()
-            call_args = runner.status_manager.record_run.call_args
-            assert call_args[1]['success'] is False
-            
-            # Verify exponential backoff was used
-            assert mock_sleep.call_count == 2  # 2 retries (not on last attempt)
-            mock_sleep.assert_any_call(1)  # 2^0
-            mock_sleep.assert_any_call(2)  # 2^1
+        assert exit_code == 1
+        assert model.generate_content.call_count == 3
+        assert len(sleeps) == 2
+        assert runner.status_manager.record_run.call_args.kwargs['success'] is False
+        assert not (tmp_path / 'logs').exists()
     
-    @patch('talkbut.scheduling.automated_runner.time.sleep')
-    def test_run_with_retry_no_commits(self, mock_sleep):
-        """Test successful run when no commits found."""
+    @pytest.mark.parametrize("loaded, commits, analyze, expected_exit, backoff", [
+        pytest.param(True, [_commit()], [(True, None)], 0, [], id="success_first_attempt"),
+        pytest.param(
+            True, [_commit()], [APIError("API timeout"), (True, None)], 0, [1],
+            id="api_error_then_success"
+        ),
+        pytest.param(True, [_commit()], [APIError("API error")], 1, [1, 2], id="all_attempts_fail"),
+        pytest.param(
+            True, [_commit()], [ValueError("bad config")], 1, [], id="unrecoverable_no_backoff"
+        ),
+        pytest.param(True, [], [], 0, [], id="no_commits"),
+        pytest.param(False, None, [], 1, [], id="config_load_failure"),
+    ])
+    def test_run_with_retry(self, sleeps, tmp_path, loaded, commits, analyze, expected_exit, backoff):
+        """Test exit code, recorded status and backoff for each retry scenario."""
         runner = AutomatedRunner()
         
-        # Mock all dependencies
-        runner._load_configuration = Mock(return_value=True)
-        runner._collect_commits = Mock(return_value=(True, [], None))  # No commits
+        # Mock configuration, status manager and the pipeline steps
+        runner._load_configuration = Mock(return_value=loaded)
         runner.status_manager = Mock()
+        runner.config = _make_config(schedule={'error_log': str(tmp_path / 'test_error.log')})
+        runner._collect_commits = Mock(return_value=(True, commits, None))
+        
+        # analyze lists the outcome of each attempt; the last one repeats
+        attempts = []
+        
+        def analyze_and_save(commits, date_str):
+            outcome = analyze[min(len(attempts), len(analyze) - 1)]
+            attempts.append(date_str)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        
+        runner._analyze_and_save = analyze_and_save
         
         # Run with retry
-        exit_code = runner.run_with_retry()
+        exit_code = runner.run_with_retry(max_retries=3)
         
         # Verify
-        assert exit_code == 0
-        runner.status_manager.record_run.assert_called_once_with(success=True)
-        mock_sleep.assert_not_called()
+        assert exit_code == expected_exit
+        record_run = runner.status_manager.record_run
+        if loaded:
+            record_run.assert_called_once()
+            assert record_run.call_args.kwargs['success'] is (expected_exit == 0)
+        else:
+            record_run.assert_not_called()
+        
+        # Exponential backoff: 2^attempt seconds plus up to 50% jitter,
+        # between attempts only
+        assert len(sleeps) == len(backoff)
+        assert len(attempts) == (len(backoff) + 1 if analyze else 0)
+        for delay, base in zip(sleeps, backoff):
+            assert base <= delay <= base * 1.5
     
-    def test_run_with_retry_config_load_failure(self):
-        """Test that config load failure returns error code."""
+    @pytest.mark.parametrize("max_retries", [6, 10])
+    def test_run_with_retry_caps_delay_at_max(self, sleeps, tmp_path, max_retries):
+        """Test backoff stops growing at MAX_BACKOFF_SECONDS."""
         runner = AutomatedRunner()
+        runner._load_configuration = Mock(return_value=True)
+        runner.status_manager = Mock()
+        runner.config = _make_config(schedule={'error_log': str(tmp_path / 'test_error.log')})
+        runner._collect_commits = Mock(return_value=(True, [_commit()], None))
+        runner._analyze_and_save = Mock(side_effect=APIError("API error"))
         
-        # Mock configuration to fail
-        runner._load_configuration = Mock(return_value=False)
-        
-        # Run with retry
-        exit_code = runner.run_with_retry()
+        assert runner.run_with_retry(max_retries=max_retries) == 1
         
-        # Verify
-        assert exit_code == 1
+        assert len(sleeps) == max_retries - 1
+        assert all(delay <= automated_runner.MAX_BACKOFF_SECONDS for delay in sleeps)
+        assert sleeps[-1] >= min(2 ** (max_retries - 2), automated_runner.MAX_BACKOFF_SECONDS)
@@ -0,0 +1,229 @@
+"""Tests for BatchProcessor."""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from talkbut.processors.batch_processor import BatchProcessor, ProcessResult
+
+
+def _commits_by_date(*days):
+    """One fake commit for each given day of January 2024."""
+    return {date(2024, 1, d): [MagicMock(date=datetime(2024, 1, d, 9, 0))] for d in days}
+
+
+def _result(process_date, success=True, skipped=False, error=None):
+    return ProcessResult(
+        date=process_date,
+        success=success,
+        skipped=skipped,
+        error=error,
+        commits_count=0
+    )
+
+
+class TestBatchProcessor:
+    """Tests for BatchProcessor.process_date_range."""
+
+    @pytest.fixture
+    def processor(self, tmp_path):
+        """Create a BatchProcessor with a mock config."""
+        config = MagicMock()
+        config.get.side_effect = lambda key, default=None: (
+            str(tmp_path) if key == "storage.log_dir" else default
+        )
+        return BatchProcessor(config)
+
+    def test_chunks_processed_concurrently(self, processor):
+        """Test that AI chunks overlap instead of running one after another."""
+        # Each chunk waits for a second one to be in flight at the same time;
+        # run one after another, the barrier would time out and break
+        barrier = threading.Barrier(2, timeout=5)
+
+        def overlapping_process(batch):
+            barrier.wait()
+            return [_result(d) for d, _ in batch]
+
+        with patch.object(processor, "_collect_range", return_value=_commits_by_date(1, 2, 3, 4)), \
+                patch.object(processor, "_process_dates_with_commits", side_effect=overlapping_process):
+            result = processor.process_date_range(
+                "2024-01-01", "2024-01-04", max_workers=4, days_per_request=1
+            )
+
+        assert len(result.processed) == 4
+        assert not barrier.broken
+
+    def test_pool_sized_by_ai_max_concurrency(self, processor):
+        """Test the AI request limit comes from ai.max_concurrency by default."""
+        processor.config.get.side_effect = lambda key, default=None: (
+            2 if key == "ai.max_concurrency" else default
+        )
+
+        with patch.object(processor, "_collect_range", return_value=_commits_by_date(1, 2, 3, 4)), \
+                patch.object(
+                    processor, "_process_dates_with_commits",
+                    side_effect=lambda batch: [_result(d) for d, _ in batch]
+                ), \
+                patch("talkbut.processors.batch_processor.ThreadPoolExecutor",
+                      wraps=ThreadPoolExecutor) as mock_pool:
+            processor.process_date_range("2024-01-01", "2024-01-04", days_per_request=1)
+
+        mock_pool.assert_called_once_with(max_workers=2)
+
+    def test_dates_grouped_into_ai_chunks(self, processor):
+        """Test dates with commits are grouped per request; empty dates skip the AI."""
+        with patch.object(processor, "_collect_range", return_value=_commits_by_date(1, 2, 4, 5, 6)), \
+                patch.object(
+                    processor, "_process_dates_with_commits",
+                    side_effect=lambda batch: [_result(d) for d, _ in batch]
+                ) as mock_process:
+            result = processor.process_date_range(
+                "2024-01-01", "2024-01-06", days_per_request=2
+            )
+
+        chunks = sorted([d.day for d, _ in c.args[0]] for c in mock_process.call_args_list)
+        assert chunks == [[1, 2], [4, 5], [6]]
+        assert len(result.processed) == 6
+
+    @patch("talkbut.processors.batch_processor.GitCollector")
+    def test_one_git_log_per_repo_for_whole_range(self, mock_collector_class, processor):
+        """Test the range is collected once per repo and bucketed by day."""
+        processor.config.git_repos = [
+            {"path": "/repo/a", "name": "A"},
+            {"path": "/repo/b", "name": "B"},
+        ]
+        day1 = MagicMock(date=datetime(2024, 1, 1, 10, 0))
+        day3 = MagicMock(date=datetime(2024, 1, 3, 18, 0))
+        mock_collector_class.return_value.collect_commits.return_value = [day1, day3]
+
+        with patch.object(
+            processor, "_process_dates_with_commits",
+            side_effect=lambda batch: [_result(d) for d, _ in batch]
+        ) as mock_process:
+            processor.process_date_range("2024-01-01", "2024-01-03")
+
+        collect = mock_collector_class.return_value.collect_commits
+        assert collect.call_count == 2
+        assert collect.call_args.kwargs["since"] == "2024-01-01"
+        assert collect.call_args.kwargs["until"] == "2024-01-04"
+        (batch,), _ = mock_process.call_args
+        assert [(d, len(commits)) for d, commits in batch] == [
+            (date(2024, 1, 1), 2), (date(2024, 1, 3), 2)
+        ]
+
+    def test_existing_logs_skipped_without_collecting(self, processor, tmp_path):
+        """Test dates with existing logs never reach git or the AI."""
+        for day in ("2024-01-01", "2024-01-02"):
+            (tmp_path / f"daily_log_{day}.json").write_text("{}")
+
+        with patch.object(processor, "_collect_range") as mock_collect:
+            result = processor.process_date_range("2024-01-01", "2024-01-02")
+
+        mock_collect.assert_not_called()
+        assert result.skipped == [date(2024, 1, 1), date(2024, 1, 2)]
+
+    def test_results_in_date_order_and_callback_per_date(self, processor):
+        """Test result lists stay in date order and progress reports every date."""
+        def process(batch):
+            process_date = batch[0][0]
+            # Later dates finish first
+            time.sleep(0.05 * (10 - process_date.day))
+            if process_date.day == 2:
+                return [_result(process_date, success=False, error="boom")]
+            if process_date.day == 3:
+                return [_result(process_date, success=False, skipped=True)]
+            return [_result(process_date)]
+
+        callback = MagicMock()
+        with patch.object(processor, "_collect_range", return_value=_commits_by_date(1, 2, 3, 4, 5)), \
+                patch.object(processor, "_process_dates_with_commits", side_effect=process):
+            result = processor.process_date_range(
+                "2024-01-01", "2024-01-05", progress_callback=callback,
+                max_workers=5, days_per_request=1
+            )
+
+        assert result.processed == [date(2024, 1, 1), date(2024, 1, 4), date(2024, 1, 5)]
+        assert result.skipped == [date(2024, 1, 3)]
+        assert result.failed == [(date(2024, 1, 2), "boom")]
+        assert [c.args[1] for c in callback.call_args_list] == [1, 2, 3, 4, 5]
+        assert {c.args[0] for c in callback.call_args_list} == {
+            date(2024, 1, d) for d in range(1, 6)
+        }
+        assert all(c.args[2] == 5 for c in callback.call_args_list)
+
+    @patch("talkbut.processors.batch_processor.GitCollector")
+    def test_collectors_cached_per_repo(self, mock_collector_class, processor):
+        """Test one GitCollector is built per repo path and then reused."""
+        first = processor._get_collector("/repo/a")
+        again = processor._get_collector("/repo/a")
+        other = processor._get_collector("/repo/b")
+
+        assert first is again
+        assert mock_collector_class.call_count == 2
+        assert other is mock_collector_class.return_value
+
+    @patch("talkbut.processors.batch_processor.GitCollector")
+    def test_invalid_repo_not_cached(self, mock_collector_class, processor):
+        """Test a repo that fails to open is retried on the next call."""
+        mock_collector_class.side_effect = [ValueError("Invalid git repository"), MagicMock()]
+
+        with pytest.raises(ValueError):
+            processor._get_collector("/repo/a")
+        processor._get_collector("/repo/a")
+
+        assert mock_collector_class.call_count == 2
+
+    @patch("talkbut.processors.batch_processor.AIAnalyzer")
+    def test_analyzer_shared_across_dates(self, mock_analyzer_class, processor):
+        """Test one AIAnalyzer is created lazily and reused for every date."""
+        report = MagicMock(
+            ai_summary="ok", total_commits=1, files_changed=1,
+            insertions=1, deletions=0, categories={}, tasks=[]
+        )
+        analyzer = mock_analyzer_class.return_value
+        analyzer.analyze_commits_batch.side_effect = lambda batch: [report] * len(batch)
+
+        with patch.object(processor, "_collect_range", return_value=_commits_by_date(1, 2, 3)), \
+                patch.object(processor._parser, "enrich_commits"):
+            result = processor.process_date_range(
+                "2024-01-01", "2024-01-03", days_per_request=1
+            )
+
+        assert len(result.processed) == 3
+        mock_analyzer_class.assert_called_once()
+        assert analyzer.analyze_commits_batch.call_count == 3
+
+    @patch("talkbut.processors.batch_processor.AIAnalyzer")
+    def test_chunk_writes_one_log_per_date(self, mock_analyzer_class, processor, tmp_path):
+        """Test a multi-day AI answer is split into one log file per date."""
+        def make_report(summary):
+            return MagicMock(
+                ai_summary=summary, total_commits=1, files_changed=1,
+                insertions=1, deletions=0, categories={}, tasks=[]
+            )
+
+        mock_analyzer_class.return_value.analyze_commits_batch.return_value = [
+            make_report("day one"), make_report("day two")
+        ]
+
+        with patch.object(processor, "_collect_range", return_value=_commits_by_date(1, 2)), \
+                patch.object(processor._parser, "enrich_commits"):
+            result = processor.process_date_range("2024-01-01", "2024-01-02")
+
+        assert result.processed == [date(2024, 1, 1), date(2024, 1, 2)]
+        mock_analyzer_class.return_value.analyze_commits_batch.assert_called_once()
+        assert '"day two"' in (tmp_path / "daily_log_2024-01-02.json").read_text(encoding="utf-8")
+
+    @patch("talkbut.processors.batch_processor.AIAnalyzer")
+    def test_failed_ai_chunk_fails_its_dates(self, mock_analyzer_class, processor):
+        """Test an AI error marks every date of the chunk as failed."""
+        mock_analyzer_class.return_value.analyze_commits_batch.side_effect = RuntimeError("quota")
+
+        with patch.object(processor, "_collect_range", return_value=_commits_by_date(1, 2)), \
+                patch.object(processor._parser, "enrich_commits"):
+            result = processor.process_date_range("2024-01-01", "2024-01-02")
+
+        assert result.failed == [(date(2024, 1, 1), "quota"), (date(2024, 1, 2), "quota")]
@@ -1,7 +1,8 @@
 """Tests for ConfigManager."""
 import pytest
 import os
-from talkbut.core.config import ConfigManager
+from unittest.mock import patch
+from talkbut.core.config import ConfigManager, get_config
 
 
 @pytest.fixture(autouse=True)
@@ -81,9 +82,84 @@ class TestConfigManager:
         config2 = ConfigManager()
         assert config1 is config2
 
+    def test_get_config_returns_shared_instance(self, monkeypatch):
+        """Test get_config returns the singleton and reloads after a reset."""
+        monkeypatch.setenv("TALKBUT_CONFIG_PATH", "nonexistent.yaml")
+        
+        config = get_config()
+        assert config is ConfigManager()
+        assert get_config() is config
+        
+        ConfigManager._instance = None
+        assert get_config() is not config
+
     def test_git_repos_property(self, monkeypatch):
         """Test git_repos property."""
         monkeypatch.setenv("TALKBUT_CONFIG_PATH", "nonexistent.yaml")
         config = ConfigManager()
         
         assert config.git_repos == []
+
+    def test_config_get_section_and_update(self, monkeypatch):
+        """Test getting a whole section and seeing schedule updates via get."""
+        monkeypatch.setenv("TALKBUT_CONFIG_PATH", "nonexistent.yaml")
+        config = ConfigManager()
+        
+        assert isinstance(config.get("schedule"), dict)
+        assert config.get("schedule")["time"] == "18:00"
+        
+        config.set_schedule_config(time="09:30")
+        assert config.get("schedule.time") == "09:30"
+        assert config.get("schedule")["time"] == "09:30"
+
+    def test_config_loads_env_file(self, monkeypatch, tmp_path):
+        """Test .env parsing: comments, quotes and existing variables."""
+        monkeypatch.setenv("TALKBUT_CONFIG_PATH", "nonexistent.yaml")
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".env").write_text(
+            "# comment\n"
+            "\n"
+            "TALKBUT_TEST_PLAIN = plain value\n"
+            "TALKBUT_TEST_DOUBLE=\"double quoted\"\n"
+            "TALKBUT_TEST_SINGLE='single quoted'\n"
+            "TALKBUT_TEST_EXISTING=from_file\n",
+            encoding="utf-8",
+        )
+        for key in ("TALKBUT_TEST_PLAIN", "TALKBUT_TEST_DOUBLE", "TALKBUT_TEST_SINGLE"):
+            monkeypatch.delenv(key, raising=False)
+        monkeypatch.setenv("TALKBUT_TEST_EXISTING", "from_env")
+        
+        ConfigManager()
+        
+        assert os.environ["TALKBUT_TEST_PLAIN"] == "plain value"
+        assert os.environ["TALKBUT_TEST_DOUBLE"] == "double quoted"
+        assert os.environ["TALKBUT_TEST_SINGLE"] == "single quoted"
+        assert os.environ["TALKBUT_TEST_EXISTING"] == "from_env"
+
+    def test_config_updates_do_not_leak_into_defaults(self, monkeypatch):
+        """Test that changing a loaded config leaves DEFAULT_CONFIG untouched."""
+        from talkbut.core.config_defaults import DEFAULT_CONFIG
+        monkeypatch.setenv("TALKBUT_CONFIG_PATH", "nonexistent.yaml")
+        config = ConfigManager()
+        
+        config.set_schedule_config(time="07:15")
+        
+        assert DEFAULT_CONFIG["schedule"]["time"] == "18:00"
+
+    def test_git_repos_cached_until_config_changes(self, monkeypatch, tmp_path):
+        """Test that scanned repos are cached and recomputed after the config changes."""
+        monkeypatch.setenv("TALKBUT_CONFIG_PATH", "nonexistent.yaml")
+        config = ConfigManager()
+        config._config["git"]["scan_paths"] = [str(tmp_path)]
+        
+        with patch(
+            "talkbut.collectors.repo_scanner.RepoScanner.scan_multiple",
+            return_value=[{"path": str(tmp_path / "repo"), "name": "repo"}],
+        ) as mock_scan:
+            assert config.git_repos[0]["name"] == "repo"
+            assert config.git_repos[0]["name"] == "repo"
+            assert mock_scan.call_count == 1
+            
+            config._discard_cached()
+            config.git_repos
+            assert mock_scan.call_count == 2
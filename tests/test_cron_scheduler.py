@@ -0,0 +1,206 @@
+"""Tests for CronScheduler."""
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from talkbut.scheduling.cron_scheduler import CronScheduler
+
+MARKER = CronScheduler.TALKBUT_MARKER
+CRONTAB = f"0 1 * * * backup\n30 18 * * * talkbut log {MARKER}\n".encode()
+
+
+def _completed(stdout=b"", returncode=0):
+    """Fake subprocess.run result."""
+    return MagicMock(stdout=stdout, returncode=returncode)
+
+
+class TestCronSchedulerCache:
+    """Tests for reusing `crontab -l` output across operations."""
+
+    @pytest.fixture
+    def scheduler(self):
+        """Create a CronScheduler instance."""
+        return CronScheduler()
+
+    @patch("talkbut.scheduling.cron_scheduler.subprocess.run")
+    def test_status_queries_share_one_read(self, mock_run, scheduler):
+        """Test job_exists and get_next_run run `crontab -l` only once."""
+        mock_run.return_value = _completed(CRONTAB)
+
+        assert scheduler.job_exists()
+        next_run = scheduler.get_next_run()
+
+        assert (next_run.hour, next_run.minute) == (18, 30)
+        mock_run.assert_called_once()
+
+    @patch("talkbut.scheduling.cron_scheduler.monotonic")
+    @patch("talkbut.scheduling.cron_scheduler.subprocess.run")
+    def test_cache_expires(self, mock_run, mock_monotonic, scheduler):
+        """Test the crontab is read again once the TTL has passed."""
+        mock_run.return_value = _completed(CRONTAB)
+        mock_monotonic.side_effect = [100.0, 100.0 + CronScheduler.CACHE_TTL]
+
+        scheduler.job_exists()
+        scheduler.job_exists()
+
+        assert mock_run.call_count == 2
+
+    @patch("talkbut.scheduling.cron_scheduler.subprocess.run")
+    def test_create_job_refreshes_cache(self, mock_run, scheduler):
+        """Test a written crontab is served from the cache afterwards."""
+        mock_run.side_effect = [
+            _completed(b"0 1 * * * backup\n"), _completed(b"0 1 * * * backup\n"), _completed()
+        ]
+
+        assert not scheduler.job_exists()
+        assert scheduler.create_job("07:15", "talkbut log")
+        next_run = scheduler.get_next_run()
+
+        assert (next_run.hour, next_run.minute) == (7, 15)
+        # job_exists, the fresh read under the lock, and the write
+        assert mock_run.call_count == 3
+        write = mock_run.call_args
+        assert write.args[0] == ["crontab", "-"]
+        assert write.kwargs["input"].endswith(f"15 7 * * * talkbut log {MARKER}\n".encode())
+
+    @patch("talkbut.scheduling.cron_scheduler.subprocess.run")
+    def test_failed_write_drops_cache(self, mock_run, scheduler):
+        """Test the crontab is re-read after a write that failed."""
+        mock_run.side_effect = [
+            _completed(CRONTAB), _completed(returncode=1), _completed(CRONTAB)
+        ]
+
+        assert not scheduler.remove_job()
+        assert scheduler.job_exists()
+
+        assert mock_run.call_count == 3
+
+
+class TestCronSchedulerEdits:
+    """Tests for rewriting the crontab."""
+
+    def test_without_talkbut_job_keeps_other_lines(self):
+        """Test only the TalkBut line and surrounding blank lines are dropped."""
+        data = f"\n# backups\n0 1 * * * backup\n\n30 18 * * * talkbut log {MARKER}\n\n".encode()
+
+        assert CronScheduler()._without_talkbut_job(data) == b"# backups\n0 1 * * * backup\n"
+
+    def test_without_talkbut_job_only_job(self):
+        """Test a crontab holding only the TalkBut job becomes empty."""
+        data = f"30 18 * * * talkbut log {MARKER}\n".encode()
+
+        assert CronScheduler()._without_talkbut_job(data) == b""
+
+    @patch("talkbut.scheduling.cron_scheduler.subprocess.run")
+    def test_create_job_replaces_existing_job(self, mock_run):
+        """Test enabling again swaps the TalkBut line and keeps user jobs."""
+        mock_run.return_value = _completed(CRONTAB)
+
+        assert CronScheduler().create_job("07:15", "talkbut log")
+
+        assert mock_run.call_args.kwargs["input"] == (
+            f"0 1 * * * backup\n15 7 * * * talkbut log {MARKER}\n".encode()
+        )
+
+
+class TestCronSchedulerLock:
+    """Tests for serializing crontab updates."""
+
+    @patch("talkbut.scheduling.cron_scheduler.subprocess.run")
+    def test_update_rereads_crontab_under_lock(self, mock_run, tmp_path):
+        """Test an update ignores the cache, since another process may have written."""
+        mock_run.return_value = _completed(CRONTAB)
+        scheduler = CronScheduler(lock_path=tmp_path / "locks" / "cron.lock")
+
+        scheduler.job_exists()
+        scheduler.create_job("07:15", "talkbut log")
+
+        reads = [c for c in mock_run.call_args_list if c.args[0] == ["crontab", "-l"]]
+        assert len(reads) == 2
+        assert (tmp_path / "locks" / "cron.lock").exists()
+
+    @patch("talkbut.scheduling.cron_scheduler.fcntl")
+    @patch("talkbut.scheduling.cron_scheduler.subprocess.run")
+    def test_lock_held_during_write(self, mock_run, mock_fcntl, tmp_path):
+        """Test the crontab is read and written while the lock is held."""
+        held = []
+        mock_fcntl.flock.side_effect = lambda fd, op: held.append(op)
+        mock_run.side_effect = lambda *a, **kw: held.append("run") or _completed(CRONTAB)
+
+        CronScheduler(lock_path=tmp_path / "cron.lock").remove_job()
+
+        assert held == [mock_fcntl.LOCK_EX, "run", "run", mock_fcntl.LOCK_UN]
+
+
+class TestCronSchedulerNextRun:
+    """Tests for next-run calculation."""
+
+    def test_compute_next_later_today(self):
+        """Test a time still ahead today is scheduled today."""
+        now = datetime(2024, 1, 15, 9, 0)
+
+        assert CronScheduler._compute_next(18, 30, now) == datetime(2024, 1, 15, 18, 30)
+
+    def test_compute_next_rolls_over_to_tomorrow(self):
+        """Test a time already passed (or exactly now) is scheduled tomorrow."""
+        now = datetime(2024, 1, 31, 18, 30)
+
+        assert CronScheduler._compute_next(18, 30, now) == datetime(2024, 2, 1, 18, 30)
+
+    def test_parse_schedule(self):
+        """Test hour and minute are read from the marker line only."""
+        data = f"15 3 * * * other\n  5 7 * * * talkbut log {MARKER}\n".encode()
+
+        assert CronScheduler()._parse_schedule(data) == (7, 5)
+
+    def test_parse_schedule_rejects_non_numeric_fields(self):
+        """Test step and wildcard expressions are not mistaken for a time."""
+        data = f"*/5 * * * * talkbut log {MARKER}\n".encode()
+
+        assert CronScheduler()._parse_schedule(data) is None
+
+    @patch("talkbut.scheduling.cron_scheduler.subprocess.run")
+    def test_unparseable_job_line(self, mock_run):
+        """Test a hand-edited TalkBut line without numeric fields has no next run."""
+        mock_run.return_value = _completed(f"@daily talkbut log {MARKER}\n".encode())
+        scheduler = CronScheduler()
+
+        assert scheduler.job_exists()
+        assert scheduler.get_next_run() is None
+
+    @patch("talkbut.scheduling.cron_scheduler.subprocess.run")
+    def test_describe_reads_crontab_once(self, mock_run):
+        """Test describe reports existence, next run and time from one read."""
+        mock_run.return_value = _completed(CRONTAB)
+
+        exists, next_run, schedule_time = CronScheduler().describe()
+
+        assert exists
+        assert (next_run.hour, next_run.minute) == (18, 30)
+        assert schedule_time == "18:30"
+        mock_run.assert_called_once()
+
+    @patch("talkbut.scheduling.cron_scheduler.subprocess.run")
+    def test_describe_without_crontab(self, mock_run):
+        """Test describe when the user has no crontab."""
+        mock_run.return_value = _completed(returncode=1)
+
+        assert CronScheduler().describe() == (False, None, None)
+
+
+class TestCronSchedulerWithoutCron:
+    """Tests for machines without the crontab binary."""
+
+    @patch("talkbut.scheduling.cron_scheduler.subprocess.run")
+    @patch("talkbut.scheduling.cron_scheduler._find_crontab", return_value=None)
+    def test_operations_fail_without_subprocess(self, mock_find, mock_run):
+        """Test every operation fails fast instead of trying to run crontab."""
+        scheduler = CronScheduler()
+
+        assert not scheduler.create_job("07:15", "talkbut log")
+        assert not scheduler.remove_job()
+        assert not scheduler.job_exists()
+        assert scheduler.get_next_run() is None
+        assert scheduler.describe() == (False, None, None)
+        mock_run.assert_not_called()
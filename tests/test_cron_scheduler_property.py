@@ -135,33 +135,21 @@ class TestCronSchedulerProperties:
         # Mock subprocess to capture the cron line without actually modifying crontab
         captured_cron_line = None
         
-        def mock_popen(*args, **kwargs):
-            """Mock Popen to capture the cron line."""
-            nonlocal captured_cron_line
-            mock_process = MagicMock()
-            mock_process.returncode = 0
-            
-            def mock_communicate(input=None):
-                nonlocal captured_cron_line
-                if input:
-                    # Extract the new cron line (last non-empty line)
-                    lines = [line for line in input.split('\n') if line.strip()]
-                    if lines:
-                        captured_cron_line = lines[-1]
-                return ("", "")
-            
-            mock_process.communicate = mock_communicate
-            return mock_process
-        
         def mock_run(*args, **kwargs):
-            """Mock run to return empty crontab."""
+            """Mock run to return empty crontab and capture the cron line."""
+            nonlocal captured_cron_line
+            input = kwargs.get("input")
+            if input:
+                # Extract the new cron line (last non-empty line)
+                lines = [line for line in input.decode().split('\n') if line.strip()]
+                if lines:
+                    captured_cron_line = lines[-1]
             mock_result = MagicMock()
             mock_result.returncode = 0
-            mock_result.stdout = ""
+            mock_result.stdout = b""
             return mock_result
         
-        with patch('subprocess.Popen', side_effect=mock_popen), \
-             patch('subprocess.run', side_effect=mock_run):
+        with patch('subprocess.run', side_effect=mock_run):
             
             # Create the job
             result = scheduler.create_job(time, command)
@@ -196,32 +184,21 @@ class TestCronSchedulerProperties:
         # Mock subprocess to capture the cron line
         captured_cron_line = None
         
-        def mock_popen(*args, **kwargs):
-            """Mock Popen to capture the cron line."""
-            nonlocal captured_cron_line
-            mock_process = MagicMock()
-            mock_process.returncode = 0
-            
-            def mock_communicate(input=None):
-                nonlocal captured_cron_line
-                if input:
-                    lines = [line for line in input.split('\n') if line.strip()]
-                    if lines:
-                        captured_cron_line = lines[-1]
-                return ("", "")
-            
-            mock_process.communicate = mock_communicate
-            return mock_process
-        
         def mock_run(*args, **kwargs):
-            """Mock run to return empty crontab."""
+            """Mock run to return empty crontab and capture the cron line."""
+            nonlocal captured_cron_line
+            input = kwargs.get("input")
+            if input:
+                # Extract the new cron line (last non-empty line)
+                lines = [line for line in input.decode().split('\n') if line.strip()]
+                if lines:
+                    captured_cron_line = lines[-1]
             mock_result = MagicMock()
             mock_result.returncode = 0
-            mock_result.stdout = ""
+            mock_result.stdout = b""
             return mock_result
         
-        with patch('subprocess.Popen', side_effect=mock_popen), \
-             patch('subprocess.run', side_effect=mock_run):
+        with patch('subprocess.run', side_effect=mock_run):
             
             # Create the job
             result = scheduler.create_job(time, command)
@@ -261,32 +238,21 @@ class TestCronSchedulerProperties:
         # Mock subprocess to capture the cron line
         captured_cron_line = None
         
-        def mock_popen(*args, **kwargs):
-            """Mock Popen to capture the cron line."""
-            nonlocal captured_cron_line
-            mock_process = MagicMock()
-            mock_process.returncode = 0
-            
-            def mock_communicate(input=None):
-                nonlocal captured_cron_line
-                if input:
-                    lines = [line for line in input.split('\n') if line.strip()]
-                    if lines:
-                        captured_cron_line = lines[-1]
-                return ("", "")
-            
-            mock_process.communicate = mock_communicate
-            return mock_process
-        
         def mock_run(*args, **kwargs):
-            """Mock run to return empty crontab."""
+            """Mock run to return empty crontab and capture the cron line."""
+            nonlocal captured_cron_line
+            input = kwargs.get("input")
+            if input:
+                # Extract the new cron line (last non-empty line)
+                lines = [line for line in input.decode().split('\n') if line.strip()]
+                if lines:
+                    captured_cron_line = lines[-1]
             mock_result = MagicMock()
             mock_result.returncode = 0
-            mock_result.stdout = ""
+            mock_result.stdout = b""
             return mock_result
         
-        with patch('subprocess.Popen', side_effect=mock_popen), \
-             patch('subprocess.run', side_effect=mock_run):
+        with patch('subprocess.run', side_effect=mock_run):
             
             # Create the job
             result = scheduler.create_job(time, command)
@@ -329,32 +295,21 @@ class TestCronSchedulerProperties:
         # Mock subprocess to capture the cron line
         captured_cron_line = None
         
-        def mock_popen(*args, **kwargs):
-            """Mock Popen to capture the cron line."""
-            nonlocal captured_cron_line
-            mock_process = MagicMock()
-            mock_process.returncode = 0
-            
-            def mock_communicate(input=None):
-                nonlocal captured_cron_line
-                if input:
-                    lines = [line for line in input.split('\n') if line.strip()]
-                    if lines:
-                        captured_cron_line = lines[-1]
-                return ("", "")
-            
-            mock_process.communicate = mock_communicate
-            return mock_process
-        
         def mock_run(*args, **kwargs):
-            """Mock run to return empty crontab."""
+            """Mock run to return empty crontab and capture the cron line."""
+            nonlocal captured_cron_line
+            input = kwargs.get("input")
+            if input:
+                # Extract the new cron line (last non-empty line)
+                lines = [line for line in input.decode().split('\n') if line.strip()]
+                if lines:
+                    captured_cron_line = lines[-1]
             mock_result = MagicMock()
             mock_result.returncode = 0
-            mock_result.stdout = ""
+            mock_result.stdout = b""
             return mock_result
         
-        with patch('subprocess.Popen', side_effect=mock_popen), \
-             patch('subprocess.run', side_effect=mock_run):
+        with patch('subprocess.run', side_effect=mock_run):
             
             # Create the job
             result = scheduler.create_job(time, command)
@@ -387,32 +342,21 @@ class TestCronSchedulerProperties:
         # Mock subprocess to capture the cron line
         captured_cron_line = None
         
-        def mock_popen(*args, **kwargs):
-            """Mock Popen to capture the cron line."""
-            nonlocal captured_cron_line
-            mock_process = MagicMock()
-            mock_process.returncode = 0
-            
-            def mock_communicate(input=None):
-                nonlocal captured_cron_line
-                if input:
-                    lines = [line for line in input.split('\n') if line.strip()]
-                    if lines:
-                        captured_cron_line = lines[-1]
-                return ("", "")
-            
-            mock_process.communicate = mock_communicate
-            return mock_process
-        
         def mock_run(*args, **kwargs):
-            """Mock run to return empty crontab."""
+            """Mock run to return empty crontab and capture the cron line."""
+            nonlocal captured_cron_line
+            input = kwargs.get("input")
+            if input:
+                # Extract the new cron line (last non-empty line)
+                lines = [line for line in input.decode().split('\n') if line.strip()]
+                if lines:
+                    captured_cron_line = lines[-1]
             mock_result = MagicMock()
             mock_result.returncode = 0
-            mock_result.stdout = ""
+            mock_result.stdout = b""
             return mock_result
         
-        with patch('subprocess.Popen', side_effect=mock_popen), \
-             patch('subprocess.run', side_effect=mock_run):
+        with patch('subprocess.run', side_effect=mock_run):
             
             # Create the job
             result = scheduler.create_job(time, command)
@@ -0,0 +1,89 @@
+"""Tests for daily log storage."""
+from datetime import date
+
+import pytest
+
+from talkbut.processors.batch_utils import existing_log_dates, log_exists
+from talkbut.storage import daily_logs
+from talkbut.storage.daily_logs import (
+    find_daily_log,
+    list_daily_logs,
+    read_daily_log,
+    resolve_format,
+    write_daily_log,
+)
+
+LOG_DATE = date(2024, 1, 15)
+SAMPLE = {"date": "2024-01-15", "summary": "งานวันนี้", "stats": {"commits": 2}, "tasks": []}
+
+
+class TestDailyLogs:
+    """Tests for reading and writing daily logs."""
+
+    def test_json_round_trip(self, tmp_path):
+        """Test the default format writes daily_log_<date>.json."""
+        path = write_daily_log(tmp_path, LOG_DATE, SAMPLE)
+
+        assert path.name == "daily_log_2024-01-15.json"
+        assert find_daily_log(tmp_path, LOG_DATE) == path
+        assert read_daily_log(path) == SAMPLE
+
+    def test_msgpack_round_trip(self, tmp_path):
+        """Test msgpack logs are found and read back."""
+        pytest.importorskip("msgpack")
+
+        path = write_daily_log(tmp_path, LOG_DATE, SAMPLE, "msgpack")
+
+        assert path.name == "daily_log_2024-01-15.msgpack"
+        assert find_daily_log(tmp_path, LOG_DATE) == path
+        assert read_daily_log(path) == SAMPLE
+
+    def test_write_replaces_other_format(self, tmp_path):
+        """Test a rewrite removes a stale copy stored in the other format."""
+        stale = tmp_path / "daily_log_2024-01-15.msgpack"
+        stale.write_bytes(b"\x80")
+
+        write_daily_log(tmp_path, LOG_DATE, SAMPLE)
+
+        assert not stale.exists()
+        assert [p.name for p in tmp_path.iterdir()] == ["daily_log_2024-01-15.json"]
+
+    def test_find_missing_log(self, tmp_path):
+        """Test looking up a date without a log."""
+        assert find_daily_log(tmp_path, LOG_DATE) is None
+
+    def test_resolve_format_falls_back_to_json(self, monkeypatch):
+        """Test unknown formats and msgpack without the package use JSON."""
+        monkeypatch.setattr(daily_logs, "msgpack", None)
+
+        assert resolve_format(None) == "json"
+        assert resolve_format("yaml") == "json"
+        assert resolve_format("msgpack") == "json"
+
+    def test_existing_log_dates_sees_both_formats(self, tmp_path):
+        """Test batch log detection recognises .json and .msgpack logs."""
+        (tmp_path / "daily_log_2024-01-14.json").write_text("{}")
+        (tmp_path / "daily_log_2024-01-15.msgpack").write_bytes(b"\x80")
+        (tmp_path / "daily_log_2024-01-16.json.123.tmp").write_text("")
+        (tmp_path / "notes.txt").write_text("")
+
+        assert existing_log_dates(tmp_path) == {"2024-01-14", "2024-01-15"}
+        assert log_exists(LOG_DATE, tmp_path)
+        assert not log_exists(date(2024, 1, 16), tmp_path)
+
+    def test_list_daily_logs_matches_find(self, tmp_path):
+        """Test the listing agrees with find_daily_log, preferring JSON."""
+        (tmp_path / "daily_log_2024-01-14.json").write_text("{}")
+        (tmp_path / "daily_log_2024-01-15.msgpack").write_bytes(b"\x80")
+        (tmp_path / "daily_log_2024-01-15.json").write_text("{}")
+        (tmp_path / "daily_log_2024-01-16.json.123.tmp").write_text("")
+        (tmp_path / "notes.json").write_text("{}")
+
+        logs = list_daily_logs(tmp_path)
+
+        assert logs == {
+            "2024-01-14": tmp_path / "daily_log_2024-01-14.json",
+            "2024-01-15": tmp_path / "daily_log_2024-01-15.json",
+        }
+        assert logs["2024-01-15"] == find_daily_log(tmp_path, LOG_DATE)
+        assert list_daily_logs(tmp_path / "missing") == {}
@@ -0,0 +1,49 @@
+"""Tests for error_logger."""
+import shutil
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+from talkbut.scheduling.error_logger import _timestamp, log_error
+
+
+class TestLogError:
+    """Tests for log_error."""
+
+    def test_parent_created_once(self, tmp_path):
+        """Test the log directory is only created on the first error."""
+        log_path = tmp_path / "errors.log"
+
+        with patch("pathlib.Path.mkdir") as mock_mkdir:
+            log_error(log_path, "first")
+            log_error(log_path, "second")
+
+        assert mock_mkdir.call_count == 1
+        assert len(log_path.read_text(encoding="utf-8").splitlines()) == 2
+
+    def test_directory_removed_after_first_error(self, tmp_path):
+        """Test the directory is recreated if it disappears between errors."""
+        log_path = tmp_path / "gone" / "errors.log"
+        log_error(log_path, "first")
+        shutil.rmtree(tmp_path / "gone")
+
+        log_error(log_path, "second", date_attempted="2024-01-15")
+
+        assert log_path.read_text(encoding="utf-8").endswith("second (date: 2024-01-15)\n")
+
+    def test_timestamp_matches_isoformat(self):
+        """Test the timestamp reads like datetime.isoformat with microseconds."""
+        ns = time.time_ns()
+
+        with patch("talkbut.scheduling.error_logger.time.time_ns", return_value=ns):
+            stamp = _timestamp()
+
+        expected = datetime.fromtimestamp(ns // 1_000_000_000).replace(
+            microsecond=ns // 1000 % 1_000_000
+        )
+        assert stamp == expected.isoformat(timespec="microseconds")
+
+    def test_timestamp_keeps_zero_microseconds(self):
+        """Test a whole second still gets a fractional part."""
+        with patch("talkbut.scheduling.error_logger.time.time_ns", return_value=1_700_000_000 * 10**9):
+            assert _timestamp().endswith(".000000")
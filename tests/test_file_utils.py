@@ -0,0 +1,45 @@
+"""Tests for file helpers."""
+from unittest.mock import patch
+
+import pytest
+
+from talkbut.utils.file_utils import atomic_open, atomic_write_bytes
+
+
+class TestAtomicWriteBytes:
+    """Tests for atomic_write_bytes."""
+
+    def test_creates_and_replaces_file(self, tmp_path):
+        """Test writing a new file and overwriting it."""
+        target = tmp_path / "daily_log_2024-01-01.json"
+
+        atomic_write_bytes(target, b'{"a":1}')
+        atomic_write_bytes(target, b'{"b":2}')
+
+        assert target.read_bytes() == b'{"b":2}'
+        assert [p.name for p in tmp_path.iterdir()] == [target.name]
+
+    def test_failed_write_keeps_old_file(self, tmp_path):
+        """Test that a failed rename leaves the old content and no temp file."""
+        target = tmp_path / "log.json"
+        target.write_bytes(b"old")
+
+        with patch("talkbut.utils.file_utils.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                atomic_write_bytes(target, b"new")
+
+        assert target.read_bytes() == b"old"
+        assert [p.name for p in tmp_path.iterdir()] == ["log.json"]
+
+    def test_error_inside_atomic_open_keeps_old_file(self, tmp_path):
+        """Test that an exception while streaming leaves the target untouched."""
+        target = tmp_path / "log.json"
+        target.write_bytes(b"old")
+
+        with pytest.raises(RuntimeError):
+            with atomic_open(target) as f:
+                f.write(b"partial")
+                raise RuntimeError("encoder failed")
+
+        assert target.read_bytes() == b"old"
+        assert [p.name for p in tmp_path.iterdir()] == ["log.json"]
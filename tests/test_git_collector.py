@@ -4,7 +4,7 @@ from unittest.mock import MagicMock, patch, PropertyMock
 from datetime import datetime
 import git
 
-from talkbut.collectors.git_collector import GitCollector
+from talkbut.collectors.git_collector import GitCollector, collect_from_repos, merged_commits
 from talkbut.models.commit import Commit
 
 
@@ -76,6 +76,34 @@ class TestGitCollector:
         assert commits[0].deletions == 2
         assert set(commits[0].files_changed) == {"file1.py", "file2.py"}
 
+    @patch('git.Repo')
+    def test_collect_commits_shares_repeated_strings(self, mock_repo_cls):
+        """Test author/email strings are shared and HEAD is read once."""
+        mock_repo = MagicMock()
+        mock_repo_cls.return_value = mock_repo
+        mock_repo.iter_commits.return_value = [
+            MockGitCommit(
+                hexsha=f"{i}" * 40,
+                author_name="".join(["Test ", "User"]),
+                author_email="".join(["test@", "example.com"]),
+                date=datetime(2023, 1, 1, 12, i, 0),
+                message="chore: tick",
+                stats_dict={"insertions": 1, "deletions": 0, "files": 1},
+                files=["file1.py"]
+            )
+            for i in range(3)
+        ]
+        active_branch = PropertyMock(return_value=MagicMock())
+        active_branch.return_value.name = "main"
+        type(mock_repo).active_branch = active_branch
+
+        commits = GitCollector("/path/to/repo").collect_commits(since="1 day ago")
+
+        assert commits[0].author is commits[2].author
+        assert commits[0].email is commits[1].email
+        assert [c.branch for c in commits] == ["main"] * 3
+        assert active_branch.call_count == 1
+
     @patch('git.Repo')
     def test_collect_commits_empty(self, mock_repo_cls):
         """Test collecting commits when none exist."""
@@ -164,3 +192,79 @@ class TestGitCollector:
         assert len(commits) == 2
         assert commits[0].hash == "commit1"
         assert commits[1].hash == "commit2"
+
+
+class TestCollectFromRepos:
+    """Tests for collect_from_repos."""
+
+    def test_collects_all_repos_in_order(self):
+        """Test commits are tagged with repo names and kept in repo order."""
+        def factory(path):
+            collector = MagicMock()
+            collector.collect_commits.return_value = [MagicMock(hash=f"{path}-1")]
+            return collector
+
+        repos = [{"path": "/a", "name": "A"}, {"path": "/b", "name": "B"}]
+        results = collect_from_repos(
+            repos, since="2024-01-01", until="2024-01-02", collector_factory=factory
+        )
+        commits = merged_commits(results)
+
+        assert list(results) == ["/a", "/b"]
+        assert [c.hash for c in commits] == ["/a-1", "/b-1"]
+        assert [c.repo_name for c in commits] == ["A", "B"]
+        assert all(r.error is None for r in results.values())
+
+    def test_failing_repo_reported_not_raised(self):
+        """Test a failing repo is returned as a failure while others succeed."""
+        def factory(path):
+            if path == "/bad":
+                raise ValueError("Invalid git repository: /bad")
+            collector = MagicMock()
+            collector.collect_commits.return_value = [MagicMock()]
+            return collector
+
+        repos = [{"path": "/bad", "name": "Bad"}, {"path": "/good", "name": "Good"}]
+        results = collect_from_repos(
+            repos, since="2024-01-01", collector_factory=factory
+        )
+
+        assert len(merged_commits(results)) == 1
+        assert results["/bad"].name == "Bad"
+        assert isinstance(results["/bad"].error, ValueError)
+        assert results["/good"].error is None
+
+    def test_repos_with_same_name_kept_apart(self):
+        """Test scanned repos sharing a basename get their own results."""
+        def factory(path):
+            if path == "/personal/api":
+                raise ValueError("Invalid git repository: /personal/api")
+            collector = MagicMock()
+            collector.collect_commits.return_value = [MagicMock(), MagicMock()]
+            return collector
+
+        repos = [{"path": "/work/api", "name": "api"}, {"path": "/personal/api", "name": "api"}]
+        results = collect_from_repos(repos, since="2024-01-01", collector_factory=factory)
+
+        assert len(results["/work/api"].commits) == 2
+        assert results["/work/api"].error is None
+        assert results["/personal/api"].commits == []
+        assert isinstance(results["/personal/api"].error, ValueError)
+
+    def test_no_repos(self):
+        """Test an empty repo list."""
+        assert collect_from_repos([], since="2024-01-01") == {}
+
+    def test_branch_and_diffs_forwarded(self):
+        """Test the log command's branch and diff options reach every collector."""
+        collector = MagicMock()
+        collector.collect_commits.return_value = []
+
+        collect_from_repos(
+            [{"path": "/a"}], since="2024-01-01", collector_factory=lambda path: collector,
+            branch="main", include_diffs=True
+        )
+
+        kwargs = collector.collect_commits.call_args.kwargs
+        assert kwargs["branch"] == "main"
+        assert kwargs["include_diffs"] is True
@@ -0,0 +1,53 @@
+"""Tests for JSON helpers."""
+import io
+import json
+import pytest
+from talkbut.utils import json_utils
+
+
+@pytest.fixture(params=["default", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test with the installed backend and with the stdlib fallback."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(json_utils, "orjson", None)
+    return request.param
+
+
+class TestJsonUtils:
+    """Tests for json_utils."""
+
+    SAMPLE = {"summary": "งานวันนี้", "stats": {"commits": 2, "ratio": 0.5}, "tasks": [None, True]}
+
+    def test_dumps_compact_matches_stdlib(self, backend):
+        """Test compact output matches json.dumps with compact separators."""
+        expected = json.dumps(self.SAMPLE, ensure_ascii=False, separators=(',', ':'))
+        assert json_utils.dumps(self.SAMPLE) == expected
+
+    def test_dumps_indent_matches_stdlib(self, backend):
+        """Test indented output matches json.dumps(indent=2)."""
+        expected = json.dumps(self.SAMPLE, indent=2, ensure_ascii=False)
+        assert json_utils.dumps(self.SAMPLE, indent=True) == expected
+
+    def test_dumps_bytes_is_utf8(self, backend):
+        """Test dumps_bytes returns UTF-8 encoded JSON."""
+        data = json_utils.dumps_bytes(self.SAMPLE)
+        assert isinstance(data, bytes)
+        assert json.loads(data.decode("utf-8")) == self.SAMPLE
+
+    @pytest.mark.parametrize("indent", [False, True])
+    def test_dump_to_file_matches_dumps_bytes(self, backend, indent):
+        """Test streaming into a binary file gives the same bytes as dumps_bytes."""
+        buf = io.BytesIO()
+        json_utils.dump(self.SAMPLE, buf, indent=indent)
+        assert buf.getvalue() == json_utils.dumps_bytes(self.SAMPLE, indent=indent)
+
+    def test_loads_round_trip(self, backend):
+        """Test loads accepts both str and bytes."""
+        text = json_utils.dumps(self.SAMPLE)
+        assert json_utils.loads(text) == self.SAMPLE
+        assert json_utils.loads(text.encode("utf-8")) == self.SAMPLE
+
+    def test_loads_invalid_raises_value_error(self, backend):
+        """Test invalid JSON raises ValueError."""
+        with pytest.raises(ValueError):
+            json_utils.loads("{not json")
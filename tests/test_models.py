@@ -1,4 +1,5 @@
 """Tests for data models."""
+import sys
 import pytest
 from datetime import datetime, date
 from talkbut.models.commit import Commit
@@ -60,6 +61,15 @@ class TestCommit:
         assert "file_diffs" in data
         assert data["file_diffs"]["file.py"] == "+line1\n-line2"
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_commit_uses_slots(self, sample_commit):
+        """Test commits are slotted and reject unknown attributes."""
+        assert not hasattr(sample_commit, "__dict__")
+        sample_commit.repo_name = "talkbut"
+        assert sample_commit.repo_name == "talkbut"
+        with pytest.raises(AttributeError):
+            sample_commit.unknown_field = 1
+
 
 class TestDailyReport:
     """Tests for DailyReport model."""
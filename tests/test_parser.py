@@ -104,3 +104,22 @@ class TestDataParser:
         assert "JIRA-999" in enriched.ticket_refs
         assert "#123" in enriched.ticket_refs
         assert "BETA" in enriched.tags
+
+    def test_enrich_commits_matches_enrich_commit(self, parser):
+        """Test batch enrichment gives the same metadata as per-commit enrichment."""
+        messages = [
+            "feat: add feature [BETA]\n\nRef JIRA-999 and #123",
+            "[FIX] [FIX] PROJ-1 PROJ-1 repeated\n[NOT_SUBJECT]",
+            "plain message",
+        ]
+        singles = [
+            parser.enrich_commit(Commit("h", "a", "e", datetime.now(), m)) for m in messages
+        ]
+        batch = parser.enrich_commits(
+            [Commit("h", "a", "e", datetime.now(), m) for m in messages]
+        )
+        
+        for single, batched in zip(singles, batch):
+            assert sorted(batched.ticket_refs) == sorted(single.ticket_refs)
+            assert sorted(batched.tags) == sorted(single.tags)
+        assert batch[1].tags == ["FIX"]
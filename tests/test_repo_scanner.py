@@ -0,0 +1,162 @@
+"""Tests for RepoScanner."""
+import os
+from unittest.mock import patch
+
+import pytest
+from talkbut.collectors.repo_scanner import RepoScanner
+
+
+def _make_repo(path):
+    """Create a directory that looks like a git repository."""
+    path.mkdir(parents=True)
+    (path / ".git").mkdir()
+    return path
+
+
+class TestRepoScanner:
+    """Tests for RepoScanner."""
+
+    @pytest.fixture
+    def scanner(self):
+        """Create a RepoScanner instance."""
+        return RepoScanner(max_depth=3)
+
+    def test_scan_finds_nested_repos(self, scanner, tmp_path):
+        """Test that repos at different depths are discovered."""
+        _make_repo(tmp_path / "alpha")
+        _make_repo(tmp_path / "group" / "beta")
+
+        repos = scanner.scan(str(tmp_path))
+        names = sorted(r["name"] for r in repos)
+
+        assert names == ["alpha", "beta"]
+
+    def test_scan_base_is_repo(self, scanner, tmp_path):
+        """Test that a base path which is itself a repo is returned."""
+        repo = _make_repo(tmp_path / "solo")
+
+        repos = scanner.scan(str(repo))
+
+        assert repos == [{"path": str(repo), "name": "solo"}]
+
+    def test_scan_detects_worktree_git_file(self, scanner, tmp_path):
+        """Test that a .git file (worktree/submodule) marks a repository."""
+        worktree = tmp_path / "worktree"
+        worktree.mkdir()
+        (worktree / ".git").write_text("gitdir: /elsewhere/.git/worktrees/wt\n")
+
+        repos = scanner.scan(str(tmp_path))
+
+        assert [r["name"] for r in repos] == ["worktree"]
+
+    def test_scan_does_not_descend_into_repo(self, scanner, tmp_path):
+        """Test that nested repos inside a repo are not reported."""
+        outer = _make_repo(tmp_path / "outer")
+        _make_repo(outer / "inner")
+
+        repos = scanner.scan(str(tmp_path))
+
+        assert [r["name"] for r in repos] == ["outer"]
+
+    def test_scan_skips_hidden_and_excluded_dirs(self, scanner, tmp_path):
+        """Test that hidden and excluded directories are not scanned."""
+        _make_repo(tmp_path / ".hidden" / "repo1")
+        _make_repo(tmp_path / "node_modules" / "repo2")
+        _make_repo(tmp_path / "visible")
+
+        repos = scanner.scan(str(tmp_path))
+
+        assert [r["name"] for r in repos] == ["visible"]
+
+    def test_scan_respects_max_depth(self, tmp_path):
+        """Test that repos deeper than max_depth are ignored."""
+        _make_repo(tmp_path / "a" / "b" / "deep")
+
+        assert RepoScanner(max_depth=2).scan(str(tmp_path)) == []
+        assert len(RepoScanner(max_depth=3).scan(str(tmp_path))) == 1
+
+    def test_scan_missing_path(self, scanner, tmp_path):
+        """Test scanning a path that does not exist."""
+        assert scanner.scan(str(tmp_path / "missing")) == []
+
+    def test_scan_multiple_deduplicates(self, scanner, tmp_path):
+        """Test that overlapping base paths do not produce duplicates."""
+        _make_repo(tmp_path / "group" / "repo")
+
+        repos = scanner.scan_multiple([str(tmp_path), str(tmp_path / "group")])
+
+        assert len(repos) == 1
+        assert repos[0]["name"] == "repo"
+
+
+class TestRepoScannerCache:
+    """Tests for the persistent scan cache."""
+
+    def test_cache_reused_when_tree_unchanged(self, tmp_path):
+        """Test that a second scan is served from the cache file."""
+        root = tmp_path / "src"
+        _make_repo(root / "alpha")
+        cache_file = tmp_path / "cache.json"
+
+        first = RepoScanner(max_depth=2, cache_file=str(cache_file)).scan(str(root))
+        assert cache_file.exists()
+
+        scanner = RepoScanner(max_depth=2, cache_file=str(cache_file))
+        with patch.object(scanner, "_scan_tree") as mock_walk:
+            second = scanner.scan(str(root))
+
+        mock_walk.assert_not_called()
+        assert second == first
+
+    def test_cache_invalidated_by_new_repo(self, tmp_path):
+        """Test that adding a repository next to a known one triggers a rescan."""
+        root = tmp_path / "src"
+        _make_repo(root / "group" / "alpha")
+        cache_file = str(tmp_path / "cache.json")
+
+        RepoScanner(max_depth=3, cache_file=cache_file).scan(str(root))
+        _make_repo(root / "group" / "beta")
+        # Make sure the parent's mtime differs even on coarse-grained filesystems
+        group = root / "group"
+        stat = os.stat(group)
+        os.utime(group, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        repos = RepoScanner(max_depth=3, cache_file=cache_file).scan(str(root))
+
+        assert sorted(r["name"] for r in repos) == ["alpha", "beta"]
+
+    def test_cache_invalidated_by_repo_in_repo_free_subdir(self, tmp_path):
+        """Test that a repo cloned under a directory that held no repos is found."""
+        root = tmp_path / "src"
+        _make_repo(root / "work" / "alpha")
+        personal = root / "personal"
+        personal.mkdir()
+        cache_file = str(tmp_path / "cache.json")
+
+        RepoScanner(max_depth=3, cache_file=cache_file).scan(str(root))
+        _make_repo(personal / "newproj")
+        stat = os.stat(personal)
+        os.utime(personal, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        repos = RepoScanner(max_depth=3, cache_file=cache_file).scan(str(root))
+
+        assert sorted(r["name"] for r in repos) == ["alpha", "newproj"]
+
+    def test_cache_keyed_by_depth(self, tmp_path):
+        """Test that a cached result for one depth is not reused for another."""
+        root = tmp_path / "src"
+        _make_repo(root / "a" / "b" / "deep")
+        cache_file = str(tmp_path / "cache.json")
+
+        assert RepoScanner(max_depth=2, cache_file=cache_file).scan(str(root)) == []
+        assert len(RepoScanner(max_depth=3, cache_file=cache_file).scan(str(root))) == 1
+
+    def test_corrupt_cache_is_ignored(self, tmp_path):
+        """Test that an unreadable cache file falls back to a normal scan."""
+        _make_repo(tmp_path / "src" / "alpha")
+        cache_file = tmp_path / "cache.json"
+        cache_file.write_text("{not json")
+
+        repos = RepoScanner(cache_file=str(cache_file)).scan(str(tmp_path / "src"))
+
+        assert [r["name"] for r in repos] == ["alpha"]
@@ -0,0 +1,19 @@
+"""Tests for report command helpers."""
+from talkbut.cli.report import _safe_name
+
+
+class TestSafeName:
+    """Tests for building report file names from user input."""
+
+    def test_spaces_become_underscores(self):
+        """Test a relative period keeps its words."""
+        assert _safe_name("2 weeks ago") == "2_weeks_ago"
+
+    def test_path_characters_dropped(self):
+        """Test separators and punctuation cannot leak into the path."""
+        assert _safe_name("../2024/01/01") == "20240101"
+        assert _safe_name("1 month-ago_x") == "1_month-ago_x"
+
+    def test_non_ascii_letters_kept(self):
+        """Test Thai letters survive while non-ASCII symbols are dropped."""
+        assert _safe_name("สัปดาห์ ที่แล้ว…") == "สัปดาห์_ที่แล้ว"
@@ -0,0 +1,92 @@
+"""Tests for SchedulerManager."""
+import shlex
+from unittest.mock import patch
+
+import pytest
+
+from talkbut.scheduling.platform_detector import SchedulerType
+from talkbut.scheduling.scheduler_manager import SchedulerManager, _validate_time_format
+
+RUNNER = "talkbut.scheduling.automated_runner"
+
+
+def _manager(platform_type):
+    """Create a SchedulerManager for the given platform."""
+    with patch("talkbut.scheduling.scheduler_manager.detect_platform", return_value=platform_type):
+        return SchedulerManager()
+
+
+class TestBuildCommand:
+    """Tests for SchedulerManager._build_command."""
+
+    @patch("talkbut.scheduling.scheduler_manager.sys.executable", "/opt/my python/bin/python3")
+    def test_cron_command_quotes_paths_with_spaces(self):
+        """Test cron commands split back into the intended arguments."""
+        command = _manager(SchedulerType.CRON)._build_command("/home/me/My Config/config.yaml")
+
+        assert shlex.split(command) == [
+            "/opt/my python/bin/python3", "-m", RUNNER, "/home/me/My Config/config.yaml"
+        ]
+
+    @patch("talkbut.scheduling.scheduler_manager.sys.executable", r"C:\Program Files\Python\python.exe")
+    def test_task_scheduler_command_uses_windows_quoting(self):
+        """Test Task Scheduler commands use double quotes, not POSIX quoting."""
+        command = _manager(SchedulerType.TASK_SCHEDULER)._build_command(r"C:\My Config\config.yaml")
+
+        assert command == (
+            rf'"C:\Program Files\Python\python.exe" -m {RUNNER} "C:\My Config\config.yaml"'
+        )
+
+    @pytest.mark.parametrize("config_path", [None, ""])
+    @patch("talkbut.scheduling.scheduler_manager.sys.executable", "/usr/bin/python3")
+    def test_command_without_config_path(self, config_path):
+        """Test the base command is returned when no config path is given."""
+        command = _manager(SchedulerType.CRON)._build_command(config_path)
+
+        assert command == f"/usr/bin/python3 -m {RUNNER}"
+
+
+class TestTaskSchedulerDispatch:
+    """Tests for driving TaskScheduler through the common Scheduler methods."""
+
+    @pytest.fixture
+    def manager(self):
+        """Create a SchedulerManager for Windows."""
+        return _manager(SchedulerType.TASK_SCHEDULER)
+
+    def test_enable_creates_task(self, manager):
+        """Test enable reaches TaskScheduler.create_task."""
+        with patch.object(manager.scheduler, "create_task", return_value=True) as mock_create:
+            assert manager.enable("08:00")
+
+        mock_create.assert_called_once_with("08:00", manager._build_command())
+
+    def test_disable_and_is_enabled_use_task_methods(self, manager):
+        """Test disable and is_enabled map onto remove_task and task_exists."""
+        with patch.object(manager.scheduler, "remove_task", return_value=True) as mock_remove, \
+                patch.object(manager.scheduler, "task_exists", return_value=False) as mock_exists:
+            assert manager.disable()
+            assert not manager.is_enabled()
+
+        mock_remove.assert_called_once_with()
+        mock_exists.assert_called_once_with()
+
+
+class TestValidateTimeFormat:
+    """Tests for _validate_time_format."""
+
+    @pytest.mark.parametrize("time, valid", [
+        ("00:00", True),
+        ("23:59", True),
+        ("8:05", True),
+        ("24:00", False),
+        ("12:60", False),
+        ("12", False),
+        ("12:30:00", False),
+        ("ab:cd", False),
+        (None, False),
+    ])
+    def test_validate_time_format(self, time, valid):
+        """Test HH:MM validation, including repeated (cached) lookups."""
+        assert _validate_time_format(time) is valid
+        assert _validate_time_format(time) is valid
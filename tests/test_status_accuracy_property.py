@@ -73,6 +73,12 @@ class MockScheduler:
     def get_next_run(self):
         """Mock get_next_run - queries actual state."""
         return self.next_run_time
+    
+    def describe(self):
+        """Mock describe - queries actual state."""
+        next_run = self.get_next_run()
+        schedule_time = f"{next_run.hour:02d}:{next_run.minute:02d}" if next_run else None
+        return self.job_exists(), next_run, schedule_time
 
 
 class TestStatusAccuracyProperty:
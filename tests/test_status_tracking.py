@@ -4,6 +4,7 @@ import json
 import tempfile
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -88,6 +89,79 @@ class TestStatusManager:
             
             errors = manager.get_recent_errors()
             assert len(errors) == 0
+    
+    def test_history_trimmed_to_smaller_max_errors(self):
+        """Test a history longer than max_errors keeps only the newest entries."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            status_file = Path(tmpdir) / "status.json"
+            manager = StatusManager(status_file, max_errors=10)
+            for i in range(10):
+                manager.record_run(success=False, error=f"Error {i}")
+            
+            smaller = StatusManager(status_file, max_errors=3)
+            smaller.record_run(success=False, error="Error 10")
+            
+            with open(status_file, 'r') as f:
+                messages = [e["error_message"] for e in json.load(f)["errors"]]
+            assert messages == ["Error 8", "Error 9", "Error 10"]
+    
+    def test_recent_errors_skip_malformed_records(self):
+        """Test malformed records don't count towards the limit."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            status_file = Path(tmpdir) / "status.json"
+            StatusManager(status_file)
+            good = [
+                {"timestamp": f"2025-12-0{i}T09:00:00", "error_message": f"Error {i}"}
+                for i in range(1, 4)
+            ]
+            bad = {"timestamp": "not a date", "error_message": "Broken"}
+            status_file.write_text(json.dumps({"last_run": None, "errors": good + [bad]}))
+            
+            errors = StatusManager(status_file).get_recent_errors(limit=2)
+            
+            assert [e.error_message for e in errors] == ["Error 3", "Error 2"]
+    
+    def test_status_not_reparsed_while_unchanged(self):
+        """Test repeated queries reuse the parsed status instead of re-reading JSON."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            status_file = Path(tmpdir) / "status.json"
+            manager = StatusManager(status_file)
+            manager.record_run(success=False, error="Error 1")
+            
+            with patch(f"{StatusManager.__module__}.loads") as mock_load:
+                manager.get_last_run()
+                manager.get_recent_errors()
+                manager.record_run(success=True)
+                manager.get_last_run()
+            
+            mock_load.assert_not_called()
+    
+    def test_status_reread_after_external_write(self):
+        """Test a status file rewritten by another process is picked up."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            status_file = Path(tmpdir) / "status.json"
+            manager = StatusManager(status_file)
+            assert manager.get_last_run() is None
+            
+            other = StatusManager(status_file)
+            other.record_run(success=True)
+            
+            assert manager.get_last_run() is not None
+    
+    def test_failed_write_keeps_previous_status(self):
+        """Test an interrupted write leaves the old status file intact."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            status_file = Path(tmpdir) / "status.json"
+            manager = StatusManager(status_file)
+            manager.record_run(success=False, error="Error 1")
+            
+            with patch(f"{StatusManager.__module__}.dump", side_effect=OSError("disk full")):
+                with pytest.raises(OSError):
+                    manager.record_run(success=False, error="Error 2")
+            
+            errors = StatusManager(status_file).get_recent_errors()
+            assert [e.error_message for e in errors] == ["Error 1"]
+            assert [p.name for p in Path(tmpdir).iterdir()] == ["status.json"]
 
 
 class TestErrorLogger:
@@ -144,6 +218,21 @@ class TestErrorLogger:
 class TestStatusDisplay:
     """Tests for status display functionality."""
     
+    def test_format_status_display_reads_history_once(self):
+        """Test the history is not fetched both by get_status and the display."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            status_file = Path(tmpdir) / "status.json"
+            status_manager = StatusManager(status_file)
+            status_manager.record_run(success=False, error="Test error")
+            scheduler_manager = SchedulerManager(status_manager=status_manager)
+            
+            with patch.object(status_manager, "get_recent_errors",
+                              wraps=status_manager.get_recent_errors) as mock_errors:
+                status_text = format_status_display(scheduler_manager, status_manager)
+            
+            mock_errors.assert_called_once_with(limit=5)
+            assert "Test error" in status_text
+    
     def test_format_status_display_basic(self):
         """Test basic status display formatting."""
         with tempfile.TemporaryDirectory() as tmpdir:
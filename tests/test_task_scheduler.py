@@ -0,0 +1,144 @@
+"""Tests for TaskScheduler."""
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from talkbut.scheduling.task_scheduler import TaskScheduler, _match_next_run
+
+
+class TestNextRunParsing:
+    """Tests for reading the next run time from schtasks output."""
+
+    @pytest.mark.parametrize("time_str, expected", [
+        ("12/4/2025 6:00:00 PM", datetime(2025, 12, 4, 18, 0, 0)),
+        ("12/4/2025 12:15:00 AM", datetime(2025, 12, 4, 0, 15, 0)),
+        ("12/4/2025 12:15:00 PM", datetime(2025, 12, 4, 12, 15, 0)),
+        ("04/12/2025 18:00:00", datetime(2025, 12, 4, 18, 0, 0)),
+        ("2025-12-04 18:00:00", datetime(2025, 12, 4, 18, 0, 0)),
+    ])
+    def test_match_next_run(self, time_str, expected):
+        """Test each supported format gives the same result as strptime did."""
+        assert _match_next_run(time_str) == expected
+
+    @pytest.mark.parametrize("time_str", ["N/A", "13/13/2025 6:00:00 PM", "2025-12-04 13:00:00 PM"])
+    def test_match_next_run_rejects(self, time_str):
+        """Test unknown formats and impossible dates don't match."""
+        assert _match_next_run(time_str) is None
+
+    def test_parse_next_run_from_output(self):
+        """Test the next run line is found in verbose query output."""
+        output = (
+            "Folder: \\\n"
+            "TaskName:                             \\TalkButDailyLog\n"
+            "Next Run Time:                        12/4/2025 6:00:00 PM\n"
+            "Status:                               Ready\n"
+        )
+
+        assert TaskScheduler()._parse_next_run(output) == datetime(2025, 12, 4, 18, 0, 0)
+
+    @pytest.mark.parametrize("time_str, expected", [
+        ("2025-12-4 18:00:00", datetime(2025, 12, 4, 18, 0, 0)),
+        ("12/4/2025 06:00:00 pm", datetime(2025, 12, 4, 18, 0, 0)),
+        ("4/12/2025 18:00:00", datetime(2025, 12, 4, 18, 0, 0)),
+    ])
+    def test_strptime_fallback(self, time_str, expected):
+        """Test values the regex does not cover still parse with the matching format."""
+        output = f"Next Run Time: {time_str}\n"
+
+        assert TaskScheduler()._parse_next_run(output) == expected
+
+    def test_start_time_fallback(self):
+        """Test the schedule's start time is used when no next run is shown."""
+        output = (
+            "TaskName:       \\TalkButDailyLog\r\n"
+            "Next Run Time:  N/A\r\n"
+            "Start Time:     18:30:00\r\n"
+        )
+
+        next_run = TaskScheduler()._parse_next_run(output)
+
+        assert (next_run.hour, next_run.minute) == (18, 30)
+        assert next_run > datetime.now()
+
+class TestTaskQueryCache:
+    """Tests for sharing one schtasks query between calls."""
+
+    OUTPUT = "TaskName: \\TalkButDailyLog\nNext Run Time: 2025-12-04 18:00:00\n"
+
+    @patch("talkbut.scheduling.task_scheduler.subprocess.run")
+    def test_exists_then_next_run_share_one_query(self, mock_run):
+        """Test task_exists followed by get_next_run spawns schtasks once."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=self.OUTPUT)
+        scheduler = TaskScheduler()
+
+        assert scheduler.task_exists()
+        assert scheduler.get_next_run() == datetime(2025, 12, 4, 18, 0, 0)
+
+        mock_run.assert_called_once()
+        assert "/V" in mock_run.call_args.args[0]
+
+    @patch("talkbut.scheduling.task_scheduler.subprocess.run")
+    def test_remove_task_invalidates_cache(self, mock_run):
+        """Test the task is queried again after it was removed."""
+        mock_run.side_effect = [
+            MagicMock(returncode=0, stdout=self.OUTPUT),
+            MagicMock(returncode=0, stderr=""),
+            MagicMock(returncode=1, stdout=""),
+        ]
+        scheduler = TaskScheduler()
+
+        assert scheduler.task_exists()
+        assert scheduler.remove_task()
+        assert not scheduler.task_exists()
+
+
+class ComError(Exception):
+    """Stand-in for pywintypes.com_error."""
+
+
+class TestComLookup:
+    """Tests for querying the task through the Task Scheduler COM API."""
+
+    @pytest.fixture
+    def com(self):
+        """Install fake pywin32 modules and return the root task folder."""
+        win32com = MagicMock()
+        folder = win32com.client.Dispatch.return_value.GetFolder.return_value
+        with patch("talkbut.scheduling.task_scheduler.win32com", win32com), \
+                patch("talkbut.scheduling.task_scheduler.pywintypes", MagicMock(com_error=ComError)):
+            yield folder
+
+    @patch("talkbut.scheduling.task_scheduler.subprocess.run")
+    def test_next_run_without_subprocess(self, mock_run, com):
+        """Test existence and next run come from COM, not schtasks."""
+        com.GetTask.return_value.NextRunTime = datetime(2025, 12, 4, 18, 0, 0, 123)
+
+        assert TaskScheduler().describe() == (True, datetime(2025, 12, 4, 18, 0, 0), "18:00")
+        mock_run.assert_not_called()
+
+    @patch("talkbut.scheduling.task_scheduler.subprocess.run")
+    def test_missing_task(self, mock_run, com):
+        """Test GetTask failing means the task does not exist."""
+        com.GetTask.side_effect = ComError("not found")
+
+        assert not TaskScheduler().task_exists()
+        mock_run.assert_not_called()
+
+    def test_no_next_run(self, com):
+        """Test the zero COM date is reported as no next run."""
+        com.GetTask.return_value.NextRunTime = datetime(1899, 12, 30)
+
+        assert TaskScheduler().describe() == (True, None, None)
+
+    @patch("talkbut.scheduling.task_scheduler.subprocess.run")
+    @patch("talkbut.scheduling.task_scheduler.win32com")
+    def test_falls_back_to_schtasks(self, mock_win32com, mock_run):
+        """Test schtasks is used when the service cannot be reached."""
+        mock_win32com.client.Dispatch.side_effect = ComError("unavailable")
+        mock_run.return_value = MagicMock(returncode=1, stdout="")
+
+        with patch("talkbut.scheduling.task_scheduler.pywintypes", MagicMock(com_error=ComError)):
+            assert not TaskScheduler().task_exists()
+
+        mock_run.assert_called_once()